@@ -1435,16 +1435,15 @@ async def generate_report(
 
             # Get EVM data
             evm_service = EarnedValueService()
-            evm_metrics = await evm_service.calculate_project_evm(
+            evm_metrics = await evm_service.calculate_project_evm_from_db(
                 project_id=report_request.project_id,
-                tasks=[],  # Would need to get tasks
+                db_session=db,
                 project_budget=project.budget or Decimal('0'),
                 project_start_date=project.start_date or date.today(),
-                project_end_date=project.end_date or date.today(),
-                db_session=db
+                project_end_date=project.end_date or date.today()
             )
 
-            evm_analysis = await evm_service.analyze_evm_performance(evm_metrics)
+            evm_analysis = evm_service.analyze_evm_performance_sync(evm_metrics)
 
             # Get tasks for detailed EVM
             tasks_query = select(Task).where(Task.project_id == report_request.project_id)
@@ -1486,13 +1485,12 @@ async def generate_report(
             evm_metrics = None
             try:
                 evm_service = EarnedValueService()
-                evm_metrics = await evm_service.calculate_project_evm(
+                evm_metrics = evm_service.calculate_project_evm_sync(
                     project_id=report_request.project_id,
                     tasks=tasks,
                     project_budget=project.budget or Decimal('0'),
                     project_start_date=project.start_date or date.today(),
-                    project_end_date=project.end_date or date.today(),
-                    db_session=db
+                    project_end_date=project.end_date or date.today()
                 )
             except Exception:
                 # EVM calculation might fail, continue without it
@@ -1561,20 +1559,14 @@ async def get_evm_metrics(
     if not member_check.scalar_one_or_none():
         raise HTTPException(status_code=403, detail="Not authorized to access this project")
 
-    # Get project tasks
-    tasks_query = select(Task).where(Task.project_id == project_id)
-    tasks_result = await db.execute(tasks_query)
-    tasks = tasks_result.scalars().all()
-
-    # Calculate EVM metrics
+    # Calculate EVM metrics from task aggregates
     evm_service = EarnedValueService()
-    evm_metrics = await evm_service.calculate_project_evm(
+    evm_metrics = await evm_service.calculate_project_evm_from_db(
         project_id=project_id,
-        tasks=tasks,
+        db_session=db,
         project_budget=project.budget or Decimal('0'),
         project_start_date=project.start_date or date.today(),
-        project_end_date=project.end_date or date.today(),
-        db_session=db
+        project_end_date=project.end_date or date.today()
     )
 
     return evm_metrics
@@ -1617,7 +1609,7 @@ async def get_evm_analysis(
 
     # Analyze performance
     evm_service = EarnedValueService()
-    analysis = await evm_service.analyze_evm_performance(evm_metrics)
+    analysis = evm_service.analyze_evm_performance_sync(evm_metrics)
 
     return analysis
 
@@ -1667,7 +1659,9 @@ async def get_evm_prediction(
 
     # Generate predictions
     evm_service = EarnedValueService()
-    prediction = await evm_service.predict_project_outcomes(evm_metrics, historical_data)
+    prediction = evm_service.predict_project_outcomes_sync(
+        evm_metrics, historical_data, project_start_date=project.start_date
+    )
 
     return prediction
 
@@ -1874,13 +1868,11 @@ async def export_tasks(
     if not member_check.scalar_one_or_none():
         raise HTTPException(status_code=403, detail="Not authorized to access this project")
 
-    # Get tasks
-    tasks_query = select(Task).where(Task.project_id == project_id)
-    tasks_result = await db.execute(tasks_query)
-    tasks = tasks_result.scalars().all()
-
     export_service = ImportExportService()
 
+    # Get tasks
+    tasks = await export_service.fetch_task_rows(db, project_id)
+
     try:
         if export_request.format == "json":
             result = await export_service.export_tasks_json(tasks, project, export_request, db)
@@ -1903,6 +1895,7 @@ async def export_tasks(
 @router.post("/projects/{project_id}/dependencies/validate", response_model=DependencyValidationResult)
 async def validate_project_dependencies(
     project_id: UUID,
+    fast: bool = Query(False, description="Stop at the first error and skip warning-only checks"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -1933,7 +1926,7 @@ async def validate_project_dependencies(
         raise HTTPException(status_code=403, detail="Not authorized to access this project")
 
     validation_service = DependencyValidationService()
-    result = await validation_service.validate_project_dependencies(project_id, db)
+    result = await validation_service.validate_project_dependencies(project_id, db, fast=fast)
 
     return result
 
@@ -1992,10 +1985,11 @@ async def get_dependency_graph(
     tasks_result = await db.execute(tasks_query)
     tasks = tasks_result.scalars().all()
 
+    task_ids = [task.id for task in tasks]
     dependencies_query = select(TaskDependency).where(
         or_(
-            TaskDependency.predecessor.has(project_id=project_id),
-            TaskDependency.successor.has(project_id=project_id)
+            TaskDependency.predecessor_id.in_(task_ids),
+            TaskDependency.successor_id.in_(task_ids)
         )
     )
     dependencies_result = await db.execute(dependencies_query)
@@ -511,6 +511,7 @@ class ImportExportRequest(BaseModel):
     include_dependencies: bool = Field(True, description="Include dependencies in export")
     date_format: str = Field("YYYY-MM-DD", description="Date format for export")
     include_metadata: bool = Field(True, description="Include metadata fields")
+    compress: bool = Field(False, description="Gzip-compress the exported file (CSV only)")
 
 
 class ImportResult(BaseModel):
@@ -3,17 +3,110 @@ Dependency Validation Service for WhatsApp PM System v3.0 (Gamma)
 Automated validation of task dependencies and circular reference detection
 """
 
+import asyncio
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
 from uuid import UUID
 import structlog
-from collections import defaultdict, deque
+from array import array
+from collections import Counter, OrderedDict, deque
+from itertools import groupby
+from operator import itemgetter
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import aliased, joinedload
+
+# Optional Numba import for compiled graph kernels
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = None
+    NUMBA_AVAILABLE = False
 
 from ..models.sqlalchemy.task import Task, TaskDependency
 from ..schemas.task import DependencyValidationResult, DependencyGraph
 
 logger = structlog.get_logger(__name__)
 
+# Bounded LRU of project validation results keyed by (project_id, data version)
+VALIDATION_CACHE_MAX_ENTRIES = 256
+# Above this many dependencies the date-consistency check runs as a SQL join
+SQL_DATE_CHECK_THRESHOLD = 500
+
+# Suggested fix builders keyed by invalid dependency issue
+_INVALID_DEPENDENCY_FIXES = {
+    "predecessor_task_not_found": lambda dep: {
+        "issue_type": "missing_predecessor",
+        "description": f"Predecessor task {dep['predecessor_id']} not found",
+        "suggested_action": "Remove dependency or create missing task",
+        "affected_tasks": [dep['successor_id']]
+    },
+    "successor_task_not_found": lambda dep: {
+        "issue_type": "missing_successor",
+        "description": f"Successor task {dep['successor_id']} not found",
+        "suggested_action": "Remove dependency or create missing task",
+        "affected_tasks": [dep['predecessor_id']]
+    },
+    "self_dependency": lambda dep: {
+        "issue_type": "self_dependency",
+        "description": "Task cannot depend on itself",
+        "suggested_action": "Remove self-dependency",
+        "affected_tasks": [dep['predecessor_id']]
+    },
+}
+_validation_cache: "OrderedDict[Tuple[str, bool, Tuple[Any, ...]], DependencyValidationResult]" = OrderedDict()
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _kahn_topological_order(indptr, indices):
+        """Compiled Kahn's algorithm over CSR arrays; a short result means a cycle."""
+        node_count = indptr.shape[0] - 1
+        in_degree = np.zeros(node_count, dtype=np.int32)
+        for pos in range(indices.shape[0]):
+            in_degree[indices[pos]] += 1
+
+        # The order array doubles as the FIFO queue
+        order = np.empty(node_count, dtype=np.int32)
+        head = 0
+        tail = 0
+        for node in range(node_count):
+            if in_degree[node] == 0:
+                order[tail] = node
+                tail += 1
+
+        while head < tail:
+            node = order[head]
+            head += 1
+            for pos in range(indptr[node], indptr[node + 1]):
+                successor = indices[pos]
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    order[tail] = successor
+                    tail += 1
+
+        return order[:tail]
+
+    @njit(cache=True)
+    def _longest_path_dp(indptr, indices, order):
+        """Compiled longest-path DP in reverse topological order."""
+        node_count = indptr.shape[0] - 1
+        path_length = np.zeros(node_count, dtype=np.int32)
+        next_hop = np.full(node_count, -1, dtype=np.int32)
+        for k in range(order.shape[0] - 1, -1, -1):
+            node = order[k]
+            best_length = 0
+            for pos in range(indptr[node], indptr[node + 1]):
+                successor = indices[pos]
+                if path_length[successor] > best_length:
+                    best_length = path_length[successor]
+                    next_hop[node] = successor
+            path_length[node] = best_length + 1
+
+        return path_length, next_hop
+
 
 class DependencyValidationService:
     """Service for validating task dependencies and detecting issues."""
@@ -24,106 +117,35 @@ class DependencyValidationService:
     async def validate_project_dependencies(
         self,
         project_id: UUID,
-        db_session=None
+        db_session=None,
+        fast: bool = False
     ) -> DependencyValidationResult:
         """
         Validate all dependencies in a project.
 
         Args:
             project_id: Project identifier
+            fast: Stop at the first error (cycle, orphan or self-dependency)
+                and skip warning-only checks
 
         Returns:
             Validation results
         """
         try:
-            # Get all tasks and dependencies for the project
-            tasks_query = db_session.query(Task).filter(Task.project_id == project_id)
-            tasks = tasks_query.all()
-
-            dependencies_query = db_session.query(TaskDependency).filter(
-                TaskDependency.predecessor.has(project_id=project_id) |
-                TaskDependency.successor.has(project_id=project_id)
-            )
-            dependencies = dependencies_query.all()
+            # Results are reused until any task or dependency in the project changes
+            cache_key = (str(project_id), fast, self._get_project_version(project_id, db_session))
+            cached_result = _validation_cache.get(cache_key)
+            if cached_result is not None:
+                _validation_cache.move_to_end(cache_key)
+                return cached_result.model_copy(deep=True)
 
-            # Build dependency graph
-            graph = self._build_dependency_graph(tasks, dependencies)
+            result = await self._run_project_validation(project_id, db_session, fast)
 
-            # Validate dependencies
-            is_valid = True
-            errors = []
-            warnings = []
-            circular_references = []
-            orphaned_tasks = []
-            invalid_dependencies = []
+            _validation_cache[cache_key] = result.model_copy(deep=True)
+            if len(_validation_cache) > VALIDATION_CACHE_MAX_ENTRIES:
+                _validation_cache.popitem(last=False)
 
-            # Check for circular references
-            cycles = self._detect_cycles(graph)
-            if cycles:
-                is_valid = False
-                circular_references = cycles
-                for cycle in cycles:
-                    errors.append(f"Circular dependency detected: {' -> '.join(cycle)}")
-
-            # Check for orphaned dependencies
-            task_ids = {str(task.id) for task in tasks}
-            for dep in dependencies:
-                pred_id = str(dep.predecessor_id)
-                succ_id = str(dep.successor_id)
-
-                if pred_id not in task_ids:
-                    invalid_dependencies.append({
-                        "dependency_id": str(dep.id),
-                        "predecessor_id": pred_id,
-                        "successor_id": succ_id,
-                        "issue": "predecessor_task_not_found"
-                    })
-                    errors.append(f"Dependency references non-existent predecessor task: {pred_id}")
-                    is_valid = False
-
-                if succ_id not in task_ids:
-                    invalid_dependencies.append({
-                        "dependency_id": str(dep.id),
-                        "predecessor_id": pred_id,
-                        "successor_id": succ_id,
-                        "issue": "successor_task_not_found"
-                    })
-                    errors.append(f"Dependency references non-existent successor task: {succ_id}")
-                    is_valid = False
-
-            # Check for self-dependencies
-            for dep in dependencies:
-                if dep.predecessor_id == dep.successor_id:
-                    invalid_dependencies.append({
-                        "dependency_id": str(dep.id),
-                        "predecessor_id": str(dep.predecessor_id),
-                        "successor_id": str(dep.successor_id),
-                        "issue": "self_dependency"
-                    })
-                    errors.append(f"Task cannot depend on itself: {dep.predecessor_id}")
-                    is_valid = False
-
-            # Check for duplicate dependencies
-            dep_pairs = {}
-            for dep in dependencies:
-                pair = (str(dep.predecessor_id), str(dep.successor_id))
-                if pair in dep_pairs:
-                    warnings.append(f"Duplicate dependency found: {dep.predecessor_id} -> {dep.successor_id}")
-                else:
-                    dep_pairs[pair] = dep
-
-            # Check for logical issues
-            logical_issues = self._check_logical_issues(tasks, dependencies)
-            warnings.extend(logical_issues)
-
-            return DependencyValidationResult(
-                is_valid=is_valid,
-                errors=errors,
-                warnings=warnings,
-                circular_references=circular_references,
-                orphaned_tasks=orphaned_tasks,
-                invalid_dependencies=invalid_dependencies
-            )
+            return result
 
         except Exception as e:
             logger.error("Dependency validation failed", error=str(e), project_id=str(project_id))
@@ -136,6 +158,239 @@ class DependencyValidationService:
                 invalid_dependencies=[]
             )
 
+    def _get_project_version(self, project_id: UUID, db_session) -> Tuple[Any, ...]:
+        """Fingerprint a project's tasks and dependencies for result caching."""
+        task_updated_at, task_count = db_session.query(
+            func.max(Task.updated_at),
+            func.count(Task.id)
+        ).filter(Task.project_id == project_id).one()
+
+        project_task_ids = select(Task.id).where(Task.project_id == project_id)
+        dependency_updated_at, dependency_count = db_session.query(
+            func.max(TaskDependency.updated_at),
+            func.count(TaskDependency.id)
+        ).filter(
+            or_(
+                TaskDependency.predecessor_id.in_(project_task_ids),
+                TaskDependency.successor_id.in_(project_task_ids)
+            )
+        ).one()
+
+        # Counts catch hard deletes, which leave no updated_at behind
+        return (task_updated_at, task_count, dependency_updated_at, dependency_count)
+
+    async def _run_project_validation(
+        self,
+        project_id: UUID,
+        db_session,
+        fast: bool = False
+    ) -> DependencyValidationResult:
+        """Run every project-level dependency check against the database."""
+        # Get all tasks and dependency edges for the project
+        tasks_query = db_session.query(Task).filter(Task.project_id == project_id)
+        tasks = tasks_query.all()
+
+        # Scope by the task IDs already loaded rather than EXISTS subqueries
+        task_ids = [task.id for task in tasks]
+        project_scope = or_(
+            TaskDependency.predecessor_id.in_(task_ids),
+            TaskDependency.successor_id.in_(task_ids)
+        )
+        dependencies = db_session.query(
+            TaskDependency.predecessor_id,
+            TaskDependency.successor_id
+        ).filter(project_scope).all()
+
+        # Nothing to validate without dependencies
+        if not dependencies:
+            return DependencyValidationResult(
+                is_valid=True,
+                errors=[],
+                warnings=[],
+                circular_references=[],
+                orphaned_tasks=[],
+                invalid_dependencies=[]
+            )
+
+        # Large projects compare dates in the database instead of in Python
+        check_dates_in_sql = len(dependencies) > SQL_DATE_CHECK_THRESHOLD
+
+        # Cycle detection and logical checks are CPU-bound and independent;
+        # run them off the event loop. The SQL checks below share the session
+        # and stay sequential.
+        if fast:
+            cycles = await asyncio.to_thread(self._detect_cycles, tasks, dependencies, True)
+            logical_issues = []
+        else:
+            cycles, logical_issues = await asyncio.gather(
+                asyncio.to_thread(self._detect_cycles, tasks, dependencies),
+                asyncio.to_thread(self._check_logical_issues, tasks, dependencies, not check_dates_in_sql)
+            )
+
+        # Validate dependencies
+        is_valid = True
+        errors = []
+        warnings = []
+        circular_references = []
+        invalid_dependencies = []
+
+        # Check for circular references
+        if cycles:
+            is_valid = False
+            circular_references = cycles
+            for cycle in cycles:
+                errors.append(f"Circular dependency detected: {' -> '.join(cycle)}")
+
+        if fast and not is_valid:
+            return self._validation_result(is_valid, errors, warnings, circular_references, invalid_dependencies)
+
+        # Check for orphaned dependencies (endpoint not among the project's tasks)
+        predecessor_task = aliased(Task)
+        successor_task = aliased(Task)
+        orphaned_query = db_session.query(
+            TaskDependency.id,
+            TaskDependency.predecessor_id,
+            TaskDependency.successor_id,
+            predecessor_task.id.label("found_predecessor_id"),
+            successor_task.id.label("found_successor_id")
+        ).outerjoin(
+            predecessor_task,
+            and_(
+                predecessor_task.id == TaskDependency.predecessor_id,
+                predecessor_task.project_id == project_id
+            )
+        ).outerjoin(
+            successor_task,
+            and_(
+                successor_task.id == TaskDependency.successor_id,
+                successor_task.project_id == project_id
+            )
+        ).filter(
+            project_scope,
+            or_(predecessor_task.id.is_(None), successor_task.id.is_(None))
+        )
+        if fast:
+            orphaned_query = orphaned_query.limit(1)
+
+        for row in orphaned_query.all():
+            pred_id = str(row.predecessor_id)
+            succ_id = str(row.successor_id)
+
+            if row.found_predecessor_id is None:
+                invalid_dependencies.append({
+                    "dependency_id": str(row.id),
+                    "predecessor_id": pred_id,
+                    "successor_id": succ_id,
+                    "issue": "predecessor_task_not_found"
+                })
+                errors.append(f"Dependency references non-existent predecessor task: {pred_id}")
+                is_valid = False
+
+            if row.found_successor_id is None:
+                invalid_dependencies.append({
+                    "dependency_id": str(row.id),
+                    "predecessor_id": pred_id,
+                    "successor_id": succ_id,
+                    "issue": "successor_task_not_found"
+                })
+                errors.append(f"Dependency references non-existent successor task: {succ_id}")
+                is_valid = False
+
+        if fast and not is_valid:
+            return self._validation_result(is_valid, errors, warnings, circular_references, invalid_dependencies)
+
+        # Check for self-dependencies
+        self_dependency_query = db_session.query(
+            TaskDependency.id,
+            TaskDependency.predecessor_id,
+            TaskDependency.successor_id
+        ).filter(
+            project_scope,
+            TaskDependency.predecessor_id == TaskDependency.successor_id
+        )
+        if fast:
+            self_dependency_query = self_dependency_query.limit(1)
+
+        for row in self_dependency_query.all():
+            invalid_dependencies.append({
+                "dependency_id": str(row.id),
+                "predecessor_id": str(row.predecessor_id),
+                "successor_id": str(row.successor_id),
+                "issue": "self_dependency"
+            })
+            errors.append(f"Task cannot depend on itself: {row.predecessor_id}")
+            is_valid = False
+
+        # Duplicates and logical issues only produce warnings
+        if fast:
+            return self._validation_result(is_valid, errors, warnings, circular_references, invalid_dependencies)
+
+        # Check for duplicate dependencies
+        duplicate_rows = db_session.query(
+            TaskDependency.predecessor_id,
+            TaskDependency.successor_id
+        ).filter(project_scope).group_by(
+            TaskDependency.predecessor_id,
+            TaskDependency.successor_id
+        ).having(func.count(TaskDependency.id) > 1).all()
+
+        for row in duplicate_rows:
+            warnings.append(f"Duplicate dependency found: {row.predecessor_id} -> {row.successor_id}")
+
+        # Logical issues found alongside cycle detection
+        warnings.extend(logical_issues)
+        if check_dates_in_sql:
+            warnings.extend(self._query_date_inconsistencies(project_id, project_scope, db_session))
+
+        return self._validation_result(is_valid, errors, warnings, circular_references, invalid_dependencies)
+
+    def _query_date_inconsistencies(self, project_id: UUID, project_scope, db_session) -> List[str]:
+        """Find dependencies whose predecessor ends after the successor starts, in SQL."""
+        predecessor_task = aliased(Task)
+        successor_task = aliased(Task)
+        rows = db_session.query(
+            predecessor_task.name.label("predecessor_name"),
+            successor_task.name.label("successor_name")
+        ).select_from(TaskDependency).join(
+            predecessor_task,
+            and_(
+                predecessor_task.id == TaskDependency.predecessor_id,
+                predecessor_task.project_id == project_id
+            )
+        ).join(
+            successor_task,
+            and_(
+                successor_task.id == TaskDependency.successor_id,
+                successor_task.project_id == project_id
+            )
+        ).filter(
+            project_scope,
+            predecessor_task.planned_end_date > successor_task.planned_start_date
+        ).all()
+
+        return [
+            f"Date inconsistency: '{row.predecessor_name}' ends after '{row.successor_name}' starts"
+            for row in rows
+        ]
+
+    def _validation_result(
+        self,
+        is_valid: bool,
+        errors: List[str],
+        warnings: List[str],
+        circular_references: List[List[str]],
+        invalid_dependencies: List[Dict[str, Any]]
+    ) -> DependencyValidationResult:
+        """Assemble a project validation result."""
+        return DependencyValidationResult(
+            is_valid=is_valid,
+            errors=errors,
+            warnings=warnings,
+            circular_references=circular_references,
+            orphaned_tasks=[],
+            invalid_dependencies=invalid_dependencies
+        )
+
     async def validate_task_dependencies(
         self,
         task_id: UUID,
@@ -163,8 +418,11 @@ class DependencyValidationService:
                     invalid_dependencies=[]
                 )
 
-            # Get dependencies where this task is involved
-            dependencies = db_session.query(TaskDependency).filter(
+            # Get dependencies where this task is involved, with predecessors
+            # loaded in the same query for the date checks below
+            dependencies = db_session.query(TaskDependency).options(
+                joinedload(TaskDependency.predecessor)
+            ).filter(
                 (TaskDependency.predecessor_id == task_id) |
                 (TaskDependency.successor_id == task_id)
             ).all()
@@ -215,22 +473,16 @@ class DependencyValidationService:
     ) -> DependencyGraph:
         """Build dependency graph from tasks and dependencies."""
         nodes = [str(task.id) for task in tasks]
-        edges = []
+        edges = [(str(dep.predecessor_id), str(dep.successor_id)) for dep in dependencies]
 
-        # Create adjacency list
-        adj_list = defaultdict(list)
-
-        for dep in dependencies:
-            pred_id = str(dep.predecessor_id)
-            succ_id = str(dep.successor_id)
-            edges.append((pred_id, succ_id))
-            adj_list[pred_id].append(succ_id)
+        # Compressed adjacency (CSR) over dense node indices
+        node_ids, indptr, indices = self._build_csr(nodes, edges)
 
         # Find cycles
-        cycles = self._detect_cycles_from_adj_list(adj_list)
+        cycles = self._detect_cycles_from_csr(node_ids, indptr, indices)
 
         # Find longest path (critical path approximation)
-        longest_path = self._find_longest_path(adj_list, nodes)
+        longest_path = self._find_longest_path(node_ids, indptr, indices)
 
         return DependencyGraph(
             nodes=nodes,
@@ -239,152 +491,241 @@ class DependencyValidationService:
             longest_path=longest_path
         )
 
+    def _build_csr(
+        self,
+        nodes: List[str],
+        edges: Iterable[Tuple[str, str]]
+    ) -> Tuple[List[str], array, array]:
+        """
+        Pack the graph into compressed sparse row form.
+
+        Node IDs are mapped to dense indices (task nodes first, then any
+        dependency endpoint outside the task list). Successors of node ``u``
+        are ``indices[indptr[u]:indptr[u + 1]]``, kept in dependency order.
+        """
+        node_ids = list(nodes)
+        id_to_idx = {node_id: idx for idx, node_id in enumerate(node_ids)}
+
+        edge_idx = []
+        for pred_id, succ_id in edges:
+            for node_id in (pred_id, succ_id):
+                if node_id not in id_to_idx:
+                    id_to_idx[node_id] = len(node_ids)
+                    node_ids.append(node_id)
+            edge_idx.append((id_to_idx[pred_id], id_to_idx[succ_id]))
+
+        # Counting sort by predecessor keeps the layout O(V + E)
+        indptr = array('i', bytes(4 * (len(node_ids) + 1)))
+        for pred, _ in edge_idx:
+            indptr[pred + 1] += 1
+        for idx in range(len(node_ids)):
+            indptr[idx + 1] += indptr[idx]
+
+        indices = array('i', bytes(4 * len(edge_idx)))
+        cursor = indptr[:-1]
+        for pred, succ in edge_idx:
+            indices[cursor[pred]] = succ
+            cursor[pred] += 1
+
+        return node_ids, indptr, indices
+
     def _build_single_task_graph(self, task: Task, dependencies: List[TaskDependency]) -> Dict[str, Any]:
         """Build dependency graph for a single task."""
-        adj_list = defaultdict(list)
-
-        for dep in dependencies:
-            pred_id = str(dep.predecessor_id)
-            succ_id = str(dep.successor_id)
-            adj_list[pred_id].append(succ_id)
+        edges = sorted(
+            ((str(dep.predecessor_id), str(dep.successor_id)) for dep in dependencies),
+            key=itemgetter(0)
+        )
+        adj_list = {
+            pred_id: tuple(succ_id for _, succ_id in group)
+            for pred_id, group in groupby(edges, key=itemgetter(0))
+        }
 
         return {
             'nodes': [str(task.id)],
             'adj_list': adj_list
         }
 
-    def _detect_cycles(self, graph: DependencyGraph) -> List[List[str]]:
-        """Detect cycles in dependency graph."""
-        return self._detect_cycles_from_adj_list(
-            defaultdict(list, {node: [] for node in graph.nodes})
+    def _detect_cycles(
+        self,
+        tasks: List[Task],
+        dependencies: List[TaskDependency],
+        first_only: bool = False
+    ) -> List[List[str]]:
+        """Detect cycles without materialising the full DependencyGraph (edges, longest path)."""
+        node_ids, indptr, indices = self._build_csr(
+            [str(task.id) for task in tasks],
+            ((str(dep.predecessor_id), str(dep.successor_id)) for dep in dependencies)
         )
+        return self._detect_cycles_from_csr(node_ids, indptr, indices, first_only)
 
-    def _detect_cycles_from_adj_list(self, adj_list: Dict[str, List[str]]) -> List[List[str]]:
-        """Detect cycles using DFS."""
-        visited = set()
-        rec_stack = set()
+    def _detect_cycles_from_csr(
+        self,
+        node_ids: List[str],
+        indptr: array,
+        indices: array,
+        first_only: bool = False
+    ) -> List[List[str]]:
+        """Detect cycles using an iterative DFS over a CSR graph."""
+        # 0 = unvisited, 1 = on the current path, 2 = finished
+        state = bytearray(len(node_ids))
         cycles = []
 
-        def dfs(node: str, path: List[str]):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in adj_list[node]:
-                if neighbor not in visited:
-                    if dfs(neighbor, path):
-                        return True
-                elif neighbor in rec_stack:
-                    # Cycle found
+        for root in range(len(node_ids)):
+            if state[root]:
+                continue
+
+            state[root] = 1
+            path = [root]
+            cursor = [indptr[root]]
+            while path:
+                node = path[-1]
+                pos = cursor[-1]
+                if pos == indptr[node + 1]:
+                    state[node] = 2
+                    path.pop()
+                    cursor.pop()
+                    continue
+
+                cursor[-1] = pos + 1
+                neighbor = indices[pos]
+                if not state[neighbor]:
+                    state[neighbor] = 1
+                    path.append(neighbor)
+                    cursor.append(indptr[neighbor])
+                elif state[neighbor] == 1:
+                    # Cycle found; report one per DFS tree
                     cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
-                    return True
-
-            path.pop()
-            rec_stack.remove(node)
-            return False
-
-        for node in adj_list:
-            if node not in visited:
-                dfs(node, [])
+                    cycles.append([node_ids[idx] for idx in path[cycle_start:]] + [node_ids[neighbor]])
+                    if first_only:
+                        return cycles
+                    for idx in path:
+                        state[idx] = 2
+                    break
 
         return cycles
 
     def _detect_cycles_in_task_graph(self, graph: Dict[str, Any], task_id: str) -> List[List[str]]:
         """Detect cycles involving a specific task."""
-        # Simplified cycle detection for single task
-        cycles = []
-
-        # Check if task has any predecessors that eventually lead back to itself
-        visited = set()
-
-        def check_path(current: str, target: str, path: List[str]):
-            if current in path:
-                return True  # Cycle detected
-            if current == target and len(path) > 0:
-                cycles.append(path + [current])
-                return True
-
-            path.append(current)
-            for pred in graph['adj_list'].get(current, []):
-                if pred not in visited:
-                    visited.add(pred)
-                    if check_path(pred, target, path):
-                        return True
-
-            path.pop()
-            return False
-
-        # Check predecessors
-        for pred in graph['adj_list'].get(task_id, []):
-            if check_path(pred, task_id, []):
-                break
-
-        return cycles
-
-    def _find_longest_path(self, adj_list: Dict[str, List[str]], nodes: List[str]) -> List[str]:
-        """Find the longest path in the dependency graph (approximates critical path)."""
-        # Simplified longest path calculation
-        # In a real implementation, this would use topological sort and DP
-
-        def calculate_path_length(node: str, memo: Dict[str, int]) -> int:
-            if node in memo:
-                return memo[node]
-
-            if not adj_list[node]:
-                return 1
-
-            max_length = 1
-            for successor in adj_list[node]:
-                length = calculate_path_length(successor, memo) + 1
-                max_length = max(max_length, length)
-
-            memo[node] = max_length
-            return max_length
-
-        # Calculate longest path from each node
-        memo = {}
-        max_length = 0
-        start_node = None
-
-        for node in nodes:
-            length = calculate_path_length(node, memo)
-            if length > max_length:
-                max_length = length
-                start_node = node
-
-        # Reconstruct path (simplified)
-        if start_node:
-            path = [start_node]
-            current = start_node
-            while adj_list[current]:
-                next_node = max(adj_list[current], key=lambda x: calculate_path_length(x, memo))
-                path.append(next_node)
-                current = next_node
-            return path
+        adj_list = graph['adj_list']
+
+        # Breadth-first walk from the task; a cycle exists if the task is reached again
+        visited = {task_id}
+        parent: Dict[str, str] = {}
+        queue = deque([task_id])
+
+        while queue:
+            current = queue.popleft()
+            for successor in adj_list.get(current, ()):
+                if successor == task_id:
+                    cycle = [current]
+                    while cycle[-1] != task_id:
+                        cycle.append(parent[cycle[-1]])
+                    cycle.reverse()
+                    return [cycle + [task_id]]
+
+                if successor not in visited:
+                    visited.add(successor)
+                    parent[successor] = current
+                    queue.append(successor)
 
         return []
 
-    def _check_logical_issues(self, tasks: List[Task], dependencies: List[TaskDependency]) -> List[str]:
+    def _topological_order(self, indptr: array, indices: array) -> Optional[List[int]]:
+        """Order CSR node indices topologically (Kahn's algorithm); returns None if the graph has a cycle."""
+        node_count = len(indptr) - 1
+        in_degree = array('i', bytes(4 * node_count))
+        for successor in indices:
+            in_degree[successor] += 1
+
+        queue = deque(idx for idx in range(node_count) if not in_degree[idx])
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in indices[indptr[node]:indptr[node + 1]]:
+                in_degree[successor] -= 1
+                if not in_degree[successor]:
+                    queue.append(successor)
+
+        if len(order) != node_count:
+            return None
+
+        return order
+
+    def _find_longest_path(self, node_ids: List[str], indptr: array, indices: array) -> List[str]:
+        """Find the longest path in the dependency graph (approximates critical path)."""
+        if not node_ids:
+            return []
+
+        if NUMBA_AVAILABLE:
+            indptr_arr = np.asarray(indptr, dtype=np.int32)
+            indices_arr = np.asarray(indices, dtype=np.int32)
+            order = _kahn_topological_order(indptr_arr, indices_arr)
+            if len(order) != len(node_ids):
+                # Longest path is undefined on a cyclic graph
+                return []
+            path_length, next_hop = _longest_path_dp(indptr_arr, indices_arr, order)
+        else:
+            order = self._topological_order(indptr, indices)
+            if order is None:
+                # Longest path is undefined on a cyclic graph
+                return []
+            path_length, next_hop = self._longest_path_lengths(indptr, indices, order)
+
+        current = max(range(len(node_ids)), key=path_length.__getitem__)
+        path = []
+        while current != -1:
+            path.append(node_ids[current])
+            current = int(next_hop[current])
+
+        return path
+
+    def _longest_path_lengths(
+        self,
+        indptr: array,
+        indices: array,
+        order: List[int]
+    ) -> Tuple[array, array]:
+        """Longest path length and next hop per node, walking reverse topological order."""
+        node_count = len(indptr) - 1
+        path_length = array('i', bytes(4 * node_count))
+        next_hop = array('i', [-1]) * node_count
+        for node in reversed(order):
+            best_length = 0
+            for successor in indices[indptr[node]:indptr[node + 1]]:
+                if path_length[successor] > best_length:
+                    best_length = path_length[successor]
+                    next_hop[node] = successor
+            path_length[node] = best_length + 1
+
+        return path_length, next_hop
+
+    def _check_logical_issues(
+        self,
+        tasks: List[Task],
+        dependencies: List[TaskDependency],
+        check_dates: bool = True
+    ) -> List[str]:
         """Check for logical issues in dependencies."""
         warnings = []
 
-        # Check for tasks with too many dependencies
-        task_dep_count = defaultdict(int)
-        for dep in dependencies:
-            task_dep_count[str(dep.successor_id)] += 1
+        by_id = {str(task.id): task for task in tasks}
 
-        for task_id, count in task_dep_count.items():
+        # Check for tasks with too many dependencies
+        predecessor_counts = Counter(str(dep.successor_id) for dep in dependencies)
+        for task_id, count in predecessor_counts.items():
             if count > 10:
-                task = next((t for t in tasks if str(t.id) == task_id), None)
+                task = by_id.get(task_id)
                 if task:
                     warnings.append(f"Task '{task.name}' has {count} predecessors - consider simplifying")
 
+        if not check_dates:
+            return warnings
+
         # Check for date inconsistencies
         for dep in dependencies:
-            pred_task = next((t for t in tasks if t.id == dep.predecessor_id), None)
-            succ_task = next((t for t in tasks if t.id == dep.successor_id), None)
+            pred_task = by_id.get(str(dep.predecessor_id))
+            succ_task = by_id.get(str(dep.successor_id))
 
             if pred_task and succ_task:
                 if (pred_task.planned_end_date and succ_task.planned_start_date and
@@ -426,39 +767,22 @@ class DependencyValidationService:
         Returns:
             List of suggested fixes
         """
-        suggestions = []
-
         # Suggest fixes for circular references
-        for cycle in validation_result.circular_references:
-            suggestions.append({
+        suggestions = [
+            {
                 "issue_type": "circular_reference",
                 "description": f"Break circular dependency: {' -> '.join(cycle)}",
                 "suggested_action": "Remove one dependency in the cycle",
                 "affected_tasks": cycle
-            })
+            }
+            for cycle in validation_result.circular_references
+        ]
 
         # Suggest fixes for invalid dependencies
-        for invalid_dep in validation_result.invalid_dependencies:
-            if invalid_dep["issue"] == "predecessor_task_not_found":
-                suggestions.append({
-                    "issue_type": "missing_predecessor",
-                    "description": f"Predecessor task {invalid_dep['predecessor_id']} not found",
-                    "suggested_action": "Remove dependency or create missing task",
-                    "affected_tasks": [invalid_dep['successor_id']]
-                })
-            elif invalid_dep["issue"] == "successor_task_not_found":
-                suggestions.append({
-                    "issue_type": "missing_successor",
-                    "description": f"Successor task {invalid_dep['successor_id']} not found",
-                    "suggested_action": "Remove dependency or create missing task",
-                    "affected_tasks": [invalid_dep['predecessor_id']]
-                })
-            elif invalid_dep["issue"] == "self_dependency":
-                suggestions.append({
-                    "issue_type": "self_dependency",
-                    "description": f"Task cannot depend on itself",
-                    "suggested_action": "Remove self-dependency",
-                    "affected_tasks": [invalid_dep['predecessor_id']]
-                })
+        suggestions.extend(
+            _INVALID_DEPENDENCY_FIXES[invalid_dep["issue"]](invalid_dep)
+            for invalid_dep in validation_result.invalid_dependencies
+            if invalid_dep["issue"] in _INVALID_DEPENDENCY_FIXES
+        )
 
         return suggestions
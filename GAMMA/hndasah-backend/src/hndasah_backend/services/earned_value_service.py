@@ -3,11 +3,26 @@ Earned Value Management Service for WhatsApp PM System v3.0 (Gamma)
 EVM calculations for project performance measurement and forecasting
 """
 
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from functools import cache, lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from uuid import UUID
+import statistics
 import structlog
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
+from operator import attrgetter
+from sqlalchemy import func, select
+
+# Optional NumPy import for vectorised task aggregation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 from ..models.sqlalchemy.task import Task
 from ..models.sqlalchemy.project import Project
@@ -15,10 +30,260 @@ from ..schemas.task import EarnedValueMetrics, EVMAnalysis, EVMPrediction
 
 logger = structlog.get_logger(__name__)
 
+# Shared Decimal constants for response payloads
+_D_ZERO = Decimal('0')
+_D_75 = Decimal('75')
+_D_80 = Decimal('80')
+
+# Recommendation texts and their flag bits
+_RECOMMENDATIONS = (
+    "Critical: Schedule performance is poor. Consider crashing or fast-tracking critical path activities.",
+    "Monitor schedule variance closely and implement schedule recovery actions.",
+    "Critical: Cost performance is poor. Review budget allocations and implement cost control measures.",
+    "Track cost variances and implement corrective actions to prevent further overruns.",
+    "High TCPI indicates aggressive performance needed for remaining work. Consider scope reduction or additional resources.",
+    "Early warning: Project is trending poorly. Implement immediate corrective actions.",
+)
+(_REC_SCHEDULE_CRITICAL, _REC_SCHEDULE_MONITOR, _REC_COST_CRITICAL,
+ _REC_COST_MONITOR, _REC_TCPI_HIGH, _REC_EARLY_WARNING) = (1 << bit for bit in range(len(_RECOMMENDATIONS)))
+_DEFAULT_RECS = ("Project performance is within acceptable ranges. Continue monitoring.",)
+
+# Every flag combination maps to a prebuilt tuple; no flags means the default
+_RECOMMENDATION_SETS = {
+    flags: tuple(text for bit, text in enumerate(_RECOMMENDATIONS) if flags >> bit & 1) or _DEFAULT_RECS
+    for flags in range(1 << len(_RECOMMENDATIONS))
+}
+
+@lru_cache(maxsize=128)
+def _historical_cpi_sigma(cpis: Tuple[float, ...]) -> float:
+    """Sample standard deviation of historical CPIs, memoised per CPI sequence."""
+    if NUMPY_AVAILABLE:
+        return float(np.array(cpis, dtype=np.float64).std(ddof=1))
+    return statistics.stdev(cpis)
+
+
+# Task columns read by the EVM reductions, in (budget, progress, actual) order
+_EVM_FIELDS = attrgetter('budgeted_cost', 'progress_percentage', 'actual_cost')
+
+
+def _r2(value: float) -> Decimal:
+    """Round a float to cents via string formatting, avoiding Decimal.quantize."""
+    return Decimal(f"{value:.2f}")
+
+
+def _r4(value: float) -> Decimal:
+    """Round a float performance index to four places."""
+    return Decimal(f"{value:.4f}")
+
+
+def _evm_derive_py(pv, ev, ac, bac):
+    """
+    Variances, indices and forecasts from the three EVM base values.
+
+    Returns (sv, cv, spi, cpi, eac, etc, vac, tcpi, pc) as floats.
+    """
+    sv = ev - pv
+    cv = ev - ac
+    spi = ev / pv if pv > 0 else 0.0
+    cpi = ev / ac if ac > 0 else 0.0
+
+    # EAC = AC + (BAC - EV) / CPI
+    if cpi <= 0:
+        eac = bac
+    elif bac - ev <= 0:
+        eac = ac
+    else:
+        eac = ac + (bac - ev) / cpi
+
+    etc = eac - ac
+    vac = bac - eac
+    tcpi = (bac - ac) / (eac - ev) if (eac - ev) > 0 else 0.0
+    pc = ev / bac * 100.0 if bac > 0 else 0.0
+
+    return sv, cv, spi, cpi, eac, etc, vac, tcpi, pc
+
+
+def _evm_core_py(budgets, progress, actuals, bac, total_days, days_elapsed):
+    """
+    Full EVM arithmetic over float64 task arrays.
+
+    Returns (pv, ev, ac, sv, cv, spi, cpi, eac, etc, vac, tcpi, pc) as floats.
+    Written against NumPy only so it runs as-is or compiled by Numba.
+    """
+    # Planned Value: linear distribution of budget over the schedule
+    if total_days > 0 and days_elapsed > 0:
+        pv = bac * min(days_elapsed, total_days) / total_days
+    else:
+        pv = 0.0
+
+    # Earned Value: budget weighted by completion percentage
+    ev = 0.0
+    if budgets.sum() > 0:
+        ev = (np.where(budgets > 0, budgets, 0.0) * progress).sum() / 100.0
+
+    ac = actuals.sum()
+
+    sv, cv, spi, cpi, eac, etc, vac, tcpi, pc = _evm_derive_py(pv, ev, ac, bac)
+    return pv, ev, ac, sv, cv, spi, cpi, eac, etc, vac, tcpi, pc
+
+
+# Numba signature of the EVM kernel; _get_kernel() compiles against it up front
+_EVM_CORE_SIG = "UniTuple(float64, 12)(float64[::1], float64[::1], float64[::1], float64, int64, int64)"
+
+
+@cache
+def _load_numba():
+    """Import Numba and let compiled kernels call _evm_derive_py; raises ImportError without it."""
+    import numba
+    from numba.extending import register_jitable
+
+    register_jitable(_evm_derive_py)
+    return numba
+
+
+@cache
+def _get_kernel():
+    """
+    Return the EVM array kernel, compiled with Numba on first use.
+
+    Numba is imported lazily so the service imports without paying its
+    startup cost; cache=True lets later processes load the compiled code
+    from disk. Compiling against an explicit signature happens here rather
+    than on the first call, so a missing or failing Numba falls back to
+    the NumPy-only Python function.
+    """
+    try:
+        numba = _load_numba()
+        return numba.njit(_EVM_CORE_SIG, cache=True)(_evm_core_py)
+    except ImportError:
+        return _evm_core_py
+    except Exception as e:
+        logger.warning("EVM kernel compilation failed, using the Python kernel", error=str(e))
+        return _evm_core_py
+
+
+def _make_portfolio_core(prange):
+    """Build the portfolio kernel with prange as its outer loop (numba.prange when compiled)."""
+
+    def portfolio_core(offsets, budgets, progress, actuals, bacs, total_days, days_elapsed, out):
+        """
+        EVM block for many projects whose tasks are concatenated into flat arrays.
+
+        Project p owns tasks offsets[p]:offsets[p + 1]. Row p of out receives
+        (pv, ev, ac, sv, cv, spi, cpi, eac, etc, vac, tcpi, pc).
+        """
+        for p in prange(bacs.shape[0]):
+            bac = bacs[p]
+
+            # Planned Value: linear distribution of budget over the schedule
+            pv = 0.0
+            if total_days[p] > 0 and days_elapsed[p] > 0:
+                pv = bac * min(days_elapsed[p], total_days[p]) / total_days[p]
+
+            # Earned Value and Actual Cost over this project's task slice
+            ev = 0.0
+            ac = 0.0
+            total_budget = 0.0
+            for i in range(offsets[p], offsets[p + 1]):
+                budget = budgets[i]
+                total_budget += budget
+                ac += actuals[i]
+                if budget > 0:
+                    ev += budget * progress[i]
+            ev = ev / 100.0 if total_budget > 0 else 0.0
+
+            sv, cv, spi, cpi, eac, etc, vac, tcpi, pc = _evm_derive_py(pv, ev, ac, bac)
+            out[p, 0] = pv
+            out[p, 1] = ev
+            out[p, 2] = ac
+            out[p, 3] = sv
+            out[p, 4] = cv
+            out[p, 5] = spi
+            out[p, 6] = cpi
+            out[p, 7] = eac
+            out[p, 8] = etc
+            out[p, 9] = vac
+            out[p, 10] = tcpi
+            out[p, 11] = pc
+
+    return portfolio_core
+
+
+_portfolio_core_py = _make_portfolio_core(range)
+
+# Numba signature of the portfolio kernel; _get_portfolio_kernel() compiles against it up front
+_PORTFOLIO_CORE_SIG = (
+    "void(int64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int64[::1], int64[::1], float64[:, ::1])"
+)
+
+
+@cache
+def _get_portfolio_kernel():
+    """Return the portfolio kernel, compiled with Numba in parallel mode on first use."""
+    try:
+        numba = _load_numba()
+        return numba.njit(_PORTFOLIO_CORE_SIG, cache=True, parallel=True)(_make_portfolio_core(numba.prange))
+    except ImportError:
+        return _portfolio_core_py
+    except Exception as e:
+        logger.warning("Portfolio kernel compilation failed, using the Python kernel", error=str(e))
+        return _portfolio_core_py
+
+
+@dataclass(frozen=True)
+class _EVMFloats:
+    """Float view of EarnedValueMetrics shared by the analyzers."""
+
+    sv: float
+    cv: float
+    sv_pct: float
+    cv_pct: float
+    vac_pct: float
+    spi: float
+    cpi: float
+    tcpi: float
+    pc: float
+
+    @classmethod
+    def from_metrics(cls, evm: EarnedValueMetrics) -> "_EVMFloats":
+        """Convert the Decimal metrics once; percentages are absolute, vac_pct only for a shortfall."""
+        sv = float(evm.schedule_variance)
+        cv = float(evm.cost_variance)
+        pv = float(evm.planned_value)
+        ev = float(evm.earned_value)
+        vac = float(evm.variance_at_completion)
+        bac = float(evm.budget_at_completion)
+        return cls(
+            sv=sv,
+            cv=cv,
+            sv_pct=abs(sv / pv * 100) if pv > 0 else 0.0,
+            cv_pct=abs(cv / ev * 100) if ev > 0 else 0.0,
+            vac_pct=abs(vac / bac * 100) if vac < 0 and bac > 0 else 0.0,
+            spi=float(evm.schedule_performance_index),
+            cpi=float(evm.cost_performance_index),
+            tcpi=float(evm.to_complete_performance_index),
+            pc=float(evm.percent_complete)
+        )
+
 
 class EarnedValueService:
     """Service for Earned Value Management calculations and analysis."""
 
+    # Variance-percentage buckets; a value equal to a threshold stays in the lower bucket
+    _SCHED_THRESHOLDS = (10.0, 20.0)
+    _SCHED_LABELS = ("slightly_behind_schedule", "moderately_behind_schedule", "significantly_behind_schedule")
+    _COST_THRESHOLDS = (10.0, 20.0)
+    _COST_LABELS = ("slightly_over_budget", "moderately_over_budget", "significantly_over_budget")
+
+    # (severe, warning) thresholds for SPI, CPI, -TCPI and -VAC%, with the factor reported at each level
+    _RISK_THRESHOLDS = ((0.9, 0.95), (0.9, 0.95), (float('-inf'), -1.1), (-15.0, -5.0))
+    _RISK_FACTORS = (
+        ("schedule_performance", "schedule_trending"),
+        ("cost_performance", "cost_trending"),
+        ("completion_performance", "completion_performance"),
+        ("budget_completion", "budget_completion"),
+    )
+
     def __init__(self):
         pass
 
@@ -29,7 +294,22 @@ class EarnedValueService:
         project_budget: Decimal,
         project_start_date: date,
         project_end_date: date,
-        db_session=None
+        db_session=None,
+        today: Optional[date] = None
+    ) -> EarnedValueMetrics:
+        """Async wrapper around calculate_project_evm_sync."""
+        return self.calculate_project_evm_sync(
+            project_id, tasks, project_budget, project_start_date, project_end_date, today
+        )
+
+    def calculate_project_evm_sync(
+        self,
+        project_id: UUID,
+        tasks: List[Task],
+        project_budget: Decimal,
+        project_start_date: date,
+        project_end_date: date,
+        today: Optional[date] = None
     ) -> EarnedValueMetrics:
         """
         Calculate comprehensive Earned Value metrics for a project.
@@ -40,168 +320,293 @@ class EarnedValueService:
             project_budget: Total project budget
             project_start_date: Project planned start date
             project_end_date: Project planned end date
+            today: Reference date for planned value (defaults to the current date)
 
         Returns:
             Complete EVM metrics
         """
+        now = datetime.now(UTC).replace(tzinfo=None)
+        today = today or date.today()
         try:
-            # Calculate basic EVM components
-            pv = self._calculate_planned_value(tasks, project_budget, project_start_date, project_end_date)
-            ev = self._calculate_earned_value(tasks, project_budget)
-            ac = self._calculate_actual_cost(tasks)
-
-            # Calculate variances
-            sv = ev - pv  # Schedule Variance
-            cv = ev - ac  # Cost Variance
-
-            # Calculate performance indices
-            spi = ev / pv if pv > 0 else Decimal('0')  # Schedule Performance Index
-            cpi = ev / ac if ac > 0 else Decimal('0')  # Cost Performance Index
-
-            # Calculate estimates at completion
-            eac = self._calculate_eac(ac, ev, project_budget, cpi)
-            etc = eac - ac  # Estimate to Complete
-
-            # Calculate variances at completion
-            vac = project_budget - eac  # Variance at Completion
-
-            # Calculate TCPI (To Complete Performance Index)
-            remaining_budget = project_budget - ac
-            tcpi = remaining_budget / (eac - ev) if (eac - ev) > 0 else Decimal('0')
-
-            # Calculate project completion percentage
-            bac = project_budget  # Budget at Completion
-            pc = (ev / bac * 100) if bac > 0 else Decimal('0')  # Percent Complete
-
-            return EarnedValueMetrics(
-                project_id=project_id,
-                planned_value=pv,
-                earned_value=ev,
-                actual_cost=ac,
-                budget_at_completion=bac,
-                schedule_variance=sv,
-                cost_variance=cv,
-                schedule_performance_index=spi,
-                cost_performance_index=cpi,
-                estimate_at_completion=eac,
-                estimate_to_complete=etc,
-                variance_at_completion=vac,
-                to_complete_performance_index=tcpi,
-                percent_complete=pc,
-                calculated_at=datetime.utcnow()
+            bac = float(project_budget)
+            total_days = (project_end_date - project_start_date).days
+            days_elapsed = (today - project_start_date).days
+
+            if NUMPY_AVAILABLE:
+                # Float kernel over task arrays
+                budgets, progress, actuals = self._tasks_to_arrays(tasks)
+                pv, ev, ac, sv, cv, spi, cpi, eac, etc, vac, tcpi, pc = _get_kernel()(
+                    budgets, progress, actuals, bac, total_days, days_elapsed
+                )
+            else:
+                # Calculate basic EVM components
+                pv = self._calculate_planned_value(bac, total_days, days_elapsed)
+                ev, ac, _ = self._reduce_tasks(tasks)
+                sv, cv, spi, cpi, eac, etc, vac, tcpi, pc = _evm_derive_py(pv, ev, ac, bac)
+
+            return self._build_metrics(
+                project_id, project_budget, now,
+                (pv, ev, ac, sv, cv, spi, cpi, eac, etc, vac, tcpi, pc)
             )
 
         except Exception as e:
             logger.error("EVM calculation failed", error=str(e), project_id=str(project_id))
-            # Return zero metrics on error
-            return EarnedValueMetrics(
-                project_id=project_id,
-                planned_value=Decimal('0'),
-                earned_value=Decimal('0'),
-                actual_cost=Decimal('0'),
-                budget_at_completion=project_budget,
-                schedule_variance=Decimal('0'),
-                cost_variance=Decimal('0'),
-                schedule_performance_index=Decimal('0'),
-                cost_performance_index=Decimal('0'),
-                estimate_at_completion=Decimal('0'),
-                estimate_to_complete=Decimal('0'),
-                variance_at_completion=Decimal('0'),
-                to_complete_performance_index=Decimal('0'),
-                percent_complete=Decimal('0'),
-                calculated_at=datetime.utcnow()
-            )
+            return self._empty_metrics(project_id, project_budget, now)
 
-    def _calculate_planned_value(
+    async def calculate_project_evm_from_db(
         self,
-        tasks: List[Task],
+        project_id: UUID,
+        db_session,
         project_budget: Decimal,
         project_start_date: date,
-        project_end_date: date
-    ) -> Decimal:
-        """Calculate Planned Value (PV) - budgeted cost of work scheduled."""
-        total_days = (project_end_date - project_start_date).days
-        if total_days <= 0:
-            return Decimal('0')
+        project_end_date: date,
+        today: Optional[date] = None
+    ) -> EarnedValueMetrics:
+        """
+        Calculate Earned Value metrics from SQL aggregates over the project's tasks.
+
+        Only the three summed columns leave the database, so no Task rows
+        are hydrated. Use calculate_project_evm when tasks are already loaded.
+
+        Args:
+            project_id: Project identifier
+            db_session: Async database session
+            project_budget: Total project budget
+            project_start_date: Project planned start date
+            project_end_date: Project planned end date
+            today: Reference date for planned value (defaults to the current date)
+
+        Returns:
+            Complete EVM metrics
+        """
+        now = datetime.now(UTC).replace(tzinfo=None)
+        today = today or date.today()
+        try:
+            result = await db_session.execute(
+                select(
+                    func.coalesce(func.sum(Task.budgeted_cost * Task.progress_percentage), 0) / 100,
+                    func.coalesce(func.sum(Task.actual_cost), 0),
+                    func.coalesce(func.sum(Task.budgeted_cost), 0)
+                ).where(Task.project_id == project_id)
+            )
+            earned, actual, total_budget = result.one()
+
+            bac = float(project_budget)
+            total_days = (project_end_date - project_start_date).days
+            days_elapsed = (today - project_start_date).days
+
+            pv = self._calculate_planned_value(bac, total_days, days_elapsed)
+            ev = float(earned) if float(total_budget) > 0 else 0.0
+            ac = float(actual)
+
+            return self._build_metrics(
+                project_id, project_budget, now,
+                (pv, ev, ac) + _evm_derive_py(pv, ev, ac, bac)
+            )
+
+        except Exception as e:
+            logger.error("EVM calculation failed", error=str(e), project_id=str(project_id))
+            return self._empty_metrics(project_id, project_budget, now)
+
+    async def calculate_portfolio_evm(
+        self,
+        projects: List[Tuple[UUID, List[Task], Decimal, date, date]],
+        today: Optional[date] = None
+    ) -> List[EarnedValueMetrics]:
+        """Async wrapper around calculate_portfolio_evm_sync."""
+        return self.calculate_portfolio_evm_sync(projects, today)
+
+    def calculate_portfolio_evm_sync(
+        self,
+        projects: List[Tuple[UUID, List[Task], Decimal, date, date]],
+        today: Optional[date] = None
+    ) -> List[EarnedValueMetrics]:
+        """
+        Calculate Earned Value metrics for several projects in one kernel call.
+
+        Args:
+            projects: (project_id, tasks, project_budget, start_date, end_date) per project
+            today: Reference date for planned value (defaults to the current date)
+
+        Returns:
+            EVM metrics in the same order as projects
+        """
+        today = today or date.today()
+        if not NUMPY_AVAILABLE:
+            return [
+                self.calculate_project_evm_sync(project_id, tasks, budget, start, end, today)
+                for project_id, tasks, budget, start, end in projects
+            ]
+
+        now = datetime.now(UTC).replace(tzinfo=None)
+        try:
+            count = len(projects)
+            offsets = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum([len(tasks) for _, tasks, _, _, _ in projects], out=offsets[1:])
+
+            # All tasks stacked into one (N, 3) array; NULL columns zeroed
+            rows = np.array(
+                list(chain.from_iterable(map(_EVM_FIELDS, tasks) for _, tasks, _, _, _ in projects)),
+                dtype=np.float64
+            ).reshape(-1, 3)
+            np.nan_to_num(rows, copy=False)
+            budgets, progress, actuals = np.ascontiguousarray(rows.T)
+
+            bacs = np.array([float(budget) for _, _, budget, _, _ in projects], dtype=np.float64)
+            total_days = np.array([(end - start).days for _, _, _, start, end in projects], dtype=np.int64)
+            days_elapsed = np.array([(today - start).days for _, _, _, start, _ in projects], dtype=np.int64)
+
+            out = np.empty((count, 12), dtype=np.float64)
+            _get_portfolio_kernel()(offsets, budgets, progress, actuals, bacs, total_days, days_elapsed, out)
+
+            return [
+                self._build_metrics(project_id, budget, now, tuple(values))
+                for (project_id, _, budget, _, _), values in zip(projects, out.tolist(), strict=True)
+            ]
 
-        # Calculate days elapsed from project start
-        days_elapsed = (date.today() - project_start_date).days
-        if days_elapsed <= 0:
-            return Decimal('0')
+        except Exception as e:
+            logger.error("Portfolio EVM calculation failed", error=str(e), project_count=len(projects))
+            return [
+                self._empty_metrics(project_id, budget, now)
+                for project_id, _, budget, _, _ in projects
+            ]
+
+    def _build_metrics(
+        self,
+        project_id: UUID,
+        project_budget: Decimal,
+        calculated_at: datetime,
+        values: Tuple[float, ...]
+    ) -> EarnedValueMetrics:
+        """Convert the float EVM block to the Decimal response model."""
+        pv, ev, ac, sv, cv, spi, cpi, eac, etc, vac, tcpi, pc = values
+
+        # Internal math stays in float; Decimal only at the response boundary
+        return EarnedValueMetrics(
+            project_id=project_id,
+            planned_value=_r2(pv),
+            earned_value=_r2(ev),
+            actual_cost=_r2(ac),
+            budget_at_completion=project_budget,
+            schedule_variance=_r2(sv),
+            cost_variance=_r2(cv),
+            schedule_performance_index=_r4(spi),
+            cost_performance_index=_r4(cpi),
+            estimate_at_completion=_r2(eac),
+            estimate_to_complete=_r2(etc),
+            variance_at_completion=_r2(vac),
+            to_complete_performance_index=_r4(tcpi),
+            percent_complete=_r2(pc),
+            calculated_at=calculated_at
+        )
+
+    def _empty_metrics(
+        self,
+        project_id: UUID,
+        project_budget: Decimal,
+        calculated_at: datetime
+    ) -> EarnedValueMetrics:
+        """Zero metrics returned when the calculation fails."""
+        return EarnedValueMetrics(
+            project_id=project_id,
+            planned_value=_D_ZERO,
+            earned_value=_D_ZERO,
+            actual_cost=_D_ZERO,
+            budget_at_completion=project_budget,
+            schedule_variance=_D_ZERO,
+            cost_variance=_D_ZERO,
+            schedule_performance_index=_D_ZERO,
+            cost_performance_index=_D_ZERO,
+            estimate_at_completion=_D_ZERO,
+            estimate_to_complete=_D_ZERO,
+            variance_at_completion=_D_ZERO,
+            to_complete_performance_index=_D_ZERO,
+            percent_complete=_D_ZERO,
+            calculated_at=calculated_at
+        )
+
+    def _calculate_planned_value(self, bac: float, total_days: int, days_elapsed: int) -> float:
+        """Calculate Planned Value (PV) - budgeted cost of work scheduled."""
+        if total_days <= 0 or days_elapsed <= 0:
+            return 0.0
 
         # Simple linear distribution of budget over time
         # In a real implementation, this would consider task schedules
-        progress_ratio = min(days_elapsed / total_days, 1.0)
-        return (project_budget * Decimal(str(progress_ratio))).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-    def _calculate_earned_value(self, tasks: List[Task], project_budget: Decimal) -> Decimal:
-        """Calculate Earned Value (EV) - budgeted cost of work performed."""
-        total_budgeted_cost = sum((task.budgeted_cost or Decimal('0')) for task in tasks)
-        if total_budgeted_cost <= 0:
-            return Decimal('0')
-
-        # Calculate weighted progress based on task completion
-        total_earned = Decimal('0')
-        for task in tasks:
-            task_budget = task.budgeted_cost or Decimal('0')
-            if task_budget > 0:
+        return bac * min(days_elapsed, total_days) / total_days
+
+    def _tasks_to_arrays(self, tasks: List[Task]) -> Tuple[Any, Any, Any]:
+        """Extract budgeted cost, progress and actual cost into float64 arrays."""
+        # NULL columns come through as NaN and are zeroed in place
+        rows = np.array(list(map(_EVM_FIELDS, tasks)), dtype=np.float64).reshape(-1, 3)
+        np.nan_to_num(rows, copy=False)
+        budgets, progress, actuals = np.ascontiguousarray(rows.T)
+        return budgets, progress, actuals
+
+    def _reduce_tasks(self, tasks: List[Task]) -> Tuple[float, float, float]:
+        """
+        Accumulate EV, AC and total budget in a single pass over the tasks.
+
+        Returns:
+            Tuple of (earned value, actual cost, total budgeted cost)
+        """
+        ev = 0.0
+        ac = 0.0
+        total_budget = 0.0
+        for budget, progress, actual in map(_EVM_FIELDS, tasks):
+            budget = float(budget or 0)
+            ac += float(actual or 0)
+            total_budget += budget
+            if budget > 0:
                 # Weight by task budget and completion percentage
-                task_earned = task_budget * (Decimal(str(task.progress_percentage)) / Decimal('100'))
-                total_earned += task_earned
+                ev += budget * float(progress or 0)
 
-        return total_earned.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        if total_budget <= 0:
+            return 0.0, ac, total_budget
 
-    def _calculate_actual_cost(self, tasks: List[Task]) -> Decimal:
-        """Calculate Actual Cost (AC) - actual cost incurred."""
-        total_actual_cost = sum((task.actual_cost or Decimal('0')) for task in tasks)
-        return total_actual_cost.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return ev / 100.0, ac, total_budget
+
+    async def analyze_evm_performance(
+        self,
+        evm_metrics: EarnedValueMetrics,
+        today: Optional[date] = None
+    ) -> EVMAnalysis:
+        """Async wrapper around analyze_evm_performance_sync."""
+        return self.analyze_evm_performance_sync(evm_metrics, today)
 
-    def _calculate_eac(
+    def analyze_evm_performance_sync(
         self,
-        actual_cost: Decimal,
-        earned_value: Decimal,
-        budget_at_completion: Decimal,
-        cpi: Decimal
-    ) -> Decimal:
-        """Calculate Estimate at Completion (EAC)."""
-        if cpi <= 0:
-            # If CPI is zero or negative, assume future performance at planned rate
-            return budget_at_completion
-
-        # EAC = AC + (BAC - EV) / CPI
-        remaining_work = budget_at_completion - earned_value
-        if remaining_work <= 0:
-            return actual_cost  # Project complete
-
-        future_cost = remaining_work / cpi
-        eac = actual_cost + future_cost
-
-        return eac.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
-    async def analyze_evm_performance(self, evm_metrics: EarnedValueMetrics) -> EVMAnalysis:
+        evm_metrics: EarnedValueMetrics,
+        today: Optional[date] = None
+    ) -> EVMAnalysis:
         """
         Analyze EVM metrics and provide performance insights.
 
         Args:
             evm_metrics: Calculated EVM metrics
+            today: Reference date for the forecast (defaults to the current date)
 
         Returns:
             Detailed performance analysis
         """
+        now = datetime.now(UTC).replace(tzinfo=None)
+        today = today or date.today()
+
+        metrics = _EVMFloats.from_metrics(evm_metrics)
+
         # Determine schedule status
-        schedule_status = self._analyze_schedule_status(evm_metrics)
+        schedule_status = self._analyze_schedule_status(metrics)
 
         # Determine cost status
-        cost_status = self._analyze_cost_status(evm_metrics)
+        cost_status = self._analyze_cost_status(metrics)
 
         # Calculate forecast completion date
-        forecast_completion = self._calculate_forecast_completion(evm_metrics)
+        forecast_completion = self._calculate_forecast_completion(metrics.spi, today)
 
         # Generate recommendations
-        recommendations = self._generate_evm_recommendations(evm_metrics, schedule_status, cost_status)
+        recommendations = self._generate_evm_recommendations(metrics, schedule_status, cost_status)
 
         # Calculate risk indicators
-        risk_indicators = self._calculate_risk_indicators(evm_metrics)
+        risk_indicators = self._calculate_risk_indicators(metrics)
 
         return EVMAnalysis(
             schedule_status=schedule_status,
@@ -209,122 +614,79 @@ class EarnedValueService:
             forecast_completion_date=forecast_completion,
             recommendations=recommendations,
             risk_indicators=risk_indicators,
-            analysis_date=datetime.utcnow()
+            analysis_date=now
         )
 
-    def _analyze_schedule_status(self, evm: EarnedValueMetrics) -> str:
+    def _analyze_schedule_status(self, metrics: _EVMFloats) -> str:
         """Analyze project schedule performance."""
-        if evm.schedule_variance > 0:
+        if metrics.sv > 0:
             return "ahead_of_schedule"
-        elif evm.schedule_variance == 0:
+        elif metrics.sv == 0:
             return "on_schedule"
         else:
-            sv_percent = abs(evm.schedule_variance / evm.planned_value * 100) if evm.planned_value > 0 else 0
-            if sv_percent > 20:
-                return "significantly_behind_schedule"
-            elif sv_percent > 10:
-                return "moderately_behind_schedule"
-            else:
-                return "slightly_behind_schedule"
+            return self._SCHED_LABELS[bisect_left(self._SCHED_THRESHOLDS, metrics.sv_pct)]
 
-    def _analyze_cost_status(self, evm: EarnedValueMetrics) -> str:
+    def _analyze_cost_status(self, metrics: _EVMFloats) -> str:
         """Analyze project cost performance."""
-        if evm.cost_variance > 0:
+        if metrics.cv > 0:
             return "under_budget"
-        elif evm.cost_variance == 0:
+        elif metrics.cv == 0:
             return "on_budget"
         else:
-            cv_percent = abs(evm.cost_variance / evm.earned_value * 100) if evm.earned_value > 0 else 0
-            if cv_percent > 20:
-                return "significantly_over_budget"
-            elif cv_percent > 10:
-                return "moderately_over_budget"
-            else:
-                return "slightly_over_budget"
+            return self._COST_LABELS[bisect_left(self._COST_THRESHOLDS, metrics.cv_pct)]
 
-    def _calculate_forecast_completion(self, evm: EarnedValueMetrics) -> Optional[date]:
+    def _calculate_forecast_completion(
+        self,
+        spi: float,
+        today: date,
+        days_remaining: int = 30
+    ) -> Optional[date]:
         """Calculate forecast project completion date."""
-        if evm.schedule_performance_index <= 0:
+        if spi <= 0:
             return None  # Cannot forecast
 
         # Simple forecasting based on SPI
-        # In a real implementation, this would consider task schedules
-        days_remaining = 30  # Placeholder - would calculate from actual task schedules
-        adjusted_days = days_remaining / float(evm.schedule_performance_index)
-
-        return date.today() + timedelta(days=int(adjusted_days))
+        # In a real implementation, days_remaining would come from actual task schedules
+        return today + timedelta(days=int(days_remaining / spi))
 
     def _generate_evm_recommendations(
         self,
-        evm: EarnedValueMetrics,
+        metrics: _EVMFloats,
         schedule_status: str,
         cost_status: str
-    ) -> List[str]:
+    ) -> Sequence[str]:
         """Generate recommendations based on EVM analysis."""
-        recommendations = []
+        spi = metrics.spi
+        cpi = metrics.cpi
 
-        # Schedule recommendations
+        # One bit per recommendation, in _RECOMMENDATIONS order
+        flags = 0
         if "behind_schedule" in schedule_status:
-            if evm.schedule_performance_index < 0.8:
-                recommendations.append("Critical: Schedule performance is poor. Consider crashing or fast-tracking critical path activities.")
-            else:
-                recommendations.append("Monitor schedule variance closely and implement schedule recovery actions.")
-
-        # Cost recommendations
+            flags |= _REC_SCHEDULE_CRITICAL if spi < 0.8 else _REC_SCHEDULE_MONITOR
         if "over_budget" in cost_status:
-            if evm.cost_performance_index < 0.8:
-                recommendations.append("Critical: Cost performance is poor. Review budget allocations and implement cost control measures.")
-            else:
-                recommendations.append("Track cost variances and implement corrective actions to prevent further overruns.")
-
-        # TCPI recommendations
-        if evm.to_complete_performance_index > 1.2:
-            recommendations.append("High TCPI indicates aggressive performance needed for remaining work. Consider scope reduction or additional resources.")
+            flags |= _REC_COST_CRITICAL if cpi < 0.8 else _REC_COST_MONITOR
+        if metrics.tcpi > 1.2:
+            flags |= _REC_TCPI_HIGH
+        if metrics.pc < 50 and (spi < 0.9 or cpi < 0.9):
+            flags |= _REC_EARLY_WARNING
 
-        # General recommendations
-        if evm.percent_complete < 50 and (evm.schedule_performance_index < 0.9 or evm.cost_performance_index < 0.9):
-            recommendations.append("Early warning: Project is trending poorly. Implement immediate corrective actions.")
+        return _RECOMMENDATION_SETS[flags]
 
-        if not recommendations:
-            recommendations.append("Project performance is within acceptable ranges. Continue monitoring.")
-
-        return recommendations
-
-    def _calculate_risk_indicators(self, evm: EarnedValueMetrics) -> Dict[str, Any]:
+    def _calculate_risk_indicators(self, metrics: _EVMFloats) -> Dict[str, Any]:
         """Calculate project risk indicators based on EVM metrics."""
+        # Each metric is oriented so that "below threshold" means risk
+        values = (metrics.spi, metrics.cpi, -metrics.tcpi, -metrics.vac_pct)
+
         risk_score = 0
         risk_factors = []
-
-        # Schedule risk
-        if evm.schedule_performance_index < 0.9:
-            risk_score += 2
-            risk_factors.append("schedule_performance")
-        elif evm.schedule_performance_index < 0.95:
-            risk_score += 1
-            risk_factors.append("schedule_trending")
-
-        # Cost risk
-        if evm.cost_performance_index < 0.9:
-            risk_score += 2
-            risk_factors.append("cost_performance")
-        elif evm.cost_performance_index < 0.95:
-            risk_score += 1
-            risk_factors.append("cost_trending")
-
-        # TCPI risk
-        if evm.to_complete_performance_index > 1.1:
-            risk_score += 1
-            risk_factors.append("completion_performance")
-
-        # Variance at completion risk
-        if evm.variance_at_completion < 0:
-            vac_percent = abs(evm.variance_at_completion / evm.budget_at_completion * 100)
-            if vac_percent > 15:
-                risk_score += 2
-                risk_factors.append("budget_completion")
-            elif vac_percent > 5:
-                risk_score += 1
-                risk_factors.append("budget_completion")
+        for value, (severe, warning), (severe_factor, warning_factor) in zip(
+            values, self._RISK_THRESHOLDS, self._RISK_FACTORS, strict=True
+        ):
+            # A severe hit is also a warning hit, scoring 2
+            hits = (value < severe) + (value < warning)
+            if hits:
+                risk_score += hits
+                risk_factors.append(severe_factor if hits == 2 else warning_factor)
 
         # Determine overall risk level
         if risk_score >= 4:
@@ -344,7 +706,19 @@ class EarnedValueService:
     async def predict_project_outcomes(
         self,
         evm_metrics: EarnedValueMetrics,
-        historical_data: Optional[List[Dict[str, Any]]] = None
+        historical_data: Optional[List[Dict[str, Any]]] = None,
+        today: Optional[date] = None,
+        project_start_date: Optional[date] = None
+    ) -> EVMPrediction:
+        """Async wrapper around predict_project_outcomes_sync."""
+        return self.predict_project_outcomes_sync(evm_metrics, historical_data, today, project_start_date)
+
+    def predict_project_outcomes_sync(
+        self,
+        evm_metrics: EarnedValueMetrics,
+        historical_data: Optional[List[Dict[str, Any]]] = None,
+        today: Optional[date] = None,
+        project_start_date: Optional[date] = None
     ) -> EVMPrediction:
         """
         Predict project outcomes using EVM metrics and historical data.
@@ -352,25 +726,34 @@ class EarnedValueService:
         Args:
             evm_metrics: Current EVM metrics
             historical_data: Optional historical project data for improved predictions
+            today: Reference date for the forecast (defaults to the current date)
+            project_start_date: Project start date, enables the early-stage risk check
 
         Returns:
             Project outcome predictions
         """
+        now = datetime.now(UTC).replace(tzinfo=None)
+        today = today or date.today()
+
+        metrics = _EVMFloats.from_metrics(evm_metrics)
+
         # Predict final cost
         predicted_final_cost = evm_metrics.estimate_at_completion
 
         # Predict completion date
-        predicted_completion_date = self._calculate_forecast_completion(evm_metrics)
+        predicted_completion_date = self._calculate_forecast_completion(metrics.spi, today)
 
         # Calculate confidence intervals
         cost_confidence_interval = self._calculate_cost_confidence_interval(evm_metrics, historical_data)
-        schedule_confidence_interval = self._calculate_schedule_confidence_interval(evm_metrics, historical_data)
+        schedule_confidence_interval = self._calculate_schedule_confidence_interval(
+            evm_metrics, historical_data, base_forecast=predicted_completion_date
+        )
 
         # Predict success probability
-        success_probability = self._calculate_success_probability(evm_metrics)
+        success_probability = self._calculate_success_probability(metrics)
 
         # Identify key risks
-        key_risks = self._identify_key_risks(evm_metrics)
+        key_risks = self._identify_key_risks(metrics, today, project_start_date)
 
         return EVMPrediction(
             predicted_final_cost=predicted_final_cost,
@@ -379,7 +762,7 @@ class EarnedValueService:
             schedule_confidence_interval=schedule_confidence_interval,
             success_probability=success_probability,
             key_risks=key_risks,
-            prediction_date=datetime.utcnow()
+            prediction_date=now
         )
 
     def _calculate_cost_confidence_interval(
@@ -388,31 +771,35 @@ class EarnedValueService:
         historical_data: Optional[List[Dict[str, Any]]]
     ) -> Dict[str, Decimal]:
         """Calculate confidence interval for cost predictions."""
-        # Simple confidence interval based on CPI variability
-        # In a real implementation, this would use statistical analysis of historical data
+        base_eac = float(evm.estimate_at_completion)
+        cpi_variability = 0.1  # 10% variability assumption without history
 
-        base_eac = evm.estimate_at_completion
-        cpi_variability = Decimal('0.1')  # 10% variability assumption
+        # 80% normal interval from the spread of historical CPIs
+        if historical_data:
+            cpis = tuple(float(row["cpi"]) for row in historical_data if row.get("cpi") is not None)
+            if len(cpis) > 1:
+                cpi_variability = 1.28 * _historical_cpi_sigma(cpis)
 
-        lower_bound = base_eac * (1 - cpi_variability)
+        lower_bound = max(base_eac * (1 - cpi_variability), 0.0)
         upper_bound = base_eac * (1 + cpi_variability)
 
         return {
-            "lower_bound": lower_bound.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-            "upper_bound": upper_bound.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-            "confidence_level": Decimal('80')  # 80% confidence
+            "lower_bound": _r2(lower_bound),
+            "upper_bound": _r2(upper_bound),
+            "confidence_level": _D_80  # 80% confidence
         }
 
     def _calculate_schedule_confidence_interval(
         self,
         evm: EarnedValueMetrics,
-        historical_data: Optional[List[Dict[str, Any]]]
+        historical_data: Optional[List[Dict[str, Any]]],
+        base_forecast: Optional[date] = None
     ) -> Dict[str, date]:
-        """Calculate confidence interval for schedule predictions."""
+        """Calculate confidence interval around the already computed forecast date."""
         # Simple schedule confidence interval
-        base_date = self._calculate_forecast_completion(evm)
+        base_date = base_forecast
         if not base_date:
-            return {"lower_bound": None, "upper_bound": None, "confidence_level": Decimal('0')}
+            return {"lower_bound": None, "upper_bound": None, "confidence_level": _D_ZERO}
 
         # Assume 15% variability in schedule predictions
         variability_days = 15  # days
@@ -423,65 +810,69 @@ class EarnedValueService:
         return {
             "lower_bound": lower_bound,
             "upper_bound": upper_bound,
-            "confidence_level": Decimal('75')  # 75% confidence
+            "confidence_level": _D_75  # 75% confidence
         }
 
-    def _calculate_success_probability(self, evm: EarnedValueMetrics) -> Decimal:
+    def _calculate_success_probability(self, metrics: _EVMFloats) -> Decimal:
         """Calculate probability of project success."""
         # Simple success probability calculation based on EVM metrics
         success_score = 0
 
         # Schedule performance (40% weight)
-        if evm.schedule_performance_index >= 1.0:
+        if metrics.spi >= 1.0:
             success_score += 40
-        elif evm.schedule_performance_index >= 0.9:
+        elif metrics.spi >= 0.9:
             success_score += 30
-        elif evm.schedule_performance_index >= 0.8:
+        elif metrics.spi >= 0.8:
             success_score += 20
         else:
             success_score += 10
 
         # Cost performance (40% weight)
-        if evm.cost_performance_index >= 1.0:
+        if metrics.cpi >= 1.0:
             success_score += 40
-        elif evm.cost_performance_index >= 0.9:
+        elif metrics.cpi >= 0.9:
             success_score += 30
-        elif evm.cost_performance_index >= 0.8:
+        elif metrics.cpi >= 0.8:
             success_score += 20
         else:
             success_score += 10
 
         # Progress (20% weight)
-        if evm.percent_complete >= 75:
+        if metrics.pc >= 75:
             success_score += 20
-        elif evm.percent_complete >= 50:
+        elif metrics.pc >= 50:
             success_score += 15
-        elif evm.percent_complete >= 25:
+        elif metrics.pc >= 25:
             success_score += 10
         else:
             success_score += 5
 
-        return Decimal(str(success_score))
+        return Decimal(success_score)
 
-    def _identify_key_risks(self, evm: EarnedValueMetrics) -> List[str]:
+    def _identify_key_risks(
+        self,
+        metrics: _EVMFloats,
+        today: date,
+        project_start_date: Optional[date] = None
+    ) -> List[str]:
         """Identify key project risks based on EVM metrics."""
         risks = []
 
-        if evm.schedule_performance_index < 0.85:
+        if metrics.spi < 0.85:
             risks.append("Schedule slippage risk - SPI indicates significant delays")
 
-        if evm.cost_performance_index < 0.85:
+        if metrics.cpi < 0.85:
             risks.append("Cost overrun risk - CPI indicates budget issues")
 
-        if evm.to_complete_performance_index > 1.2:
+        if metrics.tcpi > 1.2:
             risks.append("Completion performance risk - TCPI indicates unrealistic future performance requirements")
 
-        if evm.variance_at_completion < 0:
-            vac_percent = abs(evm.variance_at_completion / evm.budget_at_completion * 100)
-            if vac_percent > 20:
-                risks.append(f"Budget completion risk - projected shortfall of {vac_percent:.1f}%")
+        if metrics.vac_pct > 20:
+            risks.append(f"Budget completion risk - projected shortfall of {metrics.vac_pct:.1f}%")
 
-        if evm.percent_complete < 30 and (date.today() - min(date.today(), date.today())):  # Would need actual project start date
+        # Less than 30% done more than a month after the project started
+        if project_start_date and metrics.pc < 30 and (today - project_start_date).days > 30:
             risks.append("Early stage performance risk - poor initial performance trends")
 
         return risks if risks else ["No significant risks identified based on current EVM metrics"]
@@ -3,14 +3,19 @@ Import/Export Service for WhatsApp PM System v3.0 (Gamma)
 JSON, CSV, and Excel import/export functionality with validation
 """
 
+import asyncio
 import json
 import csv
+import gzip
 import uuid
+from collections import defaultdict
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from io import BytesIO
 from pathlib import Path
 import structlog
 from decimal import Decimal
+from functools import lru_cache
 
 # Optional pandas import for Excel functionality
 try:
@@ -19,7 +24,34 @@ try:
 except ImportError:
     pd = None
     PANDAS_AVAILABLE = False
-from ..models.sqlalchemy.task import Task
+
+# Optional openpyxl import for streaming Excel reads
+try:
+    from openpyxl import load_workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    load_workbook = None
+    OPENPYXL_AVAILABLE = False
+
+# Optional xlsxwriter import for streaming Excel writes
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    xlsxwriter = None
+    XLSXWRITER_AVAILABLE = False
+
+# Optional orjson import for faster JSON parsing and serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from sqlalchemy import func, select
+
+from ..models.sqlalchemy.task import Task, TaskDependency
 from ..models.sqlalchemy.project import Project
 from ..models.sqlalchemy.user import User
 from ..schemas.task import (
@@ -29,17 +61,190 @@ from ..schemas.task import (
 
 logger = structlog.get_logger(__name__)
 
+# Write buffer size for file exports, so large exports flush in few write calls
+EXPORT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Rows per INSERT statement when bulk-loading imported tasks
+IMPORT_BATCH_SIZE = 1000
+
+# Task columns read by the exporters
+EXPORT_TASK_COLUMNS = (
+    Task.id, Task.name, Task.description, Task.task_code, Task.status, Task.progress_percentage,
+    Task.planned_start_date, Task.planned_end_date, Task.actual_start_date, Task.actual_end_date,
+    Task.planned_duration_days, Task.actual_duration_days, Task.estimated_hours, Task.actual_hours,
+    Task.budgeted_cost, Task.actual_cost, Task.assigned_to, Task.parent_task_id,
+    Task.predecessor_tasks, Task.successor_tasks, Task.lag_days, Task.tags, Task.custom_fields
+)
+
+# Column order of task Excel exports
+EXCEL_EXPORT_HEADERS = (
+    'ID', 'Name', 'Description', 'Status', 'Progress %',
+    'Planned Start', 'Planned End', 'Actual Start', 'Actual End',
+    'Planned Duration (Days)', 'Actual Duration (Days)', 'Estimated Hours', 'Actual Hours',
+    'Budgeted Cost', 'Actual Cost', 'Assigned To', 'Parent Task',
+    'Predecessors', 'Successors', 'Lag Days', 'Tags'
+)
+
+# Column order of task CSV exports
+CSV_EXPORT_HEADERS = (
+    'id', 'name', 'description', 'status', 'progress_percentage',
+    'planned_start_date', 'planned_end_date', 'actual_start_date', 'actual_end_date',
+    'planned_duration_days', 'actual_duration_days', 'estimated_hours', 'actual_hours',
+    'budgeted_cost', 'actual_cost', 'assigned_to', 'parent_task_id',
+    'predecessor_tasks', 'successor_tasks', 'lag_days', 'tags'
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values neither JSON encoder handles natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _iso(value: Optional[date]) -> str:
+    """ISO-format a date for flat exports, with '' for missing values."""
+    return value.isoformat() if value is not None else ''
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse an ISO date string for import, returning None for empty or invalid values."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from str or bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _csv_text(value: Optional[str]) -> Optional[str]:
+    """CSV import coercion for text columns (kept as read)."""
+    return value
+
+
+def _csv_opt_int(value: Optional[str]) -> Optional[int]:
+    """CSV import coercion for optional integer columns."""
+    return int(value) if value else None
+
+
+def _csv_tags(value: Optional[str]) -> List[str]:
+    """CSV import coercion for the comma-separated tags column."""
+    return value.split(',') if value else []
+
+
+class _IdStrings(dict):
+    """Per-export memo of id -> str, so ids referenced by many tasks are formatted once."""
+
+    def __missing__(self, key: Any) -> str:
+        value = self[key] = str(key)
+        return value
+
+
+def _project_header_key(project: Project) -> Tuple[Any, ...]:
+    """Hashable snapshot of the project fields rendered into export headers."""
+    return (
+        str(project.id), project.updated_at, project.name, project.description,
+        project.status, project.start_date, project.end_date, project.budget
+    )
+
+
+def _render_project_header(project: Project) -> Dict[str, Any]:
+    """Build a fresh JSON export project header, validated by JsonProjectStructure."""
+    return JsonProjectStructure(
+        id=str(project.id),
+        name=project.name,
+        description=project.description,
+        status=project.status or "active",
+        start_date=project.start_date.isoformat() if project.start_date else None,
+        end_date=project.end_date.isoformat() if project.end_date else None,
+        budget=float(project.budget) if project.budget else None
+    ).model_dump(exclude={'tasks'})
+
+
+@lru_cache(maxsize=128)
+def _render_project_info(
+    project_id: str,
+    updated_at: Optional[datetime],
+    name: str,
+    description: Optional[str],
+    status: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    budget: Optional[Decimal]
+) -> Tuple[Tuple[str, Any], ...]:
+    """Build the Excel export 'Project Info' rows once per project revision."""
+    return (
+        ('Project Name', name),
+        ('Description', description or ''),
+        ('Status', (status or 'active').replace('_', ' ').title()),
+        ('Budget', float(budget) if budget else 0),
+        ('Start Date', _iso(start_date)),
+        ('End Date', _iso(end_date))
+    )
+
 
 class ImportExportService:
     """Service for importing and exporting task/project data."""
 
+    # (column, coercion, value when the column is absent) for DictReader CSV imports
+    _CSV_COLS = (
+        ('id', _csv_text, None),
+        ('name', _csv_text, None),
+        ('description', _csv_text, None),
+        ('status', _csv_text, None),
+        ('progress_percentage', int, 0),
+        ('planned_start_date', _csv_text, None),
+        ('planned_end_date', _csv_text, None),
+        ('planned_duration_days', _csv_opt_int, None),
+        ('budgeted_cost', float, 0),
+        ('assigned_to', _csv_text, None),
+        ('tags', _csv_tags, None)
+    )
+
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
+    async def fetch_task_rows(self, db_session, project_id) -> List[Any]:
+        """
+        Load the exported task columns for a project as plain result rows.
+
+        Rows expose the same attribute names as Task, so the export methods accept
+        them in place of ORM instances without identity-map or instrumentation cost.
+
+        Args:
+            db_session: Database session
+            project_id: Project whose tasks to load
+
+        Returns:
+            Task rows in EXPORT_TASK_COLUMNS order
+        """
+        result = await db_session.execute(
+            select(*EXPORT_TASK_COLUMNS).where(Task.project_id == project_id)
+        )
+        return result.all()
+
     async def import_json_tasks(
         self,
-        json_data: str,
+        json_data: str | bytes,
         project_id: str,
         created_by: str,
         db_session=None
@@ -48,7 +253,7 @@ class ImportExportService:
         Import tasks from JSON structure.
 
         Args:
-            json_data: JSON string containing task data
+            json_data: JSON string or UTF-8 bytes containing task data
             project_id: Target project ID
             created_by: User performing the import
 
@@ -57,7 +262,7 @@ class ImportExportService:
         """
         try:
             # Parse JSON data
-            data = json.loads(json_data)
+            data = _json_loads(json_data)
 
             # Handle both single project structure and task array
             if isinstance(data, dict) and 'tasks' in data:
@@ -110,24 +315,27 @@ class ImportExportService:
         """
         try:
             # Parse CSV
-            csv_reader = csv.DictReader(csv_content.splitlines())
+            rows = list(csv.DictReader(csv_content.splitlines()))
             tasks_data = []
+            parse_errors = []
 
-            for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header
+            for row_num, row in enumerate(rows, start=2):  # Start at 2 to account for header
                 try:
                     # Convert CSV row to JsonTaskStructure
-                    task_data = self._csv_row_to_task_structure(row, row_num)
+                    task_data = self._csv_row_to_task_structure(row, row_num, trusted=bool(tasks_data))
                     tasks_data.append(task_data)
                 except Exception as e:
-                    return ImportResult(
-                        total_records=len(list(csv_reader)) + 1,  # +1 for current row
-                        successful_imports=0,
-                        failed_imports=1,
-                        errors=[{"row": row_num, "field": "parsing", "error": f"Failed to parse row: {str(e)}"}]
+                    parse_errors.append(
+                        {"row": row_num, "field": "parsing", "error": f"Failed to parse row: {str(e)}"}
                     )
 
             # Import tasks
-            return await self._import_task_structures(tasks_data, project_id, created_by, db_session)
+            result = await self._import_task_structures(tasks_data, project_id, created_by, db_session)
+            if parse_errors:
+                result.total_records = len(rows)
+                result.failed_imports += len(parse_errors)
+                result.errors = parse_errors + result.errors
+            return result
 
         except Exception as e:
             logger.error("CSV import failed", error=str(e))
@@ -158,32 +366,52 @@ class ImportExportService:
         Returns:
             Import operation results
         """
-        if not PANDAS_AVAILABLE:
-            logger.warning("Pandas not available, Excel import not supported")
+        if not OPENPYXL_AVAILABLE:
+            logger.warning("openpyxl not available, Excel import not supported")
             return ImportResult(
                 total_records=0,
                 successful_imports=0,
                 failed_imports=1,
-                errors=[{"row": 0, "field": "general", "error": "Excel import requires pandas library"}]
+                errors=[{"row": 0, "field": "general", "error": "Excel import requires openpyxl library"}]
             )
 
-        try:
-            # Read Excel file
-            df = pd.read_excel(excel_content, sheet_name=sheet_name)
+        return await self._import_excel_tasks_streaming(
+            excel_content, project_id, created_by, sheet_name, db_session
+        )
 
-            tasks_data = []
-            for idx, row in df.iterrows():
-                try:
-                    # Convert DataFrame row to JsonTaskStructure
-                    task_data = self._excel_row_to_task_structure(row, idx + 2)  # +2 for header and 0-indexing
-                    tasks_data.append(task_data)
-                except Exception as e:
-                    return ImportResult(
-                        total_records=len(df),
-                        successful_imports=0,
-                        failed_imports=1,
-                        errors=[{"row": idx + 2, "field": "parsing", "error": f"Failed to parse row: {str(e)}"}]
-                    )
+    async def _import_excel_tasks_streaming(
+        self,
+        excel_content: bytes,
+        project_id: str,
+        created_by: str,
+        sheet_name: str,
+        db_session=None
+    ) -> ImportResult:
+        """Import tasks by streaming worksheet rows with openpyxl in read-only mode."""
+        try:
+            workbook = load_workbook(BytesIO(excel_content), read_only=True, data_only=True)
+            try:
+                rows = workbook[sheet_name].iter_rows(values_only=True)
+                headers = next(rows, ())
+                columns = {header: idx for idx, header in enumerate(headers) if header is not None}
+
+                tasks_data = []
+                for row_num, values in enumerate(rows, start=2):  # Start at 2 to account for header
+                    if all(value is None for value in values):
+                        continue
+                    try:
+                        tasks_data.append(self._excel_values_to_task_structure(
+                            values, columns, row_num, trusted=bool(tasks_data)
+                        ))
+                    except Exception as e:
+                        return ImportResult(
+                            total_records=row_num - 1 + sum(1 for _ in rows),
+                            successful_imports=0,
+                            failed_imports=1,
+                            errors=[{"row": row_num, "field": "parsing", "error": f"Failed to parse row: {str(e)}"}]
+                        )
+            finally:
+                workbook.close()
 
             # Import tasks
             return await self._import_task_structures(tasks_data, project_id, created_by, db_session)
@@ -216,40 +444,28 @@ class ImportExportService:
             Export operation results
         """
         try:
-            # Convert tasks to JSON structure
-            json_tasks = []
-            for task in tasks:
-                json_task = self._task_to_json_structure(task, export_request)
-                json_tasks.append(json_task)
-
             # Create project structure if requested
             if export_request.include_subtasks:
-                # Build hierarchy
-                task_dict = {str(task.id): task for task in tasks}
+                # Index children by parent once so each task is visited exactly once
+                task_ids = {str(task.id) for task in tasks}
+                children_by_parent = defaultdict(list)
                 root_tasks = []
-
                 for task in tasks:
-                    if not task.parent_task_id or str(task.parent_task_id) not in task_dict:
+                    if not task.parent_task_id or str(task.parent_task_id) not in task_ids:
                         root_tasks.append(task)
+                    if task.parent_task_id:
+                        children_by_parent[task.parent_task_id].append(task)
 
-                # Recursively build task hierarchy
-                json_tasks = []
-                for root_task in root_tasks:
-                    json_task = self._build_task_hierarchy(root_task, task_dict, export_request)
-                    json_tasks.append(json_task)
+                # Build task hierarchy
+                json_tasks = self._build_task_hierarchy(root_tasks, children_by_parent, export_request)
+            else:
+                # Convert tasks to JSON structure
+                json_tasks = [self._task_to_json_structure(task, export_request) for task in tasks]
 
             # Create export data
             if export_request.include_metadata:
-                export_data = JsonProjectStructure(
-                    id=str(project.id),
-                    name=project.name,
-                    description=project.description,
-                    status=project.status or "active",
-                    start_date=project.start_date.isoformat() if project.start_date else None,
-                    end_date=project.end_date.isoformat() if project.end_date else None,
-                    budget=float(project.budget) if project.budget else None,
-                    tasks=json_tasks
-                )
+                # Tasks hold native values; the serializer handles dates and Decimals
+                export_data = {**_render_project_header(project), "tasks": json_tasks}
             else:
                 export_data = json_tasks
 
@@ -258,9 +474,8 @@ class ImportExportService:
             filename = f"tasks_export_{project.id}_{timestamp}.json"
             filepath = self.data_dir / filename
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data.dict() if hasattr(export_data, 'dict') else export_data,
-                         f, indent=2, ensure_ascii=False)
+            # Serialize and write off the event loop
+            await asyncio.to_thread(self._write_json_file, filepath, export_data)
 
             return ExportResult(
                 filename=filename,
@@ -294,56 +509,20 @@ class ImportExportService:
             Export operation results
         """
         try:
-            # Prepare CSV data
-            csv_data = []
-            headers = [
-                'id', 'name', 'description', 'status', 'progress_percentage',
-                'planned_start_date', 'planned_end_date', 'actual_start_date', 'actual_end_date',
-                'planned_duration_days', 'actual_duration_days', 'estimated_hours', 'actual_hours',
-                'budgeted_cost', 'actual_cost', 'assigned_to', 'parent_task_id',
-                'predecessor_tasks', 'successor_tasks', 'lag_days', 'tags'
-            ]
-
-            for task in tasks:
-                row = {
-                    'id': str(task.id),
-                    'name': task.name,
-                    'description': task.description,
-                    'status': task.status,
-                    'progress_percentage': task.progress_percentage,
-                    'planned_start_date': task.planned_start_date.isoformat() if task.planned_start_date else '',
-                    'planned_end_date': task.planned_end_date.isoformat() if task.planned_end_date else '',
-                    'actual_start_date': task.actual_start_date.isoformat() if task.actual_start_date else '',
-                    'actual_end_date': task.actual_end_date.isoformat() if task.actual_end_date else '',
-                    'planned_duration_days': task.planned_duration_days,
-                    'actual_duration_days': task.actual_duration_days,
-                    'estimated_hours': float(task.estimated_hours) if task.estimated_hours else '',
-                    'actual_hours': float(task.actual_hours) if task.actual_hours else '',
-                    'budgeted_cost': float(task.budgeted_cost),
-                    'actual_cost': float(task.actual_cost),
-                    'assigned_to': str(task.assigned_to) if task.assigned_to else '',
-                    'parent_task_id': str(task.parent_task_id) if task.parent_task_id else '',
-                    'predecessor_tasks': ','.join(str(pid) for pid in (task.predecessor_tasks or [])),
-                    'successor_tasks': ','.join(str(sid) for sid in (task.successor_tasks or [])),
-                    'lag_days': task.lag_days,
-                    'tags': ','.join(task.tags or [])
-                }
-                csv_data.append(row)
-
             # Generate filename and save
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             filename = f"tasks_export_{project.id}_{timestamp}.csv"
+            if export_request.compress:
+                filename += ".gz"
             filepath = self.data_dir / filename
 
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(csv_data)
+            # Write off the event loop
+            await asyncio.to_thread(self._write_csv_file, filepath, tasks, export_request.compress)
 
             return ExportResult(
                 filename=filename,
                 file_path=str(filepath),
-                record_count=len(csv_data),
+                record_count=len(tasks),
                 file_size_bytes=filepath.stat().st_size,
                 generated_at=datetime.utcnow(),
                 format="csv"
@@ -371,69 +550,27 @@ class ImportExportService:
         Returns:
             Export operation results
         """
-        if not PANDAS_AVAILABLE:
-            logger.warning("Pandas not available, Excel export not supported")
-            raise ValueError("Excel export requires pandas library")
+        if not XLSXWRITER_AVAILABLE and not PANDAS_AVAILABLE:
+            logger.warning("Neither xlsxwriter nor pandas available, Excel export not supported")
+            raise ValueError("Excel export requires xlsxwriter or pandas library")
 
         try:
-            # Prepare data for Excel
-            excel_data = []
-            for task in tasks:
-                row = {
-                    'ID': str(task.id),
-                    'Name': task.name,
-                    'Description': task.description,
-                    'Status': task.status.replace('_', ' ').title(),
-                    'Progress %': task.progress_percentage,
-                    'Planned Start': task.planned_start_date,
-                    'Planned End': task.planned_end_date,
-                    'Actual Start': task.actual_start_date,
-                    'Actual End': task.actual_end_date,
-                    'Planned Duration (Days)': task.planned_duration_days,
-                    'Actual Duration (Days)': task.actual_duration_days,
-                    'Estimated Hours': float(task.estimated_hours) if task.estimated_hours else None,
-                    'Actual Hours': float(task.actual_hours) if task.actual_hours else None,
-                    'Budgeted Cost': float(task.budgeted_cost),
-                    'Actual Cost': float(task.actual_cost),
-                    'Assigned To': str(task.assigned_to) if task.assigned_to else None,
-                    'Parent Task': str(task.parent_task_id) if task.parent_task_id else None,
-                    'Predecessors': ', '.join(str(pid) for pid in (task.predecessor_tasks or [])),
-                    'Successors': ', '.join(str(sid) for sid in (task.successor_tasks or [])),
-                    'Lag Days': task.lag_days,
-                    'Tags': ', '.join(task.tags or [])
-                }
-                excel_data.append(row)
-
-            # Create DataFrame and save to Excel
-            df = pd.DataFrame(excel_data)
-
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             filename = f"tasks_export_{project.id}_{timestamp}.xlsx"
             filepath = self.data_dir / filename
 
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Tasks', index=False)
-
-                # Add project info sheet
-                project_info = {
-                    'Field': ['Project Name', 'Description', 'Status', 'Budget', 'Start Date', 'End Date', 'Total Tasks'],
-                    'Value': [
-                        project.name,
-                        project.description or '',
-                        (project.status or 'active').replace('_', ' ').title(),
-                        float(project.budget) if project.budget else 0,
-                        project.start_date.isoformat() if project.start_date else '',
-                        project.end_date.isoformat() if project.end_date else '',
-                        len(tasks)
-                    ]
-                }
-                project_df = pd.DataFrame(project_info)
-                project_df.to_excel(writer, sheet_name='Project Info', index=False)
+            id_strs = _IdStrings()
+            task_rows = (self._task_to_excel_row(task, id_strs) for task in tasks)
+            project_info = [*_render_project_info(*_project_header_key(project)), ('Total Tasks', len(tasks))]
+
+            # Write off the event loop
+            write_excel = self._write_excel_streaming if XLSXWRITER_AVAILABLE else self._write_excel_pandas
+            await asyncio.to_thread(write_excel, filepath, task_rows, project_info)
 
             return ExportResult(
                 filename=filename,
                 file_path=str(filepath),
-                record_count=len(excel_data),
+                record_count=len(tasks),
                 file_size_bytes=filepath.stat().st_size,
                 generated_at=datetime.utcnow(),
                 format="excel"
@@ -443,6 +580,65 @@ class ImportExportService:
             logger.error("Excel export failed", error=str(e))
             raise
 
+    def _write_json_file(self, filepath: Path, export_data: Any) -> None:
+        """Serialize export data and write it to disk (blocking; run in a worker thread)."""
+        filepath.write_bytes(_json_dumps(export_data))
+
+    def _write_csv_file(self, filepath: Path, tasks: List[Task], compress: bool) -> None:
+        """Write tasks as CSV, optionally gzip-compressed (blocking; run in a worker thread)."""
+        # Stream rows straight from the tasks into a large write buffer; no intermediate row list
+        if compress:
+            output = gzip.open(filepath, 'wt', compresslevel=1, newline='', encoding='utf-8')
+        else:
+            output = open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER_SIZE)
+
+        with output as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_EXPORT_HEADERS)
+            id_strs = _IdStrings()
+            writer.writerows(self._task_to_csv_row(task, id_strs) for task in tasks)
+
+    def _write_excel_pandas(
+        self,
+        filepath: Path,
+        task_rows: Iterable[Tuple[Any, ...]],
+        project_info: List[Tuple[str, Any]]
+    ) -> None:
+        """Write the export workbook through pandas and openpyxl (blocking; run in a worker thread)."""
+        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+            df = pd.DataFrame.from_records(list(task_rows), columns=EXCEL_EXPORT_HEADERS)
+            df.to_excel(writer, sheet_name='Tasks', index=False)
+
+            # Add project info sheet
+            project_df = pd.DataFrame.from_records(project_info, columns=('Field', 'Value'))
+            project_df.to_excel(writer, sheet_name='Project Info', index=False)
+
+    def _write_excel_streaming(
+        self,
+        filepath: Path,
+        task_rows: Iterable[Tuple[Any, ...]],
+        project_info: List[Tuple[str, Any]]
+    ) -> None:
+        """Write the export workbook row by row with xlsxwriter in constant-memory mode."""
+        workbook = xlsxwriter.Workbook(str(filepath), {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd',
+            'strings_to_formulas': False,
+            'strings_to_urls': False
+        })
+        try:
+            sheets = (
+                ('Tasks', EXCEL_EXPORT_HEADERS, task_rows),
+                ('Project Info', ('Field', 'Value'), project_info)
+            )
+            for sheet_name, headers, rows in sheets:
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, headers)
+                for row_idx, values in enumerate(rows, start=1):
+                    worksheet.write_row(row_idx, 0, values)
+        finally:
+            workbook.close()
+
     async def _import_task_structures(
         self,
         tasks_data: List[JsonTaskStructure],
@@ -450,142 +646,265 @@ class ImportExportService:
         created_by: str,
         db_session=None
     ) -> ImportResult:
-        """Import task structures into the database."""
-        total_records = len(tasks_data)
-        successful_imports = 0
-        failed_imports = 0
+        """Import task structures into the database using batched inserts."""
         errors = []
         warnings = []
-        created_ids = []
 
-        # Track task ID mappings for dependencies
+        # Flatten the hierarchy depth-first so every parent precedes its subtasks
+        flat: List[Tuple[JsonTaskStructure, Optional[int]]] = []
+        pending = [(task_data, None) for task_data in reversed(tasks_data)]
+        while pending:
+            task_data, parent_idx = pending.pop()
+            position = len(flat)
+            flat.append((task_data, parent_idx))
+            pending.extend((subtask, position) for subtask in reversed(task_data.subtasks or ()))
+
+        total_records = len(flat)
+        if db_session is None:
+            return ImportResult(
+                total_records=total_records,
+                successful_imports=0,
+                failed_imports=total_records,
+                errors=[{"row": 0, "field": "general", "error": "Task import requires a database session"}]
+            )
+
+        # Pre-generate IDs so parents and dependencies can be remapped before inserting
+        new_ids = [str(uuid.uuid4()) for _ in flat]
         id_mapping = {}  # old_id -> new_id
+        for (task_data, _), new_id in zip(flat, new_ids, strict=True):
+            if task_data.id:
+                id_mapping.setdefault(task_data.id, new_id)
 
-        for idx, task_data in enumerate(tasks_data):
-            try:
-                # Convert JSON structure to TaskCreate
-                task_create_data = self._json_task_to_task_create(task_data, project_id, created_by)
-
-                # Handle ID mapping for dependencies
-                if task_data.id:
-                    id_mapping[task_data.id] = str(uuid.uuid4())  # Generate new ID
-                    task_create_data.id = id_mapping[task_data.id]
-
-                # Create task
-                from ..services.task_service import TaskService
-                task_service = TaskService()
-                task = await task_service.create_task(task_create_data, project_id, created_by, db_session)
-
-                created_ids.append(str(task.id))
-                successful_imports += 1
-
-                # Handle subtasks recursively
-                if task_data.subtasks:
-                    subtask_result = await self._import_task_structures(
-                        task_data.subtasks, project_id, created_by, db_session
-                    )
-                    successful_imports += subtask_result.successful_imports
-                    failed_imports += subtask_result.failed_imports
-                    errors.extend(subtask_result.errors)
-                    created_ids.extend(subtask_result.created_ids)
+        # The import writes through the Core table, so its lookups read through it too
+        tasks_table = Task.__table__
+
+        # Look up existing parents referenced by the import, with their child counts, in one query
+        external_parents = {
+            str(task_data.parent_task_id) for task_data, parent_idx in flat
+            if parent_idx is None and task_data.parent_task_id and task_data.parent_task_id not in id_mapping
+        }
+        parent_info: Dict[str, Tuple[int, Optional[str]]] = {}  # parent id -> (level, wbs_code)
+        external_child_counts: Dict[str, int] = {}
+        if external_parents:
+            children = tasks_table.alias()
+            child_count = (
+                select(func.count(children.c.id))
+                .where(children.c.parent_task_id == tasks_table.c.id, children.c.project_id == project_id)
+                .scalar_subquery()
+            )
+            parent_result = await db_session.execute(
+                select(tasks_table.c.id, tasks_table.c.level, tasks_table.c.wbs_code, child_count)
+                .where(tasks_table.c.id.in_(external_parents))
+            )
+            for task_id, level, wbs_code, sibling_count in parent_result.all():
+                parent_info[str(task_id)] = (level, wbs_code)
+                external_child_counts[str(task_id)] = sibling_count
 
+        root_count_result = await db_session.execute(
+            select(func.count(tasks_table.c.id))
+            .where(tasks_table.c.project_id == project_id, tasks_table.c.parent_task_id.is_(None))
+        )
+        root_count = root_count_result.scalar() or 0
+
+        task_rows = []
+        row_numbers = []
+        levels = [1] * total_records
+        wbs_codes: List[Optional[str]] = [None] * total_records
+        child_counts = defaultdict(int)
+        failed = set()
+
+        for idx, (task_data, parent_idx) in enumerate(flat):
+            if parent_idx in failed:
+                failed.add(idx)
+                errors.append({
+                    "row": idx + 1,
+                    "field": "parent_task_id",
+                    "error": f"Failed to import task '{task_data.name}': parent task was not imported"
+                })
+                continue
+
+            try:
+                row = self._json_task_to_task_create(task_data, project_id, created_by)
             except Exception as e:
-                failed_imports += 1
+                failed.add(idx)
                 errors.append({
                     "row": idx + 1,
                     "field": "general",
                     "error": f"Failed to import task '{task_data.name}': {str(e)}"
                 })
+                continue
+
+            if parent_idx is not None:
+                parent_task_id = new_ids[parent_idx]
+                levels[idx] = levels[parent_idx] + 1
+                child_counts[parent_idx] += 1
+                if wbs_codes[parent_idx]:
+                    wbs_codes[idx] = f"{wbs_codes[parent_idx]}.{child_counts[parent_idx]}"
+            elif task_data.parent_task_id:
+                parent_task_id = id_mapping.get(task_data.parent_task_id, task_data.parent_task_id)
+                parent_level, parent_wbs = parent_info.get(str(parent_task_id), (0, None))
+                levels[idx] = parent_level + 1
+                if parent_wbs:
+                    external_child_counts[str(parent_task_id)] += 1
+                    wbs_codes[idx] = f"{parent_wbs}.{external_child_counts[str(parent_task_id)]}"
+            else:
+                parent_task_id = None
+                root_count += 1
+                wbs_codes[idx] = str(root_count)
+
+            row.update(
+                id=new_ids[idx],
+                parent_task_id=parent_task_id,
+                level=levels[idx],
+                wbs_code=wbs_codes[idx],
+                created_by=created_by,
+                predecessor_tasks=[id_mapping.get(t, t) for t in row["predecessor_tasks"] or ()],
+                successor_tasks=[id_mapping.get(t, t) for t in row["successor_tasks"] or ()],
+                tags=row["tags"] or [],
+                custom_fields=row["custom_fields"] or {}
+            )
+            task_rows.append(row)
+            row_numbers.append(idx + 1)
+
+        insert_errors = await self._insert_in_batches(db_session, tasks_table, task_rows, row_numbers)
+        failed_rows = {error["row"] for error in insert_errors}
+        errors.extend(insert_errors)
+
+        created_rows = [row for row, row_number in zip(task_rows, row_numbers, strict=True) if row_number not in failed_rows]
+        created_ids = [row["id"] for row in created_rows]
+        dependency_rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "predecessor_id": predecessor_id,
+                "successor_id": row["id"],
+                "lag_days": row["lag_days"] or 0
+            }
+            for row in created_rows
+            for predecessor_id in row["predecessor_tasks"]
+        ]
+
+        if dependency_rows:
+            dependency_errors = await self._insert_in_batches(
+                db_session, TaskDependency.__table__, dependency_rows, list(range(1, len(dependency_rows) + 1))
+            )
+            warnings.extend(f"Skipped dependency: {error['error']}" for error in dependency_errors)
+
+        await db_session.commit()
 
+        successful_imports = len(created_ids)
         return ImportResult(
             total_records=total_records,
             successful_imports=successful_imports,
-            failed_imports=failed_imports,
+            failed_imports=total_records - successful_imports,
             errors=errors,
             warnings=warnings,
             created_ids=created_ids
         )
 
-    def _csv_row_to_task_structure(self, row: Dict[str, Any], row_num: int) -> JsonTaskStructure:
+    async def _insert_in_batches(
+        self,
+        db_session,
+        table,
+        rows: List[Dict[str, Any]],
+        row_numbers: List[int]
+    ) -> List[Dict[str, Any]]:
+        """Insert rows in IMPORT_BATCH_SIZE chunks, retrying a failed chunk row by row."""
+        errors = []
+        statement = table.insert()
+
+        for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+            batch = rows[start:start + IMPORT_BATCH_SIZE]
+            try:
+                async with db_session.begin_nested():
+                    await db_session.execute(statement, batch)
+                continue
+            except Exception as e:
+                logger.warning("Batch insert failed, retrying rows individually", table=table.name, error=str(e))
+
+            for row, row_number in zip(batch, row_numbers[start:start + IMPORT_BATCH_SIZE], strict=True):
+                try:
+                    async with db_session.begin_nested():
+                        await db_session.execute(statement, [row])
+                except Exception as e:
+                    errors.append({
+                        "row": row_number,
+                        "field": "general",
+                        "error": f"Failed to insert '{row.get('name', row['id'])}': {str(e)}"
+                    })
+
+        return errors
+
+    def _build_task_structure(self, fields: Dict[str, Any], trusted: bool = False) -> JsonTaskStructure:
+        """Build JsonTaskStructure from coerced fields, skipping validation for trusted rows."""
+        # Importers coerce each field themselves; once the first row has passed
+        # full validation the rest can skip pydantic's validator pipeline.
+        if trusted:
+            return JsonTaskStructure.model_construct(**fields)
+        return JsonTaskStructure(**fields)
+
+    def _csv_row_to_task_structure(self, row: Dict[str, Any], row_num: int, trusted: bool = False) -> JsonTaskStructure:
         """Convert CSV row to JsonTaskStructure."""
         # Map CSV columns to task structure
-        return JsonTaskStructure(
-            id=row.get('id'),
-            name=row.get('name', f'Imported Task {row_num}'),
-            description=row.get('description'),
-            status=row.get('status', 'not_started'),
-            progress_percentage=int(row.get('progress_percentage', 0)),
-            planned_start_date=row.get('planned_start_date'),
-            planned_end_date=row.get('planned_end_date'),
-            planned_duration_days=int(row.get('planned_duration_days', 0)) if row.get('planned_duration_days') else None,
-            budgeted_cost=float(row.get('budgeted_cost', 0)),
-            assigned_to=row.get('assigned_to'),
-            tags=row.get('tags', '').split(',') if row.get('tags') else []
-        )
+        fields = {column: coerce(row.get(column, default)) for column, coerce, default in self._CSV_COLS}
+        fields['name'] = fields['name'] or f'Imported Task {row_num}'
+        fields['status'] = fields['status'] or 'not_started'
+        return self._build_task_structure(fields, trusted)
 
-    def _excel_row_to_task_structure(self, row, row_num: int) -> JsonTaskStructure:
-        """Convert Excel row to JsonTaskStructure."""
-        # This method should only be called when pandas is available
-        if not PANDAS_AVAILABLE:
-            raise ValueError("Excel functionality requires pandas")
-
-        return JsonTaskStructure(
-            id=str(row.get('ID')) if pd.notna(row.get('ID')) else None,
-            name=str(row.get('Name', f'Imported Task {row_num}')),
-            description=str(row.get('Description')) if pd.notna(row.get('Description')) else None,
-            status=str(row.get('Status', 'not_started')).lower().replace(' ', '_'),
-            progress_percentage=int(row.get('Progress %', 0)),
-            planned_start_date=str(row.get('Planned Start')) if pd.notna(row.get('Planned Start')) else None,
-            planned_end_date=str(row.get('Planned End')) if pd.notna(row.get('Planned End')) else None,
-            planned_duration_days=int(row.get('Planned Duration (Days)')) if pd.notna(row.get('Planned Duration (Days)')) else None,
-            budgeted_cost=float(row.get('Budgeted Cost', 0)),
-            assigned_to=str(row.get('Assigned To')) if pd.notna(row.get('Assigned To')) else None,
-            tags=str(row.get('Tags', '')).split(', ') if pd.notna(row.get('Tags')) else []
-        )
+    def _excel_values_to_task_structure(
+        self,
+        values: Tuple[Any, ...],
+        columns: Dict[str, int],
+        row_num: int,
+        trusted: bool = False
+    ) -> JsonTaskStructure:
+        """Convert a worksheet row tuple to JsonTaskStructure using header positions."""
+        def cell(header: str) -> Any:
+            idx = columns.get(header)
+            return values[idx] if idx is not None and idx < len(values) else None
+
+        def date_cell(header: str) -> Optional[str]:
+            value = cell(header)
+            if value is None:
+                return None
+            if isinstance(value, datetime):
+                return value.date().isoformat()
+            if isinstance(value, date):
+                return value.isoformat()
+            return str(value)
+
+        task_id = cell('ID')
+        name = cell('Name')
+        description = cell('Description')
+        status = cell('Status')
+        duration = cell('Planned Duration (Days)')
+        assigned_to = cell('Assigned To')
+        tags = cell('Tags')
+
+        return self._build_task_structure(dict(
+            id=str(task_id) if task_id is not None else None,
+            name=str(name) if name is not None else f'Imported Task {row_num}',
+            description=str(description) if description is not None else None,
+            status=str(status or 'not_started').lower().replace(' ', '_'),
+            progress_percentage=int(cell('Progress %') or 0),
+            planned_start_date=date_cell('Planned Start'),
+            planned_end_date=date_cell('Planned End'),
+            planned_duration_days=int(duration) if duration is not None else None,
+            budgeted_cost=float(cell('Budgeted Cost') or 0),
+            assigned_to=str(assigned_to) if assigned_to is not None else None,
+            tags=str(tags).split(', ') if tags is not None else []
+        ), trusted)
 
     def _json_task_to_task_create(self, json_task: JsonTaskStructure, project_id: str, created_by: str) -> Dict[str, Any]:
         """Convert JsonTaskStructure to TaskCreate data."""
-        from ..schemas.task import TaskCreate
-
-        # Parse dates
-        planned_start = None
-        planned_end = None
-        actual_start = None
-        actual_end = None
-
-        if json_task.planned_start_date:
-            try:
-                planned_start = date.fromisoformat(json_task.planned_start_date)
-            except:
-                planned_start = None
-
-        if json_task.planned_end_date:
-            try:
-                planned_end = date.fromisoformat(json_task.planned_end_date)
-            except:
-                planned_end = None
-
-        if json_task.actual_start_date:
-            try:
-                actual_start = date.fromisoformat(json_task.actual_start_date)
-            except:
-                actual_start = None
-
-        if json_task.actual_end_date:
-            try:
-                actual_end = date.fromisoformat(json_task.actual_end_date)
-            except:
-                actual_end = None
-
         return {
             "project_id": project_id,
             "name": json_task.name,
             "description": json_task.description,
             "task_code": json_task.task_code,
-            "planned_start_date": planned_start,
-            "planned_end_date": planned_end,
-            "actual_start_date": actual_start,
-            "actual_end_date": actual_end,
+            "planned_start_date": _parse_date(json_task.planned_start_date),
+            "planned_end_date": _parse_date(json_task.planned_end_date),
+            "actual_start_date": _parse_date(json_task.actual_start_date),
+            "actual_end_date": _parse_date(json_task.actual_end_date),
             "planned_duration_days": json_task.planned_duration_days,
             "actual_duration_days": json_task.actual_duration_days,
             "progress_percentage": json_task.progress_percentage,
@@ -603,44 +922,109 @@ class ImportExportService:
             "custom_fields": json_task.custom_fields
         }
 
+    def _task_to_excel_row(self, task: Task, id_strs: Dict[Any, str]) -> Tuple[Any, ...]:
+        """Convert Task to an Excel row in EXCEL_EXPORT_HEADERS order."""
+        return (
+            id_strs[task.id],
+            task.name,
+            task.description,
+            task.status.replace('_', ' ').title(),
+            task.progress_percentage,
+            task.planned_start_date,
+            task.planned_end_date,
+            task.actual_start_date,
+            task.actual_end_date,
+            task.planned_duration_days,
+            task.actual_duration_days,
+            float(task.estimated_hours) if task.estimated_hours else None,
+            float(task.actual_hours) if task.actual_hours else None,
+            float(task.budgeted_cost),
+            float(task.actual_cost),
+            id_strs[task.assigned_to] if task.assigned_to else None,
+            id_strs[task.parent_task_id] if task.parent_task_id else None,
+            ', '.join(map(id_strs.__getitem__, task.predecessor_tasks or ())),
+            ', '.join(map(id_strs.__getitem__, task.successor_tasks or ())),
+            task.lag_days,
+            ', '.join(task.tags or [])
+        )
+
+    def _task_to_csv_row(self, task: Task, id_strs: Dict[Any, str]) -> Tuple[Any, ...]:
+        """Convert Task to a CSV row in CSV_EXPORT_HEADERS order."""
+        return (
+            id_strs[task.id],
+            task.name,
+            task.description,
+            task.status,
+            task.progress_percentage,
+            _iso(task.planned_start_date),
+            _iso(task.planned_end_date),
+            _iso(task.actual_start_date),
+            _iso(task.actual_end_date),
+            task.planned_duration_days,
+            task.actual_duration_days,
+            float(task.estimated_hours) if task.estimated_hours else '',
+            float(task.actual_hours) if task.actual_hours else '',
+            float(task.budgeted_cost),
+            float(task.actual_cost),
+            id_strs[task.assigned_to] if task.assigned_to else '',
+            id_strs[task.parent_task_id] if task.parent_task_id else '',
+            ','.join(map(id_strs.__getitem__, task.predecessor_tasks or ())),
+            ','.join(map(id_strs.__getitem__, task.successor_tasks or ())),
+            task.lag_days,
+            ','.join(task.tags or [])
+        )
+
     def _task_to_json_structure(self, task: Task, export_request: ImportExportRequest) -> Dict[str, Any]:
-        """Convert Task to JSON structure for export."""
+        """
+        Convert Task to JSON structure for export, with every JsonTaskStructure key.
+
+        Values keep their native types (UUID, date, Decimal); _json_dumps serializes
+        them, natively under orjson and through _json_default otherwise.
+        """
         return {
-            "id": str(task.id),
+            "id": task.id,
             "name": task.name,
             "description": task.description,
             "task_code": task.task_code,
             "status": task.status,
             "progress_percentage": task.progress_percentage,
-            "planned_start_date": task.planned_start_date.isoformat() if task.planned_start_date else None,
-            "planned_end_date": task.planned_end_date.isoformat() if task.planned_end_date else None,
-            "actual_start_date": task.actual_start_date.isoformat() if task.actual_start_date else None,
-            "actual_end_date": task.actual_end_date.isoformat() if task.actual_end_date else None,
+            "priority": None,
+            "planned_start_date": task.planned_start_date,
+            "planned_end_date": task.planned_end_date,
+            "actual_start_date": task.actual_start_date,
+            "actual_end_date": task.actual_end_date,
             "planned_duration_days": task.planned_duration_days,
             "actual_duration_days": task.actual_duration_days,
-            "estimated_hours": float(task.estimated_hours) if task.estimated_hours else None,
-            "actual_hours": float(task.actual_hours) if task.actual_hours else None,
-            "budgeted_cost": float(task.budgeted_cost),
-            "actual_cost": float(task.actual_cost),
-            "assigned_to": str(task.assigned_to) if task.assigned_to else None,
-            "parent_task_id": str(task.parent_task_id) if task.parent_task_id else None,
-            "predecessor_tasks": [str(pid) for pid in (task.predecessor_tasks or [])],
-            "successor_tasks": [str(sid) for sid in (task.successor_tasks or [])],
+            "estimated_hours": task.estimated_hours,
+            "actual_hours": task.actual_hours,
+            "budgeted_cost": task.budgeted_cost,
+            "actual_cost": task.actual_cost,
+            "parent_task_id": task.parent_task_id,
+            "predecessor_tasks": task.predecessor_tasks or [],
+            "successor_tasks": task.successor_tasks or [],
             "lag_days": task.lag_days,
+            "assigned_to": task.assigned_to,
             "tags": task.tags or [],
-            "custom_fields": task.custom_fields or {}
+            "custom_fields": task.custom_fields or {},
+            "subtasks": [],
+            "dependencies": []
         }
 
-    def _build_task_hierarchy(self, task: Task, task_dict: Dict[str, Task], export_request: ImportExportRequest) -> Dict[str, Any]:
-        """Build hierarchical task structure for export."""
-        json_task = self._task_to_json_structure(task, export_request)
-
-        # Add subtasks
-        if export_request.include_subtasks:
-            subtasks = []
-            for task_id, t in task_dict.items():
-                if t.parent_task_id == task.id:
-                    subtasks.append(self._build_task_hierarchy(t, task_dict, export_request))
-            json_task["subtasks"] = subtasks
-
-        return json_task
+    def _build_task_hierarchy(
+        self,
+        root_tasks: List[Task],
+        children_by_parent: Dict[Any, List[Task]],
+        export_request: ImportExportRequest
+    ) -> List[Dict[str, Any]]:
+        """Build hierarchical task structures for export without recursing per level."""
+        json_tasks: List[Dict[str, Any]] = []
+        stack = [(task, json_tasks) for task in reversed(root_tasks)]
+
+        # Depth-first with an explicit stack keeps sibling order and handles any nesting depth
+        while stack:
+            task, siblings = stack.pop()
+            json_task = self._task_to_json_structure(task, export_request)
+            siblings.append(json_task)
+            stack.extend((child, json_task["subtasks"]) for child in reversed(children_by_parent.get(task.id, ())))
+
+        return json_tasks
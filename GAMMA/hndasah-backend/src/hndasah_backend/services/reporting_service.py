@@ -3,48 +3,34 @@ Reporting Service for WhatsApp PM System v3.0 (Gamma)
 PDF report generation using ReportLab for tasks, projects, and EVM analytics
 """
 
-import os
+import asyncio
+import importlib.util
+import math
+from collections import defaultdict, namedtuple
+from functools import cache, lru_cache
+from io import BytesIO
+from operator import attrgetter
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Iterator, NamedTuple, Optional, Tuple
 from uuid import UUID
 import structlog
-from decimal import Decimal
 from pathlib import Path
 
-# Optional ReportLab imports
+# Optional ReportLab dependency. Only its presence is checked at import; the
+# modules themselves are imported by the functions that build and render reports.
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+if TYPE_CHECKING:
+    from reportlab.lib.styles import StyleSheet1
+    from reportlab.platypus import Flowable, TableStyle
+
+# Optional NumPy import for vectorised task aggregation
 try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-        PageBreak, Image, Flowable
-    )
-    from reportlab.platypus.flowables import HRFlowable
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-    REPORTLAB_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
 except ImportError:
-    # Fallback when ReportLab is not available
-    colors = None
-    letter = None
-    A4 = None
-    getSampleStyleSheet = None
-    ParagraphStyle = None
-    inch = None
-    SimpleDocTemplate = None
-    Paragraph = None
-    Spacer = None
-    Table = None
-    TableStyle = None
-    PageBreak = None
-    Image = None
-    Flowable = None
-    HRFlowable = None
-    TA_LEFT = None
-    TA_CENTER = None
-    TA_RIGHT = None
-    REPORTLAB_AVAILABLE = False
+    np = None
+    NUMPY_AVAILABLE = False
 
 from ..models.sqlalchemy.task import Task
 from ..models.sqlalchemy.project import Project
@@ -56,69 +42,286 @@ from ..schemas.task import (
 logger = structlog.get_logger(__name__)
 
 
+def _draw_page_footer(canvas, doc) -> None:
+    """Draw the page number in the bottom margin of each report page."""
+    from reportlab.lib import colors
+
+    canvas.saveState()
+    canvas.setFont('Helvetica', 8)
+    canvas.setFillColor(colors.grey)
+    canvas.drawRightString(doc.leftMargin + doc.width, doc.bottomMargin / 2, f"Page {doc.page}")
+    canvas.restoreState()
+
+
+def _render_pdf(filepath: str, story: List[Any]) -> int:
+    """Render a report story to a PDF file and return its size in bytes."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate
+
+    # Render in memory and write the finished document with a single write call
+    buffer = BytesIO()
+    doc = BaseDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72,
+        # Always zlib-compress page streams, whatever the site rl_config default
+        pageCompression=1
+    )
+
+    # One frame and page template for every page, with the footer drawn per page
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='main')
+    doc.addPageTemplates([PageTemplate(id='main', frames=[frame], onPage=_draw_page_footer)])
+    doc.build(story)
+
+    # The size comes from the rendered buffer, so no stat() is needed afterwards
+    with buffer.getbuffer() as pdf, open(filepath, 'wb') as f:
+        f.write(pdf)
+        return pdf.nbytes
+
+
+# Plain snapshot of the Task columns the report sections read
+_TaskRow = namedtuple('_TaskRow', (
+    'name', 'status', 'progress_percentage', 'budgeted_cost', 'actual_cost',
+    'planned_start_date', 'planned_end_date', 'is_critical_path', 'planned_duration_days'
+))
+_TASK_ROW_FIELDS = attrgetter(*_TaskRow._fields)
+
+
+def _snapshot_tasks(tasks: List[Task]) -> List[_TaskRow]:
+    """Copy task columns out of the ORM objects once so sections skip instrumented attribute access."""
+    return [_TaskRow(*_TASK_ROW_FIELDS(t)) for t in tasks]
+
+
+def _group_by_status(tasks: List[_TaskRow]) -> Dict[str, List[_TaskRow]]:
+    """Group task rows by raw status, in order of first appearance."""
+    by_status = defaultdict(list)
+    for t in tasks:
+        by_status[t.status].append(t)
+    return by_status
+
+
+def _fmt_money(value: Any) -> str:
+    """Format a monetary amount as dollars with thousands separators."""
+    return f"${float(value or 0):,.2f}"
+
+
+def _fmt_date(value: Optional[date]) -> str:
+    """Format a date as YYYY-MM-DD, or 'N/A' when unset."""
+    return value.strftime('%Y-%m-%d') if value else 'N/A'
+
+
+def _progress_buckets_np(progress):
+    """Count integer progress values into the 0-25, 26-50, 51-75 and 76-100 buckets."""
+    return np.bincount(np.clip((progress - 1) // 25, 0, 3), minlength=4)
+
+
+def _progress_buckets_py(progress):
+    """Loop form of _progress_buckets_np, written for Numba compilation."""
+    counts = np.zeros(4, dtype=np.int64)
+    for v in progress:
+        if v <= 25:
+            counts[0] += 1
+        elif v <= 50:
+            counts[1] += 1
+        elif v <= 75:
+            counts[2] += 1
+        else:
+            counts[3] += 1
+    return counts
+
+
+_progress_kernel = None
+
+
+def _get_progress_kernel():
+    """Return the Numba-compiled progress bucketing kernel, or the bincount version without Numba."""
+    global _progress_kernel
+    if _progress_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _progress_kernel = _progress_buckets_np
+        else:
+            _progress_kernel = njit(cache=True)(_progress_buckets_py)
+    return _progress_kernel
+
+
+@lru_cache(maxsize=64)
+def _pretty(value: str) -> str:
+    """Turn a snake_case status into a title-cased label, e.g. 'in_progress' -> 'In Progress'."""
+    return value.replace('_', ' ').title()
+
+
+class _TableLayout(NamedTuple):
+    """Column widths and style of one kind of report table."""
+    col_widths: Tuple[float, ...]
+    style: "TableStyle"
+
+
+class _ReportStyles(NamedTuple):
+    """Paragraph styles and table layouts shared by every report."""
+    paragraph: "StyleSheet1"
+    task_metrics: _TableLayout
+    task_details: _TableLayout
+    status: _TableLayout
+    evm_status: _TableLayout
+    dashboard: _TableLayout
+    task_evm: _TableLayout
+    summary: _TableLayout
+    evm: _TableLayout
+
+
+@cache
+def _report_styles() -> _ReportStyles:
+    """
+    Build the ReportLab styles shared by all reports, once per process.
+
+    Paragraph styles, table styles and column widths are never modified after
+    they are built, so every report can use the same instances.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+
+    # Custom styles
+    styles.add(ParagraphStyle(
+        name='ReportTitle',
+        parent=styles['Title'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.darkblue
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=20,
+        textColor=colors.darkblue,
+        borderColor=colors.darkblue,
+        borderWidth=1,
+        borderPadding=5
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SubSectionHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=15,
+        textColor=colors.darkgreen
+    ))
+
+    styles.add(ParagraphStyle(
+        name='MetricValue',
+        parent=styles['Normal'],
+        fontSize=12,
+        fontName='Helvetica-Bold',
+        textColor=colors.darkred
+    ))
+
+    styles.add(ParagraphStyle(
+        name='TableCaption',
+        parent=styles['Normal'],
+        fontSize=10,
+        alignment=TA_CENTER,
+        spaceAfter=10,
+        textColor=colors.grey
+    ))
+
+    metrics_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ])
+    task_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+    status_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+    dashboard_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+    task_evm_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+    summary_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+    evm_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgreen),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+
+    return _ReportStyles(
+        paragraph=styles,
+        task_metrics=_TableLayout((2*inch, 2*inch), metrics_style),
+        task_details=_TableLayout((1.5*inch, 1*inch, 0.8*inch, 1*inch, 1*inch, 1*inch, 1*inch), task_style),
+        status=_TableLayout((2*inch, 1*inch, 1*inch), status_style),
+        evm_status=_TableLayout((2*inch, 1.5*inch, 1.5*inch), metrics_style),
+        dashboard=_TableLayout((2*inch, 1.5*inch, 3*inch), dashboard_style),
+        task_evm=_TableLayout((2*inch, 0.8*inch, 1*inch, 1*inch, 1*inch), task_evm_style),
+        summary=_TableLayout((1.5*inch, 1*inch, 1*inch), summary_style),
+        evm=_TableLayout((2.5*inch, 1.5*inch), evm_style)
+    )
+
+
 class ReportingService:
     """Service for generating PDF reports using ReportLab."""
 
     def __init__(self, reports_dir: str = "reports"):
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(exist_ok=True)
-        self.styles = self._setup_styles()
-
-    def _setup_styles(self) -> Dict[str, Any]:
-        """Setup ReportLab styles for consistent formatting."""
-        if not REPORTLAB_AVAILABLE:
+        if REPORTLAB_AVAILABLE:
+            self.styles = _report_styles().paragraph
+        else:
             logger.warning("ReportLab not available, using fallback styles")
-            return {}
-
-        styles = getSampleStyleSheet()
-
-        # Custom styles
-        styles.add(ParagraphStyle(
-            name='ReportTitle',
-            parent=styles['Title'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        ))
-
-        styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceAfter=20,
-            textColor=colors.darkblue,
-            borderColor=colors.darkblue,
-            borderWidth=1,
-            borderPadding=5
-        ))
-
-        styles.add(ParagraphStyle(
-            name='SubSectionHeader',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=15,
-            textColor=colors.darkgreen
-        ))
-
-        styles.add(ParagraphStyle(
-            name='MetricValue',
-            parent=styles['Normal'],
-            fontSize=12,
-            fontName='Helvetica-Bold',
-            textColor=colors.darkred
-        ))
-
-        styles.add(ParagraphStyle(
-            name='TableCaption',
-            parent=styles['Normal'],
-            fontSize=10,
-            alignment=TA_CENTER,
-            spaceAfter=10,
-            textColor=colors.grey
-        ))
-
-        return styles
+            self.styles = {}
 
     async def generate_task_report(
         self,
@@ -138,59 +341,12 @@ class ReportingService:
         Returns:
             Report generation result
         """
-        if not REPORTLAB_AVAILABLE:
-            logger.warning("ReportLab not available, cannot generate PDF reports")
-            raise ValueError("PDF report generation requires ReportLab library")
-
-        try:
-            # Generate unique filename
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"task_report_{project.id}_{timestamp}.pdf"
-            filepath = self.reports_dir / filename
-
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-
-            # Build report content
-            story = []
-
-            # Title page
-            story.extend(self._build_title_page(project, "Task Report", report_request))
-
-            # Executive summary
-            story.extend(self._build_task_executive_summary(tasks, project))
-
-            # Task details table
-            story.extend(self._build_task_details_table(tasks))
-
-            # Task status breakdown
-            story.extend(self._build_task_status_charts(tasks))
-
-            # Critical path analysis
-            story.extend(self._build_critical_path_section(tasks))
-
-            # Build PDF
-            doc.build(story)
-
-            return ReportGenerationResult(
-                report_id=f"task_{project.id}_{timestamp}",
-                filename=filename,
-                file_path=str(filepath),
-                report_type="task_report",
-                generated_at=datetime.utcnow(),
-                file_size_bytes=filepath.stat().st_size
-            )
-
-        except Exception as e:
-            logger.error("Task report generation failed", error=str(e), project_id=str(project.id))
-            raise
+        return await self._generate(
+            kind="task_report",
+            label="Task",
+            project=project,
+            build_story=lambda now: self._build_task_report_story(_snapshot_tasks(tasks), project, report_request, now)
+        )
 
     async def generate_evm_report(
         self,
@@ -214,62 +370,14 @@ class ReportingService:
         Returns:
             Report generation result
         """
-        if not REPORTLAB_AVAILABLE:
-            logger.warning("ReportLab not available, cannot generate PDF reports")
-            raise ValueError("PDF report generation requires ReportLab library")
-
-        try:
-            # Generate unique filename
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"evm_report_{project.id}_{timestamp}.pdf"
-            filepath = self.reports_dir / filename
-
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-
-            # Build report content
-            story = []
-
-            # Title page
-            story.extend(self._build_title_page(project, "Earned Value Management Report", report_request))
-
-            # EVM Executive Summary
-            story.extend(self._build_evm_executive_summary(evm_metrics, evm_analysis))
-
-            # EVM Metrics Dashboard
-            story.extend(self._build_evm_metrics_dashboard(evm_metrics))
-
-            # Performance Analysis
-            story.extend(self._build_evm_performance_analysis(evm_analysis))
-
-            # Recommendations
-            story.extend(self._build_evm_recommendations(evm_analysis))
-
-            # Detailed Task EVM
-            story.extend(self._build_task_evm_details(tasks))
-
-            # Build PDF
-            doc.build(story)
-
-            return ReportGenerationResult(
-                report_id=f"evm_{project.id}_{timestamp}",
-                filename=filename,
-                file_path=str(filepath),
-                report_type="evm_report",
-                generated_at=datetime.utcnow(),
-                file_size_bytes=filepath.stat().st_size
+        return await self._generate(
+            kind="evm_report",
+            label="EVM",
+            project=project,
+            build_story=lambda now: self._build_evm_report_story(
+                evm_metrics, evm_analysis, project, _snapshot_tasks(tasks), report_request, now
             )
-
-        except Exception as e:
-            logger.error("EVM report generation failed", error=str(e), project_id=str(project.id))
-            raise
+        )
 
     async def generate_project_report(
         self,
@@ -288,6 +396,35 @@ class ReportingService:
             evm_metrics: Optional EVM metrics
             report_request: Report generation parameters
 
+        Returns:
+            Report generation result
+        """
+        return await self._generate(
+            kind="project_report",
+            label="Project",
+            project=project,
+            build_story=lambda now: self._build_project_report_story(
+                project, _snapshot_tasks(tasks), evm_metrics, report_request, now
+            )
+        )
+
+    async def _generate(
+        self,
+        *,
+        kind: str,
+        label: str,
+        project: Project,
+        build_story: Callable[[datetime], List["Flowable"]]
+    ) -> ReportGenerationResult:
+        """
+        Assemble and render a single report.
+
+        Args:
+            kind: Report type, e.g. "task_report"; also the filename prefix
+            label: Report name used in log messages
+            project: Project the report is for
+            build_story: Callable returning the report flowables for a generation time; runs in a worker thread
+
         Returns:
             Report generation result
         """
@@ -297,77 +434,154 @@ class ReportingService:
 
         try:
             # Generate unique filename
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            filename = f"project_report_{project.id}_{timestamp}.pdf"
-            filepath = self.reports_dir / filename
-
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
+            now = datetime.utcnow()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            filepath = self.reports_dir / f"{kind}_{project.id}_{timestamp}.pdf"
 
-            # Build report content
-            story = []
+            # Assemble and build the PDF off the event loop
+            file_size = await asyncio.to_thread(lambda: _render_pdf(str(filepath), build_story(now)))
 
-            # Title page
-            story.extend(self._build_title_page(project, "Project Status Report", report_request))
+            return self._report_result(kind, project, filepath, now, file_size)
 
-            # Project Overview
-            story.extend(self._build_project_overview(project, tasks))
+        except Exception as e:
+            logger.error(f"{label} report generation failed", error=str(e), project_id=str(project.id))
+            raise
 
-            # Task Summary
-            story.extend(self._build_task_summary_section(tasks))
+    def _report_result(
+        self,
+        kind: str,
+        project: Project,
+        filepath: Path,
+        now: datetime,
+        file_size: int
+    ) -> ReportGenerationResult:
+        """Describe a rendered report file."""
+        return ReportGenerationResult(
+            report_id=f"{kind[:-len('_report')]}_{project.id}_{now.strftime('%Y%m%d_%H%M%S')}",
+            filename=filepath.name,
+            file_path=str(filepath),
+            report_type=kind,
+            generated_at=now,
+            file_size_bytes=file_size
+        )
+
+    def _build_task_report_story(
+        self,
+        tasks: List[_TaskRow],
+        project: Project,
+        report_request: Optional[ReportRequest],
+        now: datetime
+    ) -> List["Flowable"]:
+        """Assemble the flowables of a task report."""
+        story = []
+        by_status = _group_by_status(tasks)
 
-            # Progress Analysis
-            story.extend(self._build_progress_analysis(tasks))
+        # Title page
+        story.extend(self._build_title_page(project, "Task Report", report_request, now))
 
-            # EVM Section (if available)
-            if evm_metrics:
-                story.extend(self._build_project_evm_section(evm_metrics))
+        # Executive summary
+        story.extend(self._build_task_executive_summary(tasks, project, by_status))
 
-            # Risks and Issues
-            story.extend(self._build_risks_issues_section(tasks))
+        # Task details table
+        story.extend(self._build_task_details_table(tasks))
 
-            # Build PDF
-            doc.build(story)
+        # Task status breakdown
+        story.extend(self._build_task_status_charts(tasks, by_status))
 
-            return ReportGenerationResult(
-                report_id=f"project_{project.id}_{timestamp}",
-                filename=filename,
-                file_path=str(filepath),
-                report_type="project_report",
-                generated_at=datetime.utcnow(),
-                file_size_bytes=filepath.stat().st_size
-            )
+        # Critical path analysis
+        story.extend(self._build_critical_path_section(tasks))
 
-        except Exception as e:
-            logger.error("Project report generation failed", error=str(e), project_id=str(project.id))
-            raise
+        return story
 
-    def _build_title_page(self, project: Project, report_title: str, report_request: Optional[ReportRequest]) -> List[Flowable]:
-        """Build the report title page."""
+    def _build_evm_report_story(
+        self,
+        evm_metrics: EarnedValueMetrics,
+        evm_analysis: EVMAnalysis,
+        project: Project,
+        tasks: List[_TaskRow],
+        report_request: Optional[ReportRequest],
+        now: datetime
+    ) -> List["Flowable"]:
+        """Assemble the flowables of an EVM report."""
+        story = []
+
+        # Title page
+        story.extend(self._build_title_page(project, "Earned Value Management Report", report_request, now))
+
+        # EVM Executive Summary
+        story.extend(self._build_evm_executive_summary(evm_metrics, evm_analysis))
+
+        # EVM Metrics Dashboard
+        story.extend(self._build_evm_metrics_dashboard(evm_metrics))
+
+        # Performance Analysis
+        story.extend(self._build_evm_performance_analysis(evm_analysis))
+
+        # Recommendations
+        story.extend(self._build_evm_recommendations(evm_analysis))
+
+        # Detailed Task EVM
+        story.extend(self._build_task_evm_details(tasks, self._task_arrays(tasks)))
+
+        return story
+
+    def _build_project_report_story(
+        self,
+        project: Project,
+        tasks: List[_TaskRow],
+        evm_metrics: Optional[EarnedValueMetrics],
+        report_request: Optional[ReportRequest],
+        now: datetime
+    ) -> List["Flowable"]:
+        """Assemble the flowables of a project status report."""
         story = []
 
+        # Title page
+        story.extend(self._build_title_page(project, "Project Status Report", report_request, now))
+
+        # Project Overview
+        story.extend(self._build_project_overview(project, tasks))
+
+        # Task Summary
+        story.extend(self._build_task_summary_section(tasks, _group_by_status(tasks)))
+
+        # Progress Analysis
+        story.extend(self._build_progress_analysis(tasks, self._task_arrays(tasks)))
+
+        # EVM Section (if available)
+        if evm_metrics:
+            story.extend(self._build_project_evm_section(evm_metrics))
+
+        # Risks and Issues
+        story.extend(self._build_risks_issues_section(tasks))
+
+        return story
+
+    def _build_title_page(
+        self,
+        project: Project,
+        report_title: str,
+        report_request: Optional[ReportRequest],
+        now: datetime
+    ) -> Iterator["Flowable"]:
+        """Build the report title page."""
+        from reportlab.platypus import PageBreak, Paragraph, Spacer
+
         # Report title
-        story.append(Paragraph(report_title, self.styles['ReportTitle']))
-        story.append(Spacer(1, 30))
+        yield Paragraph(report_title, self.styles['ReportTitle'])
+        yield Spacer(1, 30)
 
         # Project information
-        story.append(Paragraph(f"Project: {project.name}", self.styles['SectionHeader']))
-        story.append(Spacer(1, 10))
+        yield Paragraph(f"Project: {project.name}", self.styles['SectionHeader'])
+        yield Spacer(1, 10)
 
         if project.description:
-            story.append(Paragraph(f"Description: {project.description}", self.styles['Normal']))
-            story.append(Spacer(1, 10))
+            yield Paragraph(f"Description: {project.description}", self.styles['Normal'])
+            yield Spacer(1, 10)
 
         # Report metadata
         metadata = [
-            f"Report Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}",
+            f"Report Generated: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}",
             f"Project ID: {project.id}",
         ]
 
@@ -378,26 +592,37 @@ class ReportingService:
                 metadata.append(f"Date Range: {start_date} to {end_date}")
 
         for meta in metadata:
-            story.append(Paragraph(meta, self.styles['Normal']))
-            story.append(Spacer(1, 5))
+            yield Paragraph(meta, self.styles['Normal'])
+            yield Spacer(1, 5)
 
-        story.append(PageBreak())
-        return story
+        yield PageBreak()
 
-    def _build_task_executive_summary(self, tasks: List[Task], project: Project) -> List[Flowable]:
+    def _build_task_executive_summary(
+        self,
+        tasks: List[_TaskRow],
+        project: Project,
+        by_status: Dict[str, List[_TaskRow]]
+    ) -> Iterator["Flowable"]:
         """Build task report executive summary."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer, Table
 
-        story.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
+        yield Paragraph("Executive Summary", self.styles['SectionHeader'])
 
-        # Calculate summary statistics
+        # Calculate summary statistics; status counts come from the grouping
         total_tasks = len(tasks)
-        completed_tasks = sum(1 for t in tasks if t.status == 'completed')
-        in_progress_tasks = sum(1 for t in tasks if t.status == 'in_progress')
-        overdue_tasks = sum(1 for t in tasks if t.planned_end_date and t.planned_end_date < date.today() and t.status != 'completed')
+        completed_tasks = len(by_status.get('completed', ()))
+        in_progress_tasks = len(by_status.get('in_progress', ()))
+        overdue_tasks = 0
+        today = date.today()
 
-        total_budget = sum((t.budgeted_cost or Decimal('0')) for t in tasks)
-        total_actual_cost = sum((t.actual_cost or Decimal('0')) for t in tasks)
+        for t in tasks:
+            ped = t.planned_end_date
+            if ped and ped < today and t.status != 'completed':
+                overdue_tasks += 1
+
+        # Totals are only displayed, so sum them as floats rather than Decimals
+        total_budget = math.fsum([float(t.budgeted_cost or 0) for t in tasks])
+        total_actual_cost = math.fsum([float(t.actual_cost or 0) for t in tasks])
 
         # Summary paragraphs
         summary_text = f"""
@@ -406,8 +631,8 @@ class ReportingService:
         {in_progress_tasks} in progress, and {overdue_tasks} overdue tasks.
         """
 
-        story.append(Paragraph(summary_text.strip(), self.styles['Normal']))
-        story.append(Spacer(1, 15))
+        yield Paragraph(summary_text.strip(), self.styles['Normal'])
+        yield Spacer(1, 15)
 
         # Key metrics table
         metrics_data = [
@@ -421,27 +646,18 @@ class ReportingService:
             ['Budget Variance', f"${total_budget - total_actual_cost:,.2f}"]
         ]
 
-        metrics_table = Table(metrics_data, colWidths=[2*inch, 2*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ]))
-
-        story.append(metrics_table)
-        story.append(Spacer(1, 20))
+        layout = _report_styles().task_metrics
+        metrics_table = Table(metrics_data, colWidths=layout.col_widths)
+        metrics_table.setStyle(layout.style)
 
-        return story
+        yield metrics_table
+        yield Spacer(1, 20)
 
-    def _build_task_details_table(self, tasks: List[Task]) -> List[Flowable]:
+    def _build_task_details_table(self, tasks: List[_TaskRow]) -> Iterator["Flowable"]:
         """Build detailed task information table."""
-        story = []
+        from reportlab.platypus import LongTable, Paragraph, Spacer
 
-        story.append(Paragraph("Task Details", self.styles['SectionHeader']))
+        yield Paragraph("Task Details", self.styles['SectionHeader'])
 
         # Table headers
         headers = ['Task Name', 'Status', 'Progress', 'Start Date', 'End Date', 'Budget', 'Actual Cost']
@@ -450,49 +666,40 @@ class ReportingService:
         table_data = [headers]
 
         for task in tasks:
-            row = [
-                task.name[:30] + '...' if len(task.name) > 30 else task.name,
-                task.status.replace('_', ' ').title(),
+            name = task.name
+            table_data.append((
+                name if len(name) <= 30 else name[:30] + '...',
+                _pretty(task.status),
                 f"{task.progress_percentage}%",
-                task.planned_start_date.strftime('%Y-%m-%d') if task.planned_start_date else 'N/A',
-                task.planned_end_date.strftime('%Y-%m-%d') if task.planned_end_date else 'N/A',
-                f"${task.budgeted_cost:,.2f}" if task.budgeted_cost else '$0.00',
-                f"${task.actual_cost:,.2f}" if task.actual_cost else '$0.00'
-            ]
-            table_data.append(row)
-
-        # Create table
-        col_widths = [1.5*inch, 1*inch, 0.8*inch, 1*inch, 1*inch, 1*inch, 1*inch]
-        task_table = Table(table_data, colWidths=col_widths)
-
-        # Style the table
-        task_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-
-        story.append(task_table)
-        story.append(Spacer(1, 20))
+                _fmt_date(task.planned_start_date),
+                _fmt_date(task.planned_end_date),
+                _fmt_money(task.budgeted_cost),
+                _fmt_money(task.actual_cost)
+            ))
 
-        return story
+        # Create table; LongTable lays out page by page instead of measuring every row up front
+        layout = _report_styles().task_details
+        task_table = LongTable(table_data, colWidths=layout.col_widths, repeatRows=1)
+        task_table.setStyle(layout.style)
+
+        yield task_table
+        yield Spacer(1, 20)
 
-    def _build_task_status_charts(self, tasks: List[Task]) -> List[Flowable]:
+    def _build_task_status_charts(
+        self,
+        tasks: List[_TaskRow],
+        by_status: Dict[str, List[_TaskRow]]
+    ) -> Iterator["Flowable"]:
         """Build task status distribution charts/tables."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer, Table
 
-        story.append(Paragraph("Task Status Distribution", self.styles['SubSectionHeader']))
+        yield Paragraph("Task Status Distribution", self.styles['SubSectionHeader'])
 
-        # Calculate status counts
+        # Calculate status counts, title-casing each distinct status once
         status_counts = {}
-        for task in tasks:
-            status = task.status.replace('_', ' ').title()
-            status_counts[status] = status_counts.get(status, 0) + 1
+        for raw_status, group in by_status.items():
+            status = _pretty(raw_status)
+            status_counts[status] = status_counts.get(status, 0) + len(group)
 
         # Create status table
         status_data = [['Status', 'Count', 'Percentage']]
@@ -502,48 +709,39 @@ class ReportingService:
             percentage = (count / total_tasks * 100) if total_tasks > 0 else 0
             status_data.append([status, str(count), f"{percentage:.1f}%"])
 
-        status_table = Table(status_data, colWidths=[2*inch, 1*inch, 1*inch])
-        status_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        layout = _report_styles().status
+        status_table = Table(status_data, colWidths=layout.col_widths)
+        status_table.setStyle(layout.style)
 
-        story.append(status_table)
-        story.append(Spacer(1, 20))
+        yield status_table
+        yield Spacer(1, 20)
 
-        return story
-
-    def _build_critical_path_section(self, tasks: List[Task]) -> List[Flowable]:
+    def _build_critical_path_section(self, tasks: List[_TaskRow]) -> Iterator["Flowable"]:
         """Build critical path analysis section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer
 
-        story.append(Paragraph("Critical Path Analysis", self.styles['SubSectionHeader']))
+        yield Paragraph("Critical Path Analysis", self.styles['SubSectionHeader'])
 
         # Find critical path tasks (simplified - tasks with no slack)
         critical_tasks = [t for t in tasks if t.is_critical_path]
 
         if critical_tasks:
-            story.append(Paragraph(f"Found {len(critical_tasks)} tasks on the critical path:", self.styles['Normal']))
-            story.append(Spacer(1, 10))
+            yield Paragraph(f"Found {len(critical_tasks)} tasks on the critical path:", self.styles['Normal'])
+            yield Spacer(1, 10)
 
             for task in critical_tasks:
                 task_info = f"• {task.name} (Duration: {task.planned_duration_days or 0} days)"
-                story.append(Paragraph(task_info, self.styles['Normal']))
+                yield Paragraph(task_info, self.styles['Normal'])
         else:
-            story.append(Paragraph("No critical path tasks identified.", self.styles['Normal']))
+            yield Paragraph("No critical path tasks identified.", self.styles['Normal'])
 
-        story.append(Spacer(1, 20))
-        return story
+        yield Spacer(1, 20)
 
-    def _build_evm_executive_summary(self, evm_metrics: EarnedValueMetrics, evm_analysis: EVMAnalysis) -> List[Flowable]:
+    def _build_evm_executive_summary(self, evm_metrics: EarnedValueMetrics, evm_analysis: EVMAnalysis) -> Iterator["Flowable"]:
         """Build EVM report executive summary."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer, Table
 
-        story.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
+        yield Paragraph("Executive Summary", self.styles['SectionHeader'])
 
         # Key EVM metrics
         summary_text = f"""
@@ -552,152 +750,137 @@ class ReportingService:
         and Cost Performance Index (CPI) of {evm_metrics.cost_performance_index:.3f}.
         """
 
-        story.append(Paragraph(summary_text.strip(), self.styles['Normal']))
-        story.append(Spacer(1, 15))
+        yield Paragraph(summary_text.strip(), self.styles['Normal'])
+        yield Spacer(1, 15)
 
         # Status indicators
         status_indicators = [
             ['Performance Indicator', 'Value', 'Status'],
-            ['Schedule Performance', f"{evm_metrics.schedule_performance_index:.3f}", evm_analysis.schedule_status.replace('_', ' ').title()],
-            ['Cost Performance', f"{evm_metrics.cost_performance_index:.3f}", evm_analysis.cost_status.replace('_', ' ').title()],
+            ['Schedule Performance', f"{evm_metrics.schedule_performance_index:.3f}", _pretty(evm_analysis.schedule_status)],
+            ['Cost Performance', f"{evm_metrics.cost_performance_index:.3f}", _pretty(evm_analysis.cost_status)],
             ['Budget Variance', f"${evm_metrics.schedule_variance:,.2f}", 'Positive' if evm_metrics.schedule_variance >= 0 else 'Negative'],
             ['Cost Variance', f"${evm_metrics.cost_variance:,.2f}", 'Under Budget' if evm_metrics.cost_variance >= 0 else 'Over Budget'],
             ['Estimate at Completion', f"${evm_metrics.estimate_at_completion:,.2f}", 'Within Budget' if evm_metrics.variance_at_completion >= 0 else 'Over Budget']
         ]
 
-        status_table = Table(status_indicators, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-        status_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ]))
-
-        story.append(status_table)
-        story.append(Spacer(1, 20))
+        layout = _report_styles().evm_status
+        status_table = Table(status_indicators, colWidths=layout.col_widths)
+        status_table.setStyle(layout.style)
 
-        return story
+        yield status_table
+        yield Spacer(1, 20)
 
-    def _build_evm_metrics_dashboard(self, evm_metrics: EarnedValueMetrics) -> List[Flowable]:
+    def _build_evm_metrics_dashboard(self, evm_metrics: EarnedValueMetrics) -> Iterator["Flowable"]:
         """Build EVM metrics dashboard."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer, Table
 
-        story.append(Paragraph("EVM Metrics Dashboard", self.styles['SectionHeader']))
+        yield Paragraph("EVM Metrics Dashboard", self.styles['SectionHeader'])
 
         # Core metrics
         metrics_data = [
             ['Metric', 'Value', 'Description'],
-            ['Planned Value (PV)', f"${evm_metrics.planned_value:,.2f}", 'Budgeted cost of work scheduled'],
-            ['Earned Value (EV)', f"${evm_metrics.earned_value:,.2f}", 'Budgeted cost of work performed'],
-            ['Actual Cost (AC)', f"${evm_metrics.actual_cost:,.2f}", 'Actual cost incurred'],
-            ['Budget at Completion (BAC)', f"${evm_metrics.budget_at_completion:,.2f}", 'Total project budget'],
-            ['Schedule Variance (SV)', f"${evm_metrics.schedule_variance:,.2f}", 'EV - PV'],
-            ['Cost Variance (CV)', f"${evm_metrics.cost_variance:,.2f}", 'EV - AC'],
+            ['Planned Value (PV)', _fmt_money(evm_metrics.planned_value), 'Budgeted cost of work scheduled'],
+            ['Earned Value (EV)', _fmt_money(evm_metrics.earned_value), 'Budgeted cost of work performed'],
+            ['Actual Cost (AC)', _fmt_money(evm_metrics.actual_cost), 'Actual cost incurred'],
+            ['Budget at Completion (BAC)', _fmt_money(evm_metrics.budget_at_completion), 'Total project budget'],
+            ['Schedule Variance (SV)', _fmt_money(evm_metrics.schedule_variance), 'EV - PV'],
+            ['Cost Variance (CV)', _fmt_money(evm_metrics.cost_variance), 'EV - AC'],
             ['Schedule Performance Index (SPI)', f"{evm_metrics.schedule_performance_index:.3f}", 'EV/PV'],
             ['Cost Performance Index (CPI)', f"{evm_metrics.cost_performance_index:.3f}", 'EV/AC'],
-            ['Estimate at Completion (EAC)', f"${evm_metrics.estimate_at_completion:,.2f}", 'Projected total cost'],
-            ['Variance at Completion (VAC)', f"${evm_metrics.variance_at_completion:,.2f}", 'BAC - EAC']
+            ['Estimate at Completion (EAC)', _fmt_money(evm_metrics.estimate_at_completion), 'Projected total cost'],
+            ['Variance at Completion (VAC)', _fmt_money(evm_metrics.variance_at_completion), 'BAC - EAC']
         ]
 
-        metrics_table = Table(metrics_data, colWidths=[2*inch, 1.5*inch, 3*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-
-        story.append(metrics_table)
-        story.append(Spacer(1, 20))
+        layout = _report_styles().dashboard
+        metrics_table = Table(metrics_data, colWidths=layout.col_widths)
+        metrics_table.setStyle(layout.style)
 
-        return story
+        yield metrics_table
+        yield Spacer(1, 20)
 
-    def _build_evm_performance_analysis(self, evm_analysis: EVMAnalysis) -> List[Flowable]:
+    def _build_evm_performance_analysis(self, evm_analysis: EVMAnalysis) -> Iterator["Flowable"]:
         """Build EVM performance analysis section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer
 
-        story.append(Paragraph("Performance Analysis", self.styles['SubSectionHeader']))
+        yield Paragraph("Performance Analysis", self.styles['SubSectionHeader'])
 
         # Schedule status
-        schedule_status = f"Schedule Status: {evm_analysis.schedule_status.replace('_', ' ').title()}"
-        story.append(Paragraph(schedule_status, self.styles['Normal']))
+        schedule_status = f"Schedule Status: {_pretty(evm_analysis.schedule_status)}"
+        yield Paragraph(schedule_status, self.styles['Normal'])
 
         # Cost status
-        cost_status = f"Cost Status: {evm_analysis.cost_status.replace('_', ' ').title()}"
-        story.append(Paragraph(cost_status, self.styles['Normal']))
+        cost_status = f"Cost Status: {_pretty(evm_analysis.cost_status)}"
+        yield Paragraph(cost_status, self.styles['Normal'])
 
         if evm_analysis.forecast_completion_date:
             forecast = f"Forecast Completion Date: {evm_analysis.forecast_completion_date.strftime('%Y-%m-%d')}"
-            story.append(Paragraph(forecast, self.styles['Normal']))
-
-        story.append(Spacer(1, 15))
+            yield Paragraph(forecast, self.styles['Normal'])
 
-        return story
+        yield Spacer(1, 15)
 
-    def _build_evm_recommendations(self, evm_analysis: EVMAnalysis) -> List[Flowable]:
+    def _build_evm_recommendations(self, evm_analysis: EVMAnalysis) -> Iterator["Flowable"]:
         """Build EVM recommendations section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer
 
-        story.append(Paragraph("Recommendations", self.styles['SubSectionHeader']))
+        yield Paragraph("Recommendations", self.styles['SubSectionHeader'])
 
         if evm_analysis.recommendations:
             for i, recommendation in enumerate(evm_analysis.recommendations, 1):
-                story.append(Paragraph(f"{i}. {recommendation}", self.styles['Normal']))
-                story.append(Spacer(1, 5))
+                yield Paragraph(f"{i}. {recommendation}", self.styles['Normal'])
+                yield Spacer(1, 5)
         else:
-            story.append(Paragraph("No specific recommendations at this time.", self.styles['Normal']))
+            yield Paragraph("No specific recommendations at this time.", self.styles['Normal'])
 
-        story.append(Spacer(1, 20))
+        yield Spacer(1, 20)
 
-        return story
+    def _task_arrays(self, tasks: List[_TaskRow]) -> Optional[Dict[str, Any]]:
+        """Extract budget, actual cost and progress columns as NumPy arrays, or None without NumPy."""
+        if not NUMPY_AVAILABLE:
+            return None
+
+        count = len(tasks)
+        return {
+            'budget': np.fromiter((float(t.budgeted_cost or 0) for t in tasks), dtype=np.float64, count=count),
+            'actual': np.fromiter((float(t.actual_cost or 0) for t in tasks), dtype=np.float64, count=count),
+            'progress': np.fromiter((t.progress_percentage for t in tasks), dtype=np.int64, count=count),
+        }
 
-    def _build_task_evm_details(self, tasks: List[Task]) -> List[Flowable]:
+    def _build_task_evm_details(self, tasks: List[_TaskRow], arrays: Optional[Dict[str, Any]] = None) -> Iterator["Flowable"]:
         """Build detailed task EVM information."""
-        story = []
+        from reportlab.platypus import LongTable, Paragraph, Spacer
 
-        story.append(Paragraph("Task-Level EVM Details", self.styles['SubSectionHeader']))
+        yield Paragraph("Task-Level EVM Details", self.styles['SubSectionHeader'])
 
         # Simplified task EVM table
         task_data = [['Task Name', 'Progress %', 'Budget', 'Actual Cost', 'Variance']]
 
-        for task in tasks:
-            variance = (task.budgeted_cost or Decimal('0')) - (task.actual_cost or Decimal('0'))
-            row = [
-                task.name[:25] + '...' if len(task.name) > 25 else task.name,
+        if arrays is not None:
+            variances = (arrays['budget'] - arrays['actual']).tolist()
+        else:
+            variances = [float(t.budgeted_cost or 0) - float(t.actual_cost or 0) for t in tasks]
+
+        for task, variance in zip(tasks, variances, strict=True):
+            name = task.name
+            task_data.append((
+                name if len(name) <= 25 else name[:25] + '...',
                 f"{task.progress_percentage}%",
-                f"${task.budgeted_cost or 0:,.2f}",
-                f"${task.actual_cost or 0:,.2f}",
-                f"${variance:,.2f}"
-            ]
-            task_data.append(row)
-
-        task_table = Table(task_data, colWidths=[2*inch, 0.8*inch, 1*inch, 1*inch, 1*inch])
-        task_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
-
-        story.append(task_table)
-        story.append(Spacer(1, 20))
+                _fmt_money(task.budgeted_cost),
+                _fmt_money(task.actual_cost),
+                _fmt_money(variance)
+            ))
 
-        return story
+        layout = _report_styles().task_evm
+        task_table = LongTable(task_data, colWidths=layout.col_widths, repeatRows=1)
+        task_table.setStyle(layout.style)
+
+        yield task_table
+        yield Spacer(1, 20)
 
-    def _build_project_overview(self, project: Project, tasks: List[Task]) -> List[Flowable]:
+    def _build_project_overview(self, project: Project, tasks: List[_TaskRow]) -> Iterator["Flowable"]:
         """Build project overview section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer
 
-        story.append(Paragraph("Project Overview", self.styles['SectionHeader']))
+        yield Paragraph("Project Overview", self.styles['SectionHeader'])
 
         # Project details
         details = [
@@ -707,27 +890,29 @@ class ReportingService:
             f"End Date: {project.end_date.strftime('%Y-%m-%d') if project.end_date else 'Not set'}",
             f"Budget: ${project.budget or 0:,.2f}",
             f"Total Tasks: {len(tasks)}",
-            f"Status: {project.status.replace('_', ' ').title() if project.status else 'Unknown'}"
+            f"Status: {_pretty(project.status) if project.status else 'Unknown'}"
         ]
 
         for detail in details:
-            story.append(Paragraph(detail, self.styles['Normal']))
-            story.append(Spacer(1, 3))
-
-        story.append(Spacer(1, 15))
+            yield Paragraph(detail, self.styles['Normal'])
+            yield Spacer(1, 3)
 
-        return story
+        yield Spacer(1, 15)
 
-    def _build_task_summary_section(self, tasks: List[Task]) -> List[Flowable]:
+    def _build_task_summary_section(
+        self,
+        tasks: List[_TaskRow],
+        by_status: Dict[str, List[_TaskRow]]
+    ) -> Iterator["Flowable"]:
         """Build task summary section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer, Table
 
-        story.append(Paragraph("Task Summary", self.styles['SubSectionHeader']))
+        yield Paragraph("Task Summary", self.styles['SubSectionHeader'])
 
         # Calculate summary stats
-        completed = sum(1 for t in tasks if t.status == 'completed')
-        in_progress = sum(1 for t in tasks if t.status == 'in_progress')
-        not_started = sum(1 for t in tasks if t.status == 'not_started')
+        completed = len(by_status.get('completed', ()))
+        in_progress = len(by_status.get('in_progress', ()))
+        not_started = len(by_status.get('not_started', ()))
 
         summary_data = [
             ['Status', 'Count', 'Percentage'],
@@ -736,51 +921,61 @@ class ReportingService:
             ['Not Started', str(not_started), f"{(not_started/len(tasks)*100):.1f}%" if tasks else "0%"]
         ]
 
-        summary_table = Table(summary_data, colWidths=[1.5*inch, 1*inch, 1*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        layout = _report_styles().summary
+        summary_table = Table(summary_data, colWidths=layout.col_widths)
+        summary_table.setStyle(layout.style)
 
-        story.append(summary_table)
-        story.append(Spacer(1, 20))
+        yield summary_table
+        yield Spacer(1, 20)
 
-        return story
-
-    def _build_progress_analysis(self, tasks: List[Task]) -> List[Flowable]:
+    def _build_progress_analysis(self, tasks: List[_TaskRow], arrays: Optional[Dict[str, Any]] = None) -> Iterator["Flowable"]:
         """Build progress analysis section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer
 
-        story.append(Paragraph("Progress Analysis", self.styles['SubSectionHeader']))
+        yield Paragraph("Progress Analysis", self.styles['SubSectionHeader'])
 
         if tasks:
-            avg_progress = sum(t.progress_percentage for t in tasks) / len(tasks)
-            story.append(Paragraph(f"Average Task Progress: {avg_progress:.1f}%", self.styles['MetricValue']))
+            if arrays is not None:
+                progress = arrays['progress']
+                low, mid_low, mid_high, high = _get_progress_kernel()(progress).tolist()
+                avg_progress = float(progress.mean())
+            else:
+                # Average and progress distribution in a single pass
+                total_progress = 0
+                low = mid_low = mid_high = high = 0
+                for t in tasks:
+                    p = t.progress_percentage
+                    total_progress += p
+                    if p <= 25:
+                        low += 1
+                    elif 26 <= p <= 50:
+                        mid_low += 1
+                    elif 51 <= p <= 75:
+                        mid_high += 1
+                    elif p >= 76:
+                        high += 1
+
+                avg_progress = total_progress / len(tasks)
+
+            yield Paragraph(f"Average Task Progress: {avg_progress:.1f}%", self.styles['MetricValue'])
 
-            # Progress distribution
             progress_ranges = {
-                '0-25%': sum(1 for t in tasks if t.progress_percentage <= 25),
-                '26-50%': sum(1 for t in tasks if 26 <= t.progress_percentage <= 50),
-                '51-75%': sum(1 for t in tasks if 51 <= t.progress_percentage <= 75),
-                '76-100%': sum(1 for t in tasks if t.progress_percentage >= 76)
+                '0-25%': low,
+                '26-50%': mid_low,
+                '51-75%': mid_high,
+                '76-100%': high
             }
 
             for range_name, count in progress_ranges.items():
-                story.append(Paragraph(f"Tasks {range_name}: {count}", self.styles['Normal']))
-
-        story.append(Spacer(1, 20))
+                yield Paragraph(f"Tasks {range_name}: {count}", self.styles['Normal'])
 
-        return story
+        yield Spacer(1, 20)
 
-    def _build_project_evm_section(self, evm_metrics: EarnedValueMetrics) -> List[Flowable]:
+    def _build_project_evm_section(self, evm_metrics: EarnedValueMetrics) -> Iterator["Flowable"]:
         """Build project EVM section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer, Table
 
-        story.append(Paragraph("Earned Value Analysis", self.styles['SubSectionHeader']))
+        yield Paragraph("Earned Value Analysis", self.styles['SubSectionHeader'])
 
         evm_data = [
             ['Metric', 'Value'],
@@ -791,40 +986,38 @@ class ReportingService:
             ['EAC (Estimate at Completion)', f"${evm_metrics.estimate_at_completion:,.2f}"]
         ]
 
-        evm_table = Table(evm_data, colWidths=[2.5*inch, 1.5*inch])
-        evm_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgreen),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        layout = _report_styles().evm
+        evm_table = Table(evm_data, colWidths=layout.col_widths)
+        evm_table.setStyle(layout.style)
 
-        story.append(evm_table)
-        story.append(Spacer(1, 20))
+        yield evm_table
+        yield Spacer(1, 20)
 
-        return story
-
-    def _build_risks_issues_section(self, tasks: List[Task]) -> List[Flowable]:
+    def _build_risks_issues_section(self, tasks: List[_TaskRow]) -> Iterator["Flowable"]:
         """Build risks and issues section."""
-        story = []
+        from reportlab.platypus import Paragraph, Spacer
+
+        yield Paragraph("Risks and Issues", self.styles['SubSectionHeader'])
 
-        story.append(Paragraph("Risks and Issues", self.styles['SubSectionHeader']))
+        # Identify potential risks; only the counts are reported
+        overdue_tasks = 0
+        high_budget_tasks = 0
+        today = date.today()
 
-        # Identify potential risks
-        overdue_tasks = [t for t in tasks if t.planned_end_date and t.planned_end_date < date.today() and t.status != 'completed']
-        high_budget_tasks = [t for t in tasks if t.budgeted_cost and t.budgeted_cost > 5000]  # Example threshold
+        for t in tasks:
+            ped = t.planned_end_date
+            if ped and ped < today and t.status != 'completed':
+                overdue_tasks += 1
+            if t.budgeted_cost and t.budgeted_cost > 5000:  # Example threshold
+                high_budget_tasks += 1
 
         if overdue_tasks:
-            story.append(Paragraph(f"⚠️  {len(overdue_tasks)} overdue tasks identified", self.styles['Normal']))
+            yield Paragraph(f"⚠️  {overdue_tasks} overdue tasks identified", self.styles['Normal'])
 
         if high_budget_tasks:
-            story.append(Paragraph(f"💰 {len(high_budget_tasks)} high-budget tasks require monitoring", self.styles['Normal']))
+            yield Paragraph(f"💰 {high_budget_tasks} high-budget tasks require monitoring", self.styles['Normal'])
 
         if not overdue_tasks and not high_budget_tasks:
-            story.append(Paragraph("✅ No significant risks identified", self.styles['Normal']))
+            yield Paragraph("✅ No significant risks identified", self.styles['Normal'])
 
-        story.append(Spacer(1, 20))
-
-        return story
+        yield Spacer(1, 20)
@@ -3,19 +3,35 @@ Advanced Scheduling Service for WhatsApp PM System v3.0 (Gamma)
 OR-Tools integration for CPM, resource leveling, and optimization
 """
 
+import os
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
-from uuid import UUID
 import structlog
 
 # Optional OR-Tools import
 try:
-    from ortools.constraint_solver import pywrapcp
+    from ortools.sat.python import cp_model
     ORTOOLS_AVAILABLE = True
 except ImportError:
-    pywrapcp = None
+    cp_model = None
     ORTOOLS_AVAILABLE = False
 
+# Optional NumPy import for vectorised utilization sampling
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Optional Numba import for the compiled CPM pass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
 from ..models.sqlalchemy.task import Task, TaskDependency
 from ..models.sqlalchemy.project import Project
 from ..models.sqlalchemy.user import User
@@ -26,20 +42,157 @@ from ..schemas.task import (
 
 logger = structlog.get_logger(__name__)
 
+# Wall-clock cap for a single CP-SAT solve; the best schedule found so far is used
+SOLVER_TIME_LIMIT_SECONDS = 30.0
+# CP-SAT portfolio size, capped where extra LNS workers stop paying off
+SOLVER_NUM_WORKERS = min(16, os.cpu_count() or 1)
+# Fixed seed so repeated solves of the same model return the same schedule
+SOLVER_RANDOM_SEED = 1
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _cpm_forward_backward(indptr, indices, lags, durations):
+        """Compiled CPM pass over predecessor CSR arrays; a short order means a cycle."""
+        node_count = indptr.shape[0] - 1
+
+        # Invert the predecessor CSR so Kahn's sort can walk successors
+        succ_indptr = np.zeros(node_count + 1, dtype=np.int32)
+        for pos in range(indices.shape[0]):
+            succ_indptr[indices[pos] + 1] += 1
+        for node in range(node_count):
+            succ_indptr[node + 1] += succ_indptr[node]
+        succ_indices = np.empty(indices.shape[0], dtype=np.int32)
+        cursor = succ_indptr[:-1].copy()
+        for node in range(node_count):
+            for pos in range(indptr[node], indptr[node + 1]):
+                pred = indices[pos]
+                succ_indices[cursor[pred]] = node
+                cursor[pred] += 1
+
+        # The order array doubles as the FIFO queue
+        in_degree = indptr[1:] - indptr[:-1]
+        order = np.empty(node_count, dtype=np.int32)
+        head = 0
+        tail = 0
+        for node in range(node_count):
+            if in_degree[node] == 0:
+                order[tail] = node
+                tail += 1
+        while head < tail:
+            node = order[head]
+            head += 1
+            for pos in range(succ_indptr[node], succ_indptr[node + 1]):
+                successor = succ_indices[pos]
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    order[tail] = successor
+                    tail += 1
+
+        earliest_start = np.zeros(node_count, dtype=np.int32)
+        earliest_finish = np.zeros(node_count, dtype=np.int32)
+        project_finish = 0
+        for k in range(tail):
+            node = order[k]
+            start = 0
+            for pos in range(indptr[node], indptr[node + 1]):
+                ready = earliest_finish[indices[pos]] + lags[pos]
+                if ready > start:
+                    start = ready
+            earliest_start[node] = start
+            earliest_finish[node] = start + durations[node]
+            if earliest_finish[node] > project_finish:
+                project_finish = earliest_finish[node]
+
+        # Backward pass pushes each task's latest start onto its predecessors
+        latest_finish = np.full(node_count, project_finish, dtype=np.int32)
+        latest_start = np.zeros(node_count, dtype=np.int32)
+        for k in range(tail - 1, -1, -1):
+            node = order[k]
+            latest_start[node] = latest_finish[node] - durations[node]
+            for pos in range(indptr[node], indptr[node + 1]):
+                pred = indices[pos]
+                bound = latest_start[node] - lags[pos]
+                if bound < latest_finish[pred]:
+                    latest_finish[pred] = bound
+
+        return tail, earliest_start, earliest_finish, latest_start, latest_finish
+
+
+def _offset_dates(base: date, offsets: List[int]) -> List[date]:
+    """Turn day offsets from base into dates, in one vectorised step when NumPy is available."""
+    if NUMPY_AVAILABLE:
+        return (np.datetime64(base, 'D') + np.asarray(offsets, dtype=np.int64)).tolist()
+    return [base + timedelta(days=offset) for offset in offsets]
+
+
+def _constrain_start_after(model, handles: Dict, params: Dict[str, Any], today: date):
+    """Task must start after a specific date."""
+    target_date = params.get('date')
+    if target_date:
+        model.Add(handles['start'] >= (target_date - today).days)
+
+
+def _constrain_finish_before(model, handles: Dict, params: Dict[str, Any], today: date):
+    """Task must finish before a specific date."""
+    target_date = params.get('date')
+    if target_date:
+        model.Add(handles['end'] <= (target_date - today).days)
+
+
+def _constrain_max_duration(model, handles: Dict, params: Dict[str, Any], today: date):
+    """Task duration cannot exceed a maximum number of days."""
+    max_duration = params.get('max_days', 30)
+    model.Add(handles['end'] - handles['start'] <= max_duration)
+
+
+def _constrain_resource_limit(model, task_vars: Dict, params: Dict[str, Any], today: date):
+    """Cap the combined demand of every task using a resource."""
+    resource_type = params.get('resource_type')
+    if not resource_type:
+        return
+
+    resource_intervals = []
+    demands = []
+    for handles in task_vars.values():
+        task_resources = getattr(handles['task'], 'required_resources', {})
+        if resource_type in task_resources:
+            resource_intervals.append(handles['interval'])
+            demands.append(task_resources[resource_type])
+
+    if resource_intervals:
+        model.AddCumulative(resource_intervals, demands, params.get('max_units', 1))
+
+
+# Constraint appliers keyed by TaskConstraint.constraint_type; each receives the
+# already-resolved variable handles (one task's, or all of them when project-wide)
+_CONSTRAINT_APPLIERS = {
+    "start_after": _constrain_start_after,
+    "finish_before": _constrain_finish_before,
+    "max_duration": _constrain_max_duration,
+    "resource_limit": _constrain_resource_limit,
+}
+# Constraint types that act on every task rather than constraint.task_id
+_PROJECT_WIDE_CONSTRAINTS = frozenset({"resource_limit"})
+
 
 class AdvancedSchedulingService:
     """Advanced scheduling service using OR-Tools for optimization."""
 
     def __init__(self):
+        # One solver (and its parameters) serves every model this service builds
         self.solver = None
-        self._reset_solver()
-
-    def _reset_solver(self):
-        """Reset the OR-Tools solver."""
         if ORTOOLS_AVAILABLE:
-            self.solver = pywrapcp.Solver("AdvancedCPMSolver")
-        else:
-            self.solver = None
+            self.solver = cp_model.CpSolver()
+            self.solver.parameters.max_time_in_seconds = SOLVER_TIME_LIMIT_SECONDS
+            self.solver.parameters.num_workers = SOLVER_NUM_WORKERS
+            self.solver.parameters.random_seed = SOLVER_RANDOM_SEED
+            self.solver.parameters.log_search_progress = False
+
+    def _solve(self, model) -> bool:
+        """Solve a model and report whether a schedule was found."""
+        status = self.solver.Solve(model)
+        return status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
 
     async def calculate_critical_path_ortools(
         self,
@@ -48,138 +201,72 @@ class AdvancedSchedulingService:
         db_session=None
     ) -> CPMResult:
         """
-        Calculate Critical Path Method using OR-Tools constraint programming.
+        Calculate the Critical Path Method schedule with a forward/backward pass.
 
-        This provides more accurate and optimized CPM calculations compared to
-        the basic forward/backward pass algorithm.
+        Without resource limits CPM is a longest-path problem on the dependency
+        DAG, so it is solved in O(V + E) over a topological order. CP-SAT is
+        reserved for resource leveling and constrained optimization.
         """
-        if not ORTOOLS_AVAILABLE:
-            logger.warning("OR-Tools not available, using fallback CPM calculation")
-            return await self._fallback_cpm_calculation(tasks, dependencies)
-
         try:
-            self._reset_solver()
-
-            # Create task variables and intervals
-            task_vars = {}
-            task_intervals = {}
-
-            # Build task dictionary for easy lookup
-            task_dict = {str(task.id): task for task in tasks}
-
-            # Create dependency graph
-            predecessors = {}
-            successors = {}
-
-            for task in tasks:
-                task_id = str(task.id)
-                predecessors[task_id] = []
-                successors[task_id] = []
+            # Work on integer indices; task.id is only read again for output
+            task_index = {task.id: i for i, task in enumerate(tasks)}
+            durations = [
+                max(1, (task.planned_end_date - task.planned_start_date).days)
+                for task in tasks
+            ]
+
+            # Create dependency graph; each edge carries its lag
+            predecessors = [[] for _ in tasks]
+            successors = [[] for _ in tasks]
+            in_degree = [0] * len(tasks)
+            out_degree = [0] * len(tasks)
 
             for dep in dependencies:
-                pred_id = str(dep.predecessor_id)
-                succ_id = str(dep.successor_id)
-                if pred_id in predecessors and succ_id in successors:
-                    predecessors[succ_id].append(pred_id)
-                    successors[pred_id].append(succ_id)
-
-            # Create interval variables for each task
-            for task in tasks:
-                task_id = str(task.id)
-
-                # Calculate duration in days
-                duration_days = max(1, (task.planned_end_date - task.planned_start_date).days)
-
-                # Create interval variable
-                start_var = self.solver.IntVar(0, 1000, f"start_{task_id}")
-                end_var = self.solver.IntVar(duration_days, 1000 + duration_days, f"end_{task_id}")
-
-                task_vars[task_id] = {
-                    'start': start_var,
-                    'end': end_var,
-                    'duration': duration_days,
-                    'task': task
-                }
-
-                # Create interval for constraint programming
-                interval = self.solver.FixedDurationIntervalVar(
-                    start_var, end_var, duration_days, False, f"interval_{task_id}"
-                )
-                task_intervals[task_id] = interval
-
-            # Add precedence constraints
-            for task in tasks:
-                task_id = str(task.id)
-
-                for pred_id in predecessors[task_id]:
-                    if pred_id in task_intervals and task_id in task_intervals:
-                        # Predecessor must finish before successor can start
-                        pred_end = task_vars[pred_id]['end']
-                        succ_start = task_vars[task_id]['start']
-
-                        # Add lag time if specified
-                        lag_days = 0
-                        for dep in dependencies:
-                            if str(dep.predecessor_id) == pred_id and str(dep.successor_id) == task_id:
-                                lag_days = dep.lag_days
-                                break
-
-                        self.solver.Add(succ_start >= pred_end + lag_days)
-
-            # Solve the constraint model
-            db = self.solver.Phase(
-                [var['start'] for var in task_vars.values()],
-                self.solver.CHOOSE_FIRST_UNBOUND,
-                self.solver.ASSIGN_MIN_VALUE
-            )
-
-            self.solver.NewSearch(db)
+                pred = task_index.get(dep.predecessor_id)
+                succ = task_index.get(dep.successor_id)
+                if pred is not None and succ is not None:
+                    lag_days = dep.lag_days or 0
+                    predecessors[succ].append((pred, lag_days))
+                    successors[pred].append((succ, lag_days))
+                    in_degree[succ] += 1
+                    out_degree[pred] += 1
+
+            if NUMBA_AVAILABLE:
+                schedule = self._cpm_pass_compiled(predecessors, durations)
+            else:
+                schedule = self._cpm_pass(predecessors, successors, durations)
+            earliest_start, earliest_finish, latest_start, latest_finish = schedule
+            total_duration = max(earliest_finish, default=0)
 
             task_schedules = []
             critical_path = []
-            total_duration = 0
-
-            if self.solver.NextSolution():
-                # Extract solution
-                for task_id, vars in task_vars.items():
-                    task = vars['task']
-
-                    # Calculate actual dates (assuming project starts today)
-                    project_start = min(task.planned_start_date for task in tasks)
-                    actual_start = project_start + timedelta(days=vars['start'].Value())
-                    actual_end = project_start + timedelta(days=vars['end'].Value())
-
-                    # Calculate slack (float)
-                    slack = self._calculate_slack(task_id, task_vars, predecessors, successors)
-
-                    # Determine if task is critical
-                    is_critical = slack <= 0
-
-                    if is_critical:
-                        critical_path.append(UUID(task_id))
-
-                    task_schedules.append(TaskSchedule(
-                        task_id=UUID(task_id),
-                        earliest_start=actual_start,
-                        earliest_finish=actual_end,
-                        latest_start=actual_start,  # Will be refined
-                        latest_finish=actual_end,   # Will be refined
-                        slack=slack,
-                        is_critical=is_critical,
-                        duration=vars['duration']
-                    ))
-
-                # Calculate total project duration
-                if task_schedules:
-                    total_duration = max(
-                        (schedule.earliest_finish - schedule.earliest_start).days
-                        for schedule in task_schedules
-                    )
 
-            self.solver.EndSearch()
+            project_start = min((task.planned_start_date for task in tasks), default=None)
+            es_dates = _offset_dates(project_start, earliest_start)
+            ef_dates = _offset_dates(project_start, earliest_finish)
+            ls_dates = _offset_dates(project_start, latest_start)
+            lf_dates = _offset_dates(project_start, latest_finish)
+
+            for i, task in enumerate(tasks):
+                slack = latest_start[i] - earliest_start[i]
+                is_critical = slack == 0
+
+                if is_critical:
+                    critical_path.append(task.id)
+
+                task_schedules.append(TaskSchedule(
+                    task_id=task.id,
+                    earliest_start=es_dates[i],
+                    earliest_finish=ef_dates[i],
+                    latest_start=ls_dates[i],
+                    latest_finish=lf_dates[i],
+                    slack=slack,
+                    is_critical=is_critical,
+                    duration=durations[i]
+                ))
 
             # Identify bottlenecks
-            bottlenecks = await self._identify_bottlenecks_ortools(task_vars, predecessors, successors)
+            bottlenecks = self._identify_bottlenecks_ortools(tasks, in_degree, out_degree)
 
             return CPMResult(
                 critical_path=critical_path,
@@ -189,67 +276,107 @@ class AdvancedSchedulingService:
             )
 
         except Exception as e:
-            logger.error("OR-Tools CPM calculation failed", error=str(e))
+            logger.error("CPM calculation failed", error=str(e))
             # Fallback to basic CPM calculation
-            return await self._fallback_cpm_calculation(tasks, dependencies)
+            return self._fallback_cpm_calculation(tasks, dependencies)
 
-    def _calculate_slack(
+    def _cpm_pass(
         self,
-        task_id: str,
-        task_vars: Dict,
-        predecessors: Dict,
-        successors: Dict
-    ) -> float:
-        """Calculate slack for a task using OR-Tools solution."""
-        try:
-            # Slack = Latest Start - Earliest Start
-            earliest_start = task_vars[task_id]['start'].Value()
-            latest_start = earliest_start  # Simplified for now
-
-            # For critical path tasks, slack is 0
-            # For non-critical tasks, calculate based on successor constraints
-            if successors[task_id]:
-                # Find the minimum latest start among successors
-                min_successor_start = min(
-                    task_vars[succ_id]['start'].Value()
-                    for succ_id in successors[task_id]
-                )
-                successor_constraint = min_successor_start - task_vars[task_id]['duration']
-
-                latest_start = min(earliest_start, successor_constraint)
+        predecessors: List[List[Tuple[int, int]]],
+        successors: List[List[Tuple[int, int]]],
+        durations: List[int]
+    ) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """Forward/backward CPM pass in pure Python; raises ValueError on a cycle."""
+        # Kahn's topological sort
+        in_degree = [len(preds) for preds in predecessors]
+        topo = [i for i, degree in enumerate(in_degree) if degree == 0]
+        for i in topo:
+            for succ, _ in successors[i]:
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    topo.append(succ)
+
+        if len(topo) < len(durations):
+            raise ValueError("Dependency graph contains a cycle")
+
+        # Forward pass: earliest start/finish in days from project start
+        earliest_start = [0] * len(durations)
+        earliest_finish = [0] * len(durations)
+        for i in topo:
+            start = 0
+            for pred, lag_days in predecessors[i]:
+                start = max(start, earliest_finish[pred] + lag_days)
+            earliest_start[i] = start
+            earliest_finish[i] = start + durations[i]
+
+        project_finish = max(earliest_finish, default=0)
+
+        # Backward pass: latest finish/start against the project finish
+        latest_start = [0] * len(durations)
+        latest_finish = [0] * len(durations)
+        for i in reversed(topo):
+            finish = project_finish
+            for succ, lag_days in successors[i]:
+                finish = min(finish, latest_start[succ] - lag_days)
+            latest_finish[i] = finish
+            latest_start[i] = finish - durations[i]
+
+        return earliest_start, earliest_finish, latest_start, latest_finish
+
+    def _cpm_pass_compiled(
+        self,
+        predecessors: List[List[Tuple[int, int]]],
+        durations: List[int]
+    ) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """Forward/backward CPM pass through the Numba kernel; raises ValueError on a cycle."""
+        edges = [edge for preds in predecessors for edge in preds]
+        indptr = np.zeros(len(predecessors) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(preds) for preds in predecessors])
+        indices = np.fromiter((pred for pred, _ in edges), dtype=np.int32, count=len(edges))
+        lags = np.fromiter((lag for _, lag in edges), dtype=np.int32, count=len(edges))
+
+        ordered, *schedule = _cpm_forward_backward(
+            indptr, indices, lags, np.asarray(durations, dtype=np.int32)
+        )
+        if ordered < len(durations):
+            raise ValueError("Dependency graph contains a cycle")
 
-            return max(0, latest_start - earliest_start)
+        return tuple(values.tolist() for values in schedule)
 
-        except Exception:
-            return 0.0
-
-    async def _identify_bottlenecks_ortools(
+    def _identify_bottlenecks_ortools(
         self,
-        task_vars: Dict,
-        predecessors: Dict,
-        successors: Dict
+        tasks: List[Task],
+        in_degree: List[int],
+        out_degree: List[int]
     ) -> List[Dict[str, Any]]:
-        """Identify project bottlenecks using OR-Tools analysis."""
-        bottlenecks = []
+        """Identify project bottlenecks from the dependency graph."""
+        # Tasks with many dependencies are potential bottlenecks
+        if NUMPY_AVAILABLE:
+            hub_degree = np.maximum(np.asarray(in_degree), np.asarray(out_degree))
+            candidates = np.flatnonzero(hub_degree >= 3).tolist()
+        else:
+            candidates = [
+                i for i, (predecessor_count, successor_count) in enumerate(zip(in_degree, out_degree, strict=True))
+                if successor_count >= 3 or predecessor_count >= 3
+            ]
 
-        for task_id, vars in task_vars.items():
-            successor_count = len(successors[task_id])
-            predecessor_count = len(predecessors[task_id])
-
-            # Tasks with many dependencies are potential bottlenecks
-            if successor_count >= 3 or predecessor_count >= 3:
-                bottlenecks.append({
-                    "task_id": UUID(task_id),
-                    "task_name": vars['task'].name,
-                    "successor_count": successor_count,
-                    "predecessor_count": predecessor_count,
-                    "severity": "high" if successor_count >= 5 or predecessor_count >= 5 else "medium",
-                    "bottleneck_type": "dependency_bottleneck"
-                })
+        bottlenecks = []
+        for i in candidates:
+            task = tasks[i]
+            successor_count = out_degree[i]
+            predecessor_count = in_degree[i]
+            bottlenecks.append({
+                "task_id": task.id,
+                "task_name": task.name,
+                "successor_count": successor_count,
+                "predecessor_count": predecessor_count,
+                "severity": "high" if successor_count >= 5 or predecessor_count >= 5 else "medium",
+                "bottleneck_type": "dependency_bottleneck"
+            })
 
         return bottlenecks
 
-    async def _fallback_cpm_calculation(
+    def _fallback_cpm_calculation(
         self,
         tasks: List[Task],
         dependencies: List[TaskDependency]
@@ -259,14 +386,17 @@ class AdvancedSchedulingService:
 
         # Basic forward pass
         task_schedules = []
-        task_dict = {str(task.id): task for task in tasks}
+        task_dict = {task.id: task for task in tasks}
 
-        for task in tasks:
-            task_id = str(task.id)
+        # Index predecessor tasks by successor in one pass over the dependencies
+        pred_tasks_by_succ = {}
+        for dep in dependencies:
+            pred_task = task_dict.get(dep.predecessor_id)
+            if pred_task is not None:
+                pred_tasks_by_succ.setdefault(dep.successor_id, []).append(pred_task)
 
-            # Find predecessors
-            pred_deps = [d for d in dependencies if str(d.successor_id) == task_id]
-            pred_tasks = [task_dict[str(d.predecessor_id)] for d in pred_deps if str(d.predecessor_id) in task_dict]
+        for task in tasks:
+            pred_tasks = pred_tasks_by_succ.get(task.id)
 
             if pred_tasks:
                 # Earliest start is max of predecessor end dates
@@ -318,6 +448,32 @@ class AdvancedSchedulingService:
         Returns:
             ResourceLevelingResult with optimized schedule
         """
+        # Without competing demand on some positive capacity the plan is already level
+        needs_leveling = (
+            len(tasks) > 1
+            and any(max_units > 0 for max_units in resource_constraints.values())
+            and any(getattr(task, 'required_resources', None) for task in tasks)
+        )
+        if not needs_leveling:
+            optimized_schedule = [
+                {
+                    'task_id': task.id,
+                    'task_name': task.name,
+                    'original_start': task.planned_start_date,
+                    'original_end': task.planned_end_date,
+                    'optimized_start': task.planned_start_date,
+                    'optimized_end': task.planned_end_date,
+                    'delay_days': 0
+                }
+                for task in tasks
+            ]
+            return ResourceLevelingResult(
+                optimized_schedule=optimized_schedule,
+                resource_utilization={},
+                total_delays=0,
+                optimization_score=self._calculate_optimization_score(optimized_schedule)
+            )
+
         if not ORTOOLS_AVAILABLE:
             logger.warning("OR-Tools not available, resource leveling not supported")
             return ResourceLevelingResult(
@@ -328,7 +484,7 @@ class AdvancedSchedulingService:
             )
 
         try:
-            self._reset_solver()
+            model = cp_model.CpModel()
 
             # Create task intervals with resource constraints
             task_intervals = {}
@@ -338,19 +494,26 @@ class AdvancedSchedulingService:
             for resource_type, max_units in resource_constraints.items():
                 resource_usage[resource_type] = []
 
-            # Create intervals for each task
-            for task in tasks:
-                task_id = str(task.id)
-                duration = max(1, (task.planned_end_date - task.planned_start_date).days)
+            durations = [
+                max(1, (task.planned_end_date - task.planned_start_date).days)
+                for task in tasks
+            ]
+            # Running every task back to back always fits, so that bounds every start
+            horizon = sum(durations)
+
+            # Create intervals for each task, keyed by position in tasks
+            task_index = {task.id: i for i, task in enumerate(tasks)}
+            for i, task in enumerate(tasks):
+                duration = durations[i]
 
-                start_var = self.solver.IntVar(0, 365, f"start_{task_id}")  # Max 1 year
-                end_var = self.solver.IntVar(duration, 365 + duration, f"end_{task_id}")
+                start_var = model.NewIntVar(0, horizon, f"start_{i}")
+                end_var = model.NewIntVar(duration, horizon + duration, f"end_{i}")
 
-                interval = self.solver.FixedDurationIntervalVar(
-                    start_var, end_var, duration, False, f"interval_{task_id}"
+                interval = model.NewIntervalVar(
+                    start_var, duration, end_var, f"interval_{i}"
                 )
 
-                task_intervals[task_id] = {
+                task_intervals[i] = {
                     'interval': interval,
                     'start': start_var,
                     'end': end_var,
@@ -364,7 +527,7 @@ class AdvancedSchedulingService:
                 intervals_using_resource = []
                 demands = []
 
-                for task_id, task_data in task_intervals.items():
+                for task_data in task_intervals.values():
                     if resource_type in task_data['resources']:
                         demand = task_data['resources'][resource_type]
                         intervals_using_resource.append(task_data['interval'])
@@ -372,51 +535,40 @@ class AdvancedSchedulingService:
 
                 if intervals_using_resource:
                     # Add cumulative constraint
-                    self.solver.AddCumulative(
+                    model.AddCumulative(
                         intervals_using_resource,
                         demands,
                         max_units
                     )
 
             # Add dependency constraints
-            task_dict = {str(task.id): task for task in tasks}
-            for task in tasks:
-                task_id = str(task.id)
-
-                # Find predecessors
-                pred_deps = await self._get_task_predecessors(task.id, db_session)
-                for pred_id in pred_deps:
-                    if str(pred_id) in task_intervals:
-                        pred_end = task_intervals[str(pred_id)]['end']
-                        curr_start = task_intervals[task_id]['start']
-                        self.solver.Add(curr_start >= pred_end)
-
-            # Solve the resource leveling problem
-            db = self.solver.Phase(
-                [data['start'] for data in task_intervals.values()],
-                self.solver.CHOOSE_FIRST_UNBOUND,
-                self.solver.ASSIGN_MIN_VALUE
-            )
-
-            self.solver.NewSearch(db)
+            pred_map = await self._get_predecessor_map(list(task_index), db_session)
+            for i, task in enumerate(tasks):
+                for pred_id in pred_map.get(task.id, ()):
+                    pred = task_index.get(pred_id)
+                    if pred is not None:
+                        pred_end = task_intervals[pred]['end']
+                        curr_start = task_intervals[i]['start']
+                        model.Add(curr_start >= pred_end)
+
+            # Keep the leveled schedule as early as the resources allow
+            model.Minimize(sum(data['start'] for data in task_intervals.values()))
 
             optimized_schedule = []
             resource_utilization = {}
 
-            if self.solver.NextSolution():
+            if self._solve(model):
+                # Solver days are offsets from the earliest planned start
+                base_date = min(task.planned_start_date for task in tasks)
+                task_data = list(task_intervals.values())
+                starts = _offset_dates(base_date, [self.solver.Value(data['start']) for data in task_data])
+                ends = _offset_dates(base_date, [self.solver.Value(data['end']) for data in task_data])
+
                 # Extract optimized schedule
-                for task_id, data in task_intervals.items():
+                for data, optimized_start, optimized_end in zip(task_data, starts, ends, strict=True):
                     task = data['task']
-                    start_day = data['start'].Value()
-                    end_day = data['end'].Value()
-
-                    # Convert to dates
-                    base_date = min(task.planned_start_date for task in tasks)
-                    optimized_start = base_date + timedelta(days=start_day)
-                    optimized_end = base_date + timedelta(days=end_day)
-
                     optimized_schedule.append({
-                        'task_id': UUID(task_id),
+                        'task_id': task.id,
                         'task_name': task.name,
                         'original_start': task.planned_start_date,
                         'original_end': task.planned_end_date,
@@ -426,17 +578,15 @@ class AdvancedSchedulingService:
                     })
 
                 # Calculate resource utilization
-                resource_utilization = await self._calculate_resource_utilization(
+                resource_utilization = self._calculate_resource_utilization(
                     task_intervals, resource_constraints
                 )
 
-            self.solver.EndSearch()
-
             return ResourceLevelingResult(
                 optimized_schedule=optimized_schedule,
                 resource_utilization=resource_utilization,
                 total_delays=sum(s['delay_days'] for s in optimized_schedule),
-                optimization_score=await self._calculate_optimization_score(optimized_schedule)
+                optimization_score=self._calculate_optimization_score(optimized_schedule)
             )
 
         except Exception as e:
@@ -448,55 +598,73 @@ class AdvancedSchedulingService:
                 optimization_score=0.0
             )
 
-    async def _get_task_predecessors(self, task_id: UUID, db_session) -> List[UUID]:
-        """Get predecessor task IDs for a task."""
-        if not db_session:
-            return []
+    async def _get_predecessor_map(self, task_ids: List[str], db_session) -> Dict[str, List[str]]:
+        """Get predecessor task IDs for every task in one query, keyed by successor ID."""
+        if not db_session or not task_ids:
+            return {}
 
         try:
             from sqlalchemy import select
             result = await db_session.execute(
-                select(TaskDependency.predecessor_id).where(
-                    TaskDependency.successor_id == task_id
+                select(TaskDependency.predecessor_id, TaskDependency.successor_id).where(
+                    TaskDependency.successor_id.in_(task_ids)
                 )
             )
-            return [row[0] for row in result.all()]
+            pred_map = {}
+            for pred_id, succ_id in result.all():
+                pred_map.setdefault(succ_id, []).append(pred_id)
+            return pred_map
         except Exception:
-            return []
+            return {}
 
-    async def _calculate_resource_utilization(
+    def _calculate_resource_utilization(
         self,
         task_intervals: Dict,
         resource_constraints: Dict[str, int]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Calculate resource utilization over time."""
-        utilization = {}
-
-        for resource_type in resource_constraints.keys():
-            utilization[resource_type] = []
-
-            # Sample utilization at different time points
-            for day in range(0, 365, 7):  # Weekly samples
-                daily_usage = 0
-
-                for task_data in task_intervals.values():
-                    if resource_type in task_data['resources']:
-                        start_day = task_data['start'].Value()
-                        end_day = task_data['end'].Value()
-
-                        if start_day <= day <= end_day:
-                            daily_usage += task_data['resources'][resource_type]
+        resource_types = list(resource_constraints)
+        sample_days = list(range(0, 365, 7))  # Weekly samples
+
+        task_data = list(task_intervals.values())
+        starts = [self.solver.Value(data['start']) for data in task_data]
+        ends = [self.solver.Value(data['end']) for data in task_data]
+        demand = [
+            [data['resources'].get(resource_type, 0) for data in task_data]
+            for resource_type in resource_types
+        ]
+
+        if NUMPY_AVAILABLE:
+            # (days x tasks) activity mask, then one matmul for every resource
+            days = np.asarray(sample_days)
+            active = (np.asarray(starts)[None, :] <= days[:, None]) & (days[:, None] <= np.asarray(ends)[None, :])
+            demand_matrix = np.asarray(demand, dtype=np.int64).reshape(len(resource_types), len(task_data))
+            usage = (demand_matrix @ active.T.astype(np.int64)).tolist()
+        else:
+            usage = [
+                [
+                    sum(units for units, start_day, end_day in zip(row, starts, ends, strict=True) if start_day <= day <= end_day)
+                    for day in sample_days
+                ]
+                for row in demand
+            ]
 
-                utilization[resource_type].append({
+        utilization = {}
+        for resource_type, daily_usages in zip(resource_types, usage, strict=True):
+            capacity = resource_constraints[resource_type]
+            utilization[resource_type] = [
+                {
                     'day': day,
                     'usage': daily_usage,
-                    'capacity': resource_constraints[resource_type],
-                    'utilization_percent': (daily_usage / resource_constraints[resource_type]) * 100
-                })
+                    'capacity': capacity,
+                    'utilization_percent': (daily_usage / capacity) * 100
+                }
+                for day, daily_usage in zip(sample_days, daily_usages, strict=True)
+            ]
 
         return utilization
 
-    async def _calculate_optimization_score(self, optimized_schedule: List[Dict]) -> float:
+    def _calculate_optimization_score(self, optimized_schedule: List[Dict]) -> float:
         """Calculate optimization score (0-1, higher is better)."""
         if not optimized_schedule:
             return 0.0
@@ -538,80 +706,84 @@ class AdvancedSchedulingService:
             )
 
         try:
-            self._reset_solver()
+            model = cp_model.CpModel()
 
             # Create task intervals
-            task_intervals = {}
             task_vars = {}
 
-            for task in tasks:
-                task_id = str(task.id)
-                duration = max(1, (task.planned_end_date - task.planned_start_date).days)
+            base_today = date.today()
+            durations = [
+                max(1, (task.planned_end_date - task.planned_start_date).days)
+                for task in tasks
+            ]
+            # Back-to-back execution after the latest start_after date always fits
+            release = max(
+                (
+                    (constraint.parameters['date'] - base_today).days
+                    for constraint in constraints
+                    if constraint.constraint_type == "start_after"
+                    and isinstance(constraint.parameters.get('date'), date)
+                ),
+                default=0
+            )
+            horizon = max(0, release) + sum(durations)
+            max_end = horizon + max(durations, default=0)
+
+            # Keyed by str(task.id) so UUID constraint task ids can look tasks up directly
+            for i, task in enumerate(tasks):
+                duration = durations[i]
 
-                start_var = self.solver.IntVar(0, 365, f"start_{task_id}")
-                end_var = self.solver.IntVar(duration, 365 + duration, f"end_{task_id}")
+                start_var = model.NewIntVar(0, horizon, f"start_{i}")
+                end_var = model.NewIntVar(duration, horizon + duration, f"end_{i}")
 
-                interval = self.solver.FixedDurationIntervalVar(
-                    start_var, end_var, duration, False, f"interval_{task_id}"
+                interval = model.NewIntervalVar(
+                    start_var, duration, end_var, f"interval_{i}"
                 )
 
-                task_intervals[task_id] = interval
-                task_vars[task_id] = {
+                task_vars[str(task.id)] = {
                     'start': start_var,
                     'end': end_var,
+                    'interval': interval,
                     'task': task
                 }
 
             # Apply constraints
             for constraint in constraints:
-                await self._apply_constraint(constraint, task_vars, task_intervals)
+                self._apply_constraint(model, constraint, task_vars, base_today)
 
             # Set optimization objective
-            objective_var = None
-
             if optimization_goal == "minimize_duration":
                 # Minimize project completion time
-                project_end = self.solver.Max([var['end'] for var in task_vars.values()])
-                objective_var = project_end
-                self.solver.Minimize(project_end, 1)
-
-            elif optimization_goal == "minimize_cost":
-                # Minimize total cost (simplified)
-                total_cost = self.solver.Sum([
-                    var['task'].budgeted_cost or 0
-                    for var in task_vars.values()
-                ])
-                objective_var = total_cost
-                self.solver.Minimize(total_cost, 1)
-
-            # Solve optimization problem
-            db = self.solver.Phase(
-                [var['start'] for var in task_vars.values()],
-                self.solver.CHOOSE_FIRST_UNBOUND,
-                self.solver.ASSIGN_MIN_VALUE
-            )
+                ends = [var['end'] for var in task_vars.values()]
+                makespan = model.NewIntVar(0, max_end, "makespan")
+                model.AddMaxEquality(makespan, ends)
+                model.Minimize(makespan)
 
-            self.solver.NewSearch(db)
+            else:
+                # Budgeted cost does not depend on the dates chosen, so cost (and any
+                # other goal) is reported on the earliest feasible starts
+                model.Minimize(sum(var['start'] for var in task_vars.values()))
 
             optimized_tasks = []
             objective_value = 0
 
-            if self.solver.NextSolution():
-                objective_value = objective_var.Value() if objective_var else 0
+            if self._solve(model):
+                if optimization_goal == "minimize_duration":
+                    objective_value = self.solver.ObjectiveValue()
+                elif optimization_goal == "minimize_cost":
+                    objective_value = float(sum(task.budgeted_cost or 0 for task in tasks))
 
                 # Extract optimized schedule
                 base_date = min(task.planned_start_date for task in tasks)
 
-                for task_id, vars in task_vars.items():
-                    task = vars['task']
-                    start_day = vars['start'].Value()
-                    end_day = vars['end'].Value()
-
-                    optimized_start = base_date + timedelta(days=start_day)
-                    optimized_end = base_date + timedelta(days=end_day)
+                handles = list(task_vars.values())
+                starts = _offset_dates(base_date, [self.solver.Value(var['start']) for var in handles])
+                ends = _offset_dates(base_date, [self.solver.Value(var['end']) for var in handles])
 
+                for var, optimized_start, optimized_end in zip(handles, starts, ends, strict=True):
+                    task = var['task']
                     optimized_tasks.append({
-                        'task_id': UUID(task_id),
+                        'task_id': task.id,
                         'task_name': task.name,
                         'original_start': task.planned_start_date,
                         'original_end': task.planned_end_date,
@@ -623,8 +795,6 @@ class AdvancedSchedulingService:
                         }
                     })
 
-            self.solver.EndSearch()
-
             return SchedulingOptimizationResult(
                 optimized_tasks=optimized_tasks,
                 objective_value=objective_value,
@@ -643,56 +813,26 @@ class AdvancedSchedulingService:
                 solution_found=False
             )
 
-    async def _apply_constraint(
+    def _apply_constraint(
         self,
+        model,
         constraint: TaskConstraint,
         task_vars: Dict,
-        task_intervals: Dict
+        today: date
     ):
-        """Apply a scheduling constraint to the OR-Tools model."""
-        try:
-            if constraint.constraint_type == "start_after":
-                # Task must start after a specific date
-                if constraint.task_id and str(constraint.task_id) in task_vars:
-                    target_date = constraint.parameters.get('date')
-                    if target_date:
-                        days_from_base = (target_date - date.today()).days
-                        self.solver.Add(task_vars[str(constraint.task_id)]['start'] >= days_from_base)
-
-            elif constraint.constraint_type == "finish_before":
-                # Task must finish before a specific date
-                if constraint.task_id and str(constraint.task_id) in task_vars:
-                    target_date = constraint.parameters.get('date')
-                    if target_date:
-                        days_from_base = (target_date - date.today()).days
-                        self.solver.Add(task_vars[str(constraint.task_id)]['end'] <= days_from_base)
-
-            elif constraint.constraint_type == "max_duration":
-                # Task duration cannot exceed maximum
-                if constraint.task_id and str(constraint.task_id) in task_vars:
-                    max_duration = constraint.parameters.get('max_days', 30)
-                    start = task_vars[str(constraint.task_id)]['start']
-                    end = task_vars[str(constraint.task_id)]['end']
-                    self.solver.Add(end - start <= max_duration)
-
-            elif constraint.constraint_type == "resource_limit":
-                # Resource usage constraint
-                resource_type = constraint.parameters.get('resource_type')
-                max_usage = constraint.parameters.get('max_units', 1)
-
-                if resource_type:
-                    # Find tasks using this resource
-                    resource_intervals = []
-                    demands = []
-
-                    for task_id, task_data in task_vars.items():
-                        task_resources = getattr(task_data['task'], 'required_resources', {})
-                        if resource_type in task_resources:
-                            resource_intervals.append(task_intervals[task_id])
-                            demands.append(task_resources[resource_type])
-
-                    if resource_intervals:
-                        self.solver.AddCumulative(resource_intervals, demands, max_usage)
+        """Apply a scheduling constraint to the CP-SAT model."""
+        apply = _CONSTRAINT_APPLIERS.get(constraint.constraint_type)
+        if apply is None:
+            return
 
+        if constraint.constraint_type in _PROJECT_WIDE_CONSTRAINTS:
+            handles = task_vars
+        else:
+            handles = task_vars.get(str(constraint.task_id))
+            if handles is None:
+                return
+
+        try:
+            apply(model, handles, constraint.parameters, today)
         except Exception as e:
             logger.warning("Failed to apply constraint", constraint=constraint.constraint_type, error=str(e))
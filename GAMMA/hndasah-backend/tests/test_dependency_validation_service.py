@@ -0,0 +1,47 @@
+"""Tests for dependency graph validation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from hndasah_backend.services.dependency_validation_service import DependencyValidationService
+
+
+def _graph(edges, extra_tasks=()):
+    """Task and dependency stand-ins for (predecessor, successor) id pairs."""
+    task_ids = dict.fromkeys([node for edge in edges for node in edge] + list(extra_tasks))
+    tasks = [SimpleNamespace(id=task_id) for task_id in task_ids]
+    dependencies = [SimpleNamespace(predecessor_id=pred, successor_id=succ) for pred, succ in edges]
+    return tasks, dependencies
+
+
+@pytest.fixture
+def service():
+    return DependencyValidationService()
+
+
+def test_detect_cycles_on_dag(service):
+    tasks, dependencies = _graph([("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")])
+
+    assert service._detect_cycles(tasks, dependencies) == []
+
+
+def test_detect_cycles_reports_cycle_path(service):
+    tasks, dependencies = _graph([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+
+    assert service._detect_cycles(tasks, dependencies) == [["a", "b", "c", "a"]]
+
+
+def test_detect_cycles_reports_self_dependency(service):
+    tasks, dependencies = _graph([("a", "a")], extra_tasks=["b"])
+
+    assert service._detect_cycles(tasks, dependencies) == [["a", "a"]]
+
+
+def test_detect_cycles_one_per_component(service):
+    tasks, dependencies = _graph([("a", "b"), ("b", "a"), ("x", "y"), ("y", "z"), ("z", "x")])
+
+    cycles = service._detect_cycles(tasks, dependencies)
+
+    assert cycles == [["a", "b", "a"], ["x", "y", "z", "x"]]
+    assert service._detect_cycles(tasks, dependencies, first_only=True) == cycles[:1]
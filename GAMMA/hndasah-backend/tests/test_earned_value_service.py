@@ -0,0 +1,135 @@
+"""Tests for Earned Value Management calculations."""
+
+import importlib.util
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from hndasah_backend.services import earned_value_service
+from hndasah_backend.services.earned_value_service import NUMPY_AVAILABLE, EarnedValueService
+
+requires_numpy = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")
+requires_numba = pytest.mark.skipif(importlib.util.find_spec("numba") is None, reason="Numba not installed")
+
+# A ten-day schedule; the middle date puts half of the budget in planned value
+START = date(2026, 1, 1)
+END = date(2026, 1, 11)
+MIDWAY = date(2026, 1, 6)
+
+# EarnedValueMetrics fields in kernel order
+METRIC_FIELDS = (
+    "planned_value", "earned_value", "actual_cost", "schedule_variance", "cost_variance",
+    "schedule_performance_index", "cost_performance_index", "estimate_at_completion",
+    "estimate_to_complete", "variance_at_completion", "to_complete_performance_index",
+    "percent_complete",
+)
+
+
+def _task(budget, progress, actual):
+    return SimpleNamespace(budgeted_cost=budget, progress_percentage=progress, actual_cost=actual)
+
+
+def _in_progress_tasks():
+    """EV = (400 * 100 + 600 * 50) / 100 = 700, AC = 875; the NULL task counts as zero."""
+    return [
+        _task(Decimal("400"), 100, Decimal("500")),
+        _task(Decimal("600"), 50, Decimal("375")),
+        _task(None, None, None),
+    ]
+
+
+def _metrics(result):
+    return tuple(getattr(result, field) for field in METRIC_FIELDS)
+
+
+@pytest.fixture(params=["pure_python", pytest.param("numpy", marks=requires_numpy),
+                        pytest.param("numba", marks=[requires_numpy, requires_numba])])
+def service(request, monkeypatch):
+    """The service on each EVM path: no NumPy, the NumPy-only kernel, and the Numba kernel."""
+    if request.param == "pure_python":
+        monkeypatch.setattr(earned_value_service, "NUMPY_AVAILABLE", False)
+    elif request.param == "numpy":
+        monkeypatch.setattr(earned_value_service, "_get_kernel", lambda: earned_value_service._evm_core_py)
+        monkeypatch.setattr(
+            earned_value_service, "_get_portfolio_kernel", lambda: earned_value_service._portfolio_core_py
+        )
+    return EarnedValueService()
+
+
+@pytest.mark.parametrize("budget, tasks, today, expected", [
+    # PV = 1000 * 5 / 10; CPI = 700 / 875 = 0.8; EAC = 875 + 300 / 0.8; TCPI = 125 / 550
+    ("1000", _in_progress_tasks(), MIDWAY,
+     ("500", "700", "875", "200", "-175", "1.4", "0.8", "1250", "375", "-250", "0.2273", "70")),
+    # Past the planned end PV is capped at BAC
+    ("1000", _in_progress_tasks(), date(2026, 2, 1),
+     ("1000", "700", "875", "-300", "-175", "0.7", "0.8", "1250", "375", "-250", "0.2273", "70")),
+    # Zero BAC: no PV or percent complete; EV beyond BAC makes EAC the actual cost
+    ("0", [_task(Decimal("100"), 50, Decimal("80"))], MIDWAY,
+     ("0", "50", "80", "50", "-30", "0", "0.625", "80", "0", "-80", "-2.6667", "0")),
+    # Zero AC: CPI is 0, so EAC falls back to BAC
+    ("1000", [_task(Decimal("1000"), 20, Decimal("0"))], MIDWAY,
+     ("500", "200", "0", "-300", "200", "0.4", "0", "1000", "1000", "0", "1.25", "20")),
+    # Not started: before the start date nothing is planned, earned or spent
+    ("1000", [_task(Decimal("500"), 0, Decimal("0")), _task(Decimal("500"), 0, Decimal("0"))], date(2025, 12, 20),
+     ("0", "0", "0", "0", "0", "0", "0", "1000", "1000", "0", "1", "0")),
+    # No tasks at all
+    ("1000", [], MIDWAY,
+     ("500", "0", "0", "-500", "0", "0", "0", "1000", "1000", "0", "1", "0")),
+], ids=["in_progress", "past_end", "zero_bac", "zero_ac", "not_started", "no_tasks"])
+def test_project_evm_matches_hand_computed_values(service, budget, tasks, today, expected):
+    project_id = uuid4()
+
+    result = service.calculate_project_evm_sync(project_id, tasks, Decimal(budget), START, END, today)
+
+    assert result.project_id == project_id
+    assert result.budget_at_completion == Decimal(budget)
+    assert _metrics(result) == tuple(Decimal(value) for value in expected)
+
+
+def test_portfolio_rows_match_single_project_evm(service):
+    projects = [
+        (uuid4(), _in_progress_tasks(), Decimal("1000"), START, END),
+        (uuid4(), [], Decimal("750"), START, END),
+        (uuid4(), [_task(Decimal("100"), 50, Decimal("80"))], Decimal("0"), START, END),
+        (uuid4(), [_task(Decimal(25 * n), 10 * n, Decimal(20 * n)) for n in range(1, 11)],
+         Decimal("2000"), date(2025, 12, 1), date(2026, 3, 1)),
+        (uuid4(), [_task(Decimal("500"), 0, Decimal("0"))] * 2, Decimal("1000"), date(2026, 2, 1), date(2026, 4, 1)),
+    ]
+
+    rows = service.calculate_portfolio_evm_sync(projects, MIDWAY)
+
+    assert [row.project_id for row in rows] == [project_id for project_id, *_ in projects]
+    for row, project in zip(rows, projects, strict=True):
+        single = service.calculate_project_evm_sync(*project, MIDWAY)
+        assert row.budget_at_completion == single.budget_at_completion
+        assert _metrics(row) == _metrics(single)
+
+
+@requires_numpy
+@requires_numba
+def test_kernel_compiles_before_first_call():
+    kernel = earned_value_service._get_kernel()
+
+    assert kernel is not earned_value_service._evm_core_py
+    assert kernel.signatures
+
+
+@requires_numpy
+def test_kernel_falls_back_to_python_when_compilation_fails(monkeypatch):
+    def failing_njit(*args, **kwargs):
+        raise RuntimeError("LLVM unavailable")
+
+    monkeypatch.setattr(earned_value_service, "_load_numba", lambda: SimpleNamespace(njit=failing_njit))
+    earned_value_service._get_kernel.cache_clear()
+    try:
+        result = EarnedValueService().calculate_project_evm_sync(
+            uuid4(), _in_progress_tasks(), Decimal("1000"), START, END, MIDWAY
+        )
+        assert earned_value_service._get_kernel() is earned_value_service._evm_core_py
+    finally:
+        earned_value_service._get_kernel.cache_clear()
+
+    assert (result.earned_value, result.cost_performance_index) == (Decimal("700"), Decimal("0.8"))
@@ -0,0 +1,311 @@
+"""Tests for task import/export parsing and serialization."""
+
+import asyncio
+import json
+import sqlite3
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from hndasah_backend.models.sqlalchemy.task import Task, TaskDependency
+from hndasah_backend.schemas.task import (
+    ImportExportRequest,
+    JsonProjectStructure,
+    JsonTaskStructure,
+)
+from hndasah_backend.services.import_export_service import (
+    IMPORT_BATCH_SIZE,
+    ImportExportService,
+    _parse_date,
+)
+
+# The import tests run against in-memory SQLite, which stores the Postgres-only
+# ARRAY and JSONB columns as JSON text
+sqlite3.register_adapter(list, json.dumps)
+
+
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _compile_json_column(type_, compiler, **kw):
+    return "JSON"
+
+
+class _AsyncSession:
+    """Async facade over a sync SQLite session, covering the calls the import path awaits."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement, params=None):
+        return self.session.execute(statement, params)
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        with self.session.begin_nested():
+            yield
+
+    async def commit(self):
+        self.session.commit()
+
+
+@pytest.fixture
+def service(tmp_path):
+    return ImportExportService(data_dir=str(tmp_path))
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite://", connect_args={"isolation_level": None})
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        # Emit BEGIN ourselves so pysqlite leaves SAVEPOINTs to SQLAlchemy
+        connection.exec_driver_sql("BEGIN")
+
+    Task.metadata.create_all(engine, tables=[Task.__table__, TaskDependency.__table__])
+    with Session(engine) as session:
+        yield _AsyncSession(session)
+    engine.dispose()
+
+
+def _task(parent_task_id=None, **fields):
+    """Build an exported task row stand-in with the EXPORT_TASK_COLUMNS attributes."""
+    values = dict(
+        id=str(uuid4()), name="Task", description=None, task_code=None, status="not_started",
+        progress_percentage=0, planned_start_date=date(2026, 1, 5), planned_end_date=date(2026, 1, 9),
+        actual_start_date=None, actual_end_date=None, planned_duration_days=4, actual_duration_days=None,
+        estimated_hours=None, actual_hours=None, budgeted_cost=Decimal("100.50"), actual_cost=Decimal("0"),
+        assigned_to=None, parent_task_id=parent_task_id, predecessor_tasks=None, successor_tasks=None,
+        lag_days=0, tags=None, custom_fields=None
+    )
+    values.update(fields)
+    return SimpleNamespace(**values)
+
+
+def _project():
+    return SimpleNamespace(
+        id=str(uuid4()), name="Tower", description="Phase 1", status=None, updated_at=None,
+        start_date=date(2026, 1, 1), end_date=None, budget=Decimal("2500")
+    )
+
+
+def _export_json(service, tasks, **options):
+    request = ImportExportRequest(format="json", **options)
+    result = asyncio.run(service.export_tasks_json(tasks, _project(), request))
+    return json.loads(Path(result.file_path).read_bytes())
+
+
+def _parse_errors(result):
+    return [error for error in result.errors if error["field"] == "parsing"]
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-01-05", date(2026, 1, 5)),
+    ("2026-01-05T10:30:00", None),
+    ("05/01/2026", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_date_accepts_iso_dates_only(value, expected):
+    assert _parse_date(value) == expected
+
+
+def test_csv_row_coercion(service):
+    row = {
+        "id": "t-1",
+        "name": "",
+        "status": "",
+        "progress_percentage": "40",
+        "planned_duration_days": "",
+        "budgeted_cost": "12.5",
+        "tags": "a,b",
+    }
+
+    task = service._csv_row_to_task_structure(row, 7)
+
+    assert task.name == "Imported Task 7"
+    assert task.status == "not_started"
+    assert task.progress_percentage == 40
+    assert task.planned_duration_days is None
+    assert task.budgeted_cost == 12.5
+    assert task.tags == ["a", "b"]
+
+
+def test_csv_import_rejects_fractional_progress(service):
+    content = "name,progress_percentage\nFirst,50\nSecond,50.5\n"
+
+    result = asyncio.run(service.import_csv_tasks(content, "project", "user"))
+
+    assert result.total_records == 2
+    assert [error["row"] for error in _parse_errors(result)] == [3]
+
+
+def test_csv_import_reports_ragged_rows_per_row(service):
+    content = "name,progress_percentage,budgeted_cost\nFull,10,5\nShort,10\nLong,10,5,extra\n"
+
+    result = asyncio.run(service.import_csv_tasks(content, "project", "user"))
+
+    # A short row leaves budgeted_cost unset and fails on its own; extra cells are ignored
+    assert result.total_records == 3
+    assert [error["row"] for error in _parse_errors(result)] == [3]
+
+
+def test_excel_import_stops_at_first_bad_row(service):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Tasks"
+    sheet.append(["Name", "Progress %"])
+    sheet.append(["First", 10])
+    sheet.append(["Second", "bad"])
+    sheet.append(["Third", 30])
+    buffer = BytesIO()
+    workbook.save(buffer)
+
+    result = asyncio.run(service.import_excel_tasks(buffer.getvalue(), "project", "user"))
+
+    assert result.total_records == 3
+    assert result.failed_imports == 1
+    assert [error["row"] for error in result.errors] == [3]
+
+
+@pytest.mark.parametrize("include_subtasks", [True, False])
+def test_json_export_emits_every_task_structure_key(service, include_subtasks):
+    data = _export_json(service, [_task()], include_subtasks=include_subtasks)
+
+    assert set(data["tasks"][0]) == set(JsonTaskStructure.model_fields)
+    assert data["tasks"][0]["priority"] is None
+    assert data["tasks"][0]["planned_start_date"] == "2026-01-05"
+    assert data["tasks"][0]["budgeted_cost"] == 100.5
+
+
+def test_json_export_header_matches_project_structure(service):
+    project = _project()
+    request = ImportExportRequest(format="json")
+    result = asyncio.run(service.export_tasks_json([], project, request))
+    data = json.loads(Path(result.file_path).read_bytes())
+
+    expected = JsonProjectStructure(
+        id=project.id, name="Tower", description="Phase 1", status="active",
+        start_date="2026-01-01", budget=2500.0
+    ).model_dump()
+    assert data == expected
+
+
+def test_json_export_nests_subtasks(service):
+    parent = _task(name="Parent")
+    child = _task(name="Child", parent_task_id=parent.id)
+
+    data = _export_json(service, [parent, child])
+
+    assert [task["name"] for task in data["tasks"]] == ["Parent"]
+    assert [task["name"] for task in data["tasks"][0]["subtasks"]] == ["Child"]
+    assert data["tasks"][0]["subtasks"][0]["subtasks"] == []
+
+
+def _import(service, db_session, tasks):
+    return asyncio.run(service.import_json_tasks(json.dumps(tasks), "project", "user", db_session))
+
+
+def _existing_task(db_session, **fields):
+    row = dict(id=str(uuid4()), project_id="project", status="not_started", **fields)
+    db_session.session.execute(Task.__table__.insert(), [row])
+    return row["id"]
+
+
+def _stored_tasks(db_session):
+    rows = db_session.session.execute(
+        text("SELECT id, name, parent_task_id, level, wbs_code, predecessor_tasks FROM tasks")
+    )
+    return {row.name: row for row in rows}
+
+
+def _linked_tasks():
+    """A with subtask C, and B after A; C names B, which follows it in the import, as predecessor."""
+    return [
+        {"id": "a", "name": "A", "subtasks": [{"id": "c", "name": "C", "predecessor_tasks": ["b"]}]},
+        {"id": "b", "name": "B", "predecessor_tasks": ["a"], "lag_days": 2},
+    ]
+
+
+def test_import_remaps_parent_and_predecessor_ids(service, db_session):
+    result = _import(service, db_session, _linked_tasks())
+
+    assert result.successful_imports == 3
+    assert result.errors == []
+    stored = _stored_tasks(db_session)
+    assert sorted(task.id for task in stored.values()) == sorted(result.created_ids)
+    assert not {"a", "b", "c"} & set(result.created_ids)
+    assert stored["C"].parent_task_id == stored["A"].id
+    assert json.loads(stored["B"].predecessor_tasks) == [stored["A"].id]
+    assert json.loads(stored["C"].predecessor_tasks) == [stored["B"].id]
+
+
+def test_import_dependency_rows_take_column_defaults(service, db_session):
+    _import(service, db_session, _linked_tasks())
+
+    stored = _stored_tasks(db_session)
+    dependencies = db_session.session.execute(
+        text("SELECT predecessor_id, successor_id, lag_days, dependency_type FROM task_dependencies")
+    )
+    assert sorted(tuple(row) for row in dependencies) == sorted([
+        (stored["A"].id, stored["B"].id, 2, "finish_to_start"),
+        (stored["B"].id, stored["C"].id, 0, "finish_to_start"),
+    ])
+
+
+def test_import_assigns_levels_and_wbs_codes(service, db_session):
+    parent_id = _existing_task(db_session, name="Existing", level=1, wbs_code="1")
+    _existing_task(db_session, name="Existing child", parent_task_id=parent_id, level=2, wbs_code="1.1")
+    tasks = [
+        {"name": "Root", "subtasks": [{"name": "Root child", "subtasks": [{"name": "Root grandchild"}]}]},
+        {"name": "Attached", "parent_task_id": parent_id, "subtasks": [{"name": "Attached child"}]},
+        {"name": "Second root"},
+    ]
+
+    result = _import(service, db_session, tasks)
+
+    assert result.successful_imports == 6
+    stored = _stored_tasks(db_session)
+    assert stored["Attached"].parent_task_id == parent_id
+    assert {name: (task.level, task.wbs_code) for name, task in stored.items()} == {
+        "Existing": (1, "1"),
+        "Existing child": (2, "1.1"),
+        "Root": (1, "2"),
+        "Root child": (2, "2.1"),
+        "Root grandchild": (3, "2.1.1"),
+        "Attached": (2, "1.2"),
+        "Attached child": (3, "1.2.1"),
+        "Second root": (1, "3"),
+    }
+
+
+def test_import_retries_failed_batch_row_by_row(service, db_session):
+    total = IMPORT_BATCH_SIZE + 5
+    bad_row = 700
+    # An unknown status passes the import schema but fails the table's CHECK constraint
+    tasks = [
+        {"name": f"Task {row}", "status": "on_fire" if row == bad_row else "not_started"}
+        for row in range(1, total + 1)
+    ]
+
+    result = _import(service, db_session, tasks)
+
+    assert result.total_records == total
+    assert result.successful_imports == total - 1
+    assert [error["row"] for error in result.errors] == [bad_row]
+    assert f"Task {bad_row}" in result.errors[0]["error"]
+    stored = _stored_tasks(db_session)
+    assert len(stored) == total - 1
+    assert f"Task {bad_row}" not in stored
@@ -0,0 +1,82 @@
+"""Tests for ReportLab PDF report generation."""
+
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from hndasah_backend.schemas.task import EarnedValueMetrics, EVMAnalysis, ReportRequest
+from hndasah_backend.services.reporting_service import ReportingService
+
+
+def _task(name, status, progress, budget, actual, critical=False):
+    return SimpleNamespace(
+        name=name, status=status, progress_percentage=progress,
+        budgeted_cost=Decimal(budget), actual_cost=Decimal(actual),
+        planned_start_date=date(2026, 1, 5), planned_end_date=date(2026, 2, 5),
+        is_critical_path=critical, planned_duration_days=31
+    )
+
+
+@pytest.fixture
+def project():
+    return SimpleNamespace(
+        id=uuid4(), name="Tower", description="Phase 1", status="active", updated_at=None,
+        start_date=date(2026, 1, 1), end_date=None, budget=Decimal("25000")
+    )
+
+
+@pytest.fixture
+def tasks():
+    return [
+        _task("Foundations", "completed", 100, "8000", "8200", critical=True),
+        _task("Framing", "in_progress", 40, "12000", "4000", critical=True),
+        _task("Roofing", "not_started", 0, "5000", "0"),
+    ]
+
+
+@pytest.fixture
+def service(tmp_path):
+    return ReportingService(reports_dir=str(tmp_path))
+
+
+def _assert_pdf(result):
+    content = Path(result.file_path).read_bytes()
+    assert content.startswith(b"%PDF")
+    assert result.file_size_bytes == len(content)
+
+
+def test_task_and_project_reports_render(service, project, tasks):
+    request = ReportRequest(report_type="task")
+
+    _assert_pdf(asyncio.run(service.generate_task_report(tasks, project, request)))
+    _assert_pdf(asyncio.run(service.generate_project_report(project, tasks, report_request=request)))
+
+
+def test_evm_report_renders(service, project, tasks):
+    now = datetime(2026, 2, 1)
+    metrics = EarnedValueMetrics(
+        project_id=project.id, planned_value=Decimal("15000"), earned_value=Decimal("12800"),
+        actual_cost=Decimal("12200"), budget_at_completion=Decimal("25000"),
+        schedule_variance=Decimal("-2200"), cost_variance=Decimal("600"),
+        schedule_performance_index=Decimal("0.853"), cost_performance_index=Decimal("1.049"),
+        estimate_at_completion=Decimal("23830"), estimate_to_complete=Decimal("11630"),
+        variance_at_completion=Decimal("1170"), to_complete_performance_index=Decimal("0.95"),
+        percent_complete=Decimal("51.2"), calculated_at=now
+    )
+    analysis = EVMAnalysis(
+        schedule_status="behind_schedule", cost_status="under_budget",
+        recommendations=["Add a second framing crew"], analysis_date=now
+    )
+
+    result = asyncio.run(service.generate_evm_report(
+        metrics, analysis, project, tasks, ReportRequest(report_type="evm")
+    ))
+
+    _assert_pdf(result)
@@ -0,0 +1,227 @@
+"""Tests for the OR-Tools backed scheduling service."""
+
+import asyncio
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from hndasah_backend.schemas.task import TaskConstraint
+from hndasah_backend.services.scheduling_service import (
+    NUMBA_AVAILABLE,
+    ORTOOLS_AVAILABLE,
+    AdvancedSchedulingService,
+)
+
+requires_ortools = pytest.mark.skipif(not ORTOOLS_AVAILABLE, reason="OR-Tools not installed")
+requires_numba = pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba not installed")
+
+
+def _task(start: date, days: int, **fields):
+    """Build a task stand-in with a string id, as stored by the ORM."""
+    return SimpleNamespace(
+        id=str(uuid4()),
+        name=fields.pop("name", "Task"),
+        planned_start_date=start,
+        planned_end_date=start + timedelta(days=days),
+        budgeted_cost=fields.pop("budgeted_cost", None),
+        **fields,
+    )
+
+
+def _dependency(predecessor, successor, lag_days=0):
+    return SimpleNamespace(predecessor_id=predecessor.id, successor_id=successor.id, lag_days=lag_days)
+
+
+def _diamond():
+    """A(3) -> B(2) and A -> C(5, lag 1), both feeding D(1); B has 4 days of slack."""
+    start = date(2026, 3, 2)
+    a, b, c, d = (_task(start, days, name=name) for name, days in (("A", 3), ("B", 2), ("C", 5), ("D", 1)))
+    dependencies = [_dependency(a, b), _dependency(a, c, lag_days=1), _dependency(b, d), _dependency(c, d)]
+    return start, [a, b, c, d], dependencies
+
+
+def _random_dag(rng, size):
+    """Predecessor/successor lists of (index, lag) for a random DAG over range(size)."""
+    predecessors = [[] for _ in range(size)]
+    successors = [[] for _ in range(size)]
+    for succ in range(1, size):
+        for pred in rng.sample(range(succ), k=min(succ, rng.randint(0, 3))):
+            lag = rng.randint(0, 2)
+            predecessors[succ].append((pred, lag))
+            successors[pred].append((succ, lag))
+    durations = [rng.randint(1, 10) for _ in range(size)]
+    return predecessors, successors, durations
+
+
+def test_cpm_pass_diamond():
+    predecessors = [[], [(0, 0)], [(0, 1)], [(1, 0), (2, 0)]]
+    successors = [[(1, 0), (2, 1)], [(3, 0)], [(3, 0)], []]
+
+    schedule = AdvancedSchedulingService()._cpm_pass(predecessors, successors, [3, 2, 5, 1])
+
+    assert schedule == ([0, 3, 4, 9], [3, 5, 9, 10], [0, 7, 4, 9], [3, 9, 9, 10])
+
+
+def test_cpm_pass_rejects_cycles():
+    with pytest.raises(ValueError):
+        AdvancedSchedulingService()._cpm_pass([[(1, 0)], [(0, 0)]], [[(1, 0)], [(0, 0)]], [1, 1])
+
+
+@requires_numba
+def test_cpm_pass_compiled_matches_python():
+    service = AdvancedSchedulingService()
+    rng = random.Random(7)
+
+    for size in (1, 2, 25, 200):
+        predecessors, successors, durations = _random_dag(rng, size)
+        expected = service._cpm_pass(predecessors, successors, durations)
+        assert tuple(service._cpm_pass_compiled(predecessors, durations)) == expected
+
+
+@requires_numba
+def test_cpm_pass_compiled_rejects_cycles():
+    with pytest.raises(ValueError):
+        AdvancedSchedulingService()._cpm_pass_compiled([[(2, 0)], [(0, 0)], [(1, 0)]], [1, 1, 1])
+
+
+def test_critical_path_schedule():
+    start, tasks, dependencies = _diamond()
+    a, b, c, d = tasks
+
+    result = asyncio.run(AdvancedSchedulingService().calculate_critical_path_ortools(tasks, dependencies))
+
+    schedules = {str(schedule.task_id): schedule for schedule in result.task_schedules}
+    assert result.total_duration == 10
+    assert [str(task_id) for task_id in result.critical_path] == [a.id, c.id, d.id]
+    assert max(schedule.earliest_finish for schedule in schedules.values()) == start + timedelta(days=10)
+    assert schedules[b.id].slack == 4
+    assert schedules[b.id].latest_start == start + timedelta(days=7)
+    assert schedules[b.id].latest_finish == start + timedelta(days=9)
+    assert schedules[a.id].latest_finish == start + timedelta(days=3)
+
+
+def test_resource_leveling_skips_level_plans():
+    service = AdvancedSchedulingService()
+    today = date.today()
+    tasks = [_task(today, 3), _task(today, 2)]
+    cases = [
+        (tasks[:1], {"crane": 1}),
+        (tasks, {"crane": 1}),
+        ([_task(today, 3, required_resources={"crane": 1}) for _ in range(2)], {"crane": 0}),
+    ]
+
+    for case_tasks, capacity in cases:
+        result = asyncio.run(service.optimize_resource_leveling(case_tasks, capacity))
+
+        assert [entry["optimized_start"] for entry in result.optimized_schedule] == [today] * len(case_tasks)
+        assert result.total_delays == 0
+        assert result.optimization_score == 1.0
+
+
+@requires_ortools
+def test_resource_leveling_serialises_competing_tasks():
+    today = date.today()
+    tasks = [_task(today, 3, required_resources={"crane": 1}) for _ in range(2)]
+
+    result = asyncio.run(AdvancedSchedulingService().optimize_resource_leveling(tasks, {"crane": 1}))
+
+    starts = sorted(entry["optimized_start"] for entry in result.optimized_schedule)
+    assert starts == [today, today + timedelta(days=3)]
+    assert result.total_delays == 3
+
+
+def _optimize(tasks, constraints, goal="minimize_duration"):
+    service = AdvancedSchedulingService()
+    return asyncio.run(service.optimize_schedule_with_constraints(tasks, constraints, goal))
+
+
+def _by_id(result):
+    return {entry["task_id"]: entry for entry in result.optimized_tasks}
+
+
+@requires_ortools
+def test_start_after_constraint_matches_string_task_id():
+    today = date.today()
+    first = _task(today, 3)
+    second = _task(today, 2)
+    release = today + timedelta(days=10)
+
+    result = _optimize(
+        [first, second],
+        [TaskConstraint(constraint_type="start_after", task_id=second.id, parameters={"date": release})],
+    )
+
+    assert result.solution_found
+    scheduled = _by_id(result)
+    assert scheduled[second.id]["optimized_start"] - today >= timedelta(days=10)
+    assert result.objective_value == 12
+
+
+@requires_ortools
+def test_finish_before_constraint_matches_string_task_id():
+    today = date.today()
+    task = _task(today, 4)
+    deadline = today + timedelta(days=4)
+
+    result = _optimize(
+        [task],
+        [
+            TaskConstraint(
+                constraint_type="start_after",
+                task_id=task.id,
+                parameters={"date": today + timedelta(days=2)},
+            ),
+            TaskConstraint(constraint_type="finish_before", task_id=task.id, parameters={"date": deadline}),
+        ],
+    )
+
+    # The task cannot both start after day 2 and finish by day 4
+    assert not result.solution_found
+
+
+@requires_ortools
+def test_max_duration_constraint_matches_string_task_id():
+    today = date.today()
+    task = _task(today, 5)
+
+    result = _optimize(
+        [task],
+        [TaskConstraint(constraint_type="max_duration", task_id=task.id, parameters={"max_days": 2})],
+    )
+
+    # Durations are fixed, so a cap below the planned duration is infeasible
+    assert not result.solution_found
+
+
+@requires_ortools
+def test_constraint_for_unknown_task_is_ignored():
+    today = date.today()
+    task = _task(today, 2)
+
+    result = _optimize(
+        [task],
+        [
+            TaskConstraint(
+                constraint_type="start_after",
+                task_id=uuid4(),
+                parameters={"date": today + timedelta(days=5)},
+            )
+        ],
+    )
+
+    assert result.solution_found
+    assert _by_id(result)[task.id]["optimized_start"] == today
+
+
+@requires_ortools
+def test_minimize_cost_reports_budgeted_cost():
+    today = date.today()
+    tasks = [_task(today, 1, budgeted_cost=100), _task(today, 2, budgeted_cost=250)]
+
+    result = _optimize(tasks, [], goal="minimize_cost")
+
+    assert result.solution_found
+    assert result.objective_value == 350